@@ -0,0 +1,60 @@
+'''Compare two pysvn benchmark result files (see `run.py`).
+
+    python benchmarks/compare.py baseline.json results.json --threshold 0.1
+
+Prints the median time and peak memory of every (size, operation) present
+in both files, and exits with status 1 if any median got slower than the
+threshold allows.
+'''
+import argparse
+import json
+import sys
+from typing import Any, Dict, Tuple
+
+
+def _index(report: Dict[str, Any]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    return {(r['size'], r['operation']): r for r in report['results'] if 'error' not in r}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> bool:
+    """Print the comparison table; True if nothing regressed beyond `threshold`."""
+    old, new = _index(baseline), _index(current)
+    ok = True
+    print(f'{"size":<8} {"operation":<20} {"old ms":>10} {"new ms":>10} {"change":>8} '
+          f'{"old py MiB":>10} {"new py MiB":>10} {"old svn MiB":>11} {"new svn MiB":>11}')
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        old_s, new_s = before['seconds']['median'], after['seconds']['median']
+        change = (new_s - old_s) / old_s if old_s else 0.
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            ok = False
+        print(f'{key[0]:<8} {key[1]:<20} {old_s * 1000:10.1f} {new_s * 1000:10.1f} {change:+8.1%} '
+              f'{before["python_peak_bytes"] / 2 ** 20:10.1f} {after["python_peak_bytes"] / 2 ** 20:10.1f} '
+              f'{before["svn_max_rss_kb"] / 1024:11.1f} {after["svn_max_rss_kb"] / 1024:11.1f}{flag}')
+
+    for key in sorted(old.keys() ^ new.keys()):
+        print(f'{key[0]:<8} {key[1]:<20} only in {"baseline" if key in old else "current"}')
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare two pysvn benchmark result files.')
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=.1,
+                        help='relative slowdown of a median that counts as a regression (default: 0.1)')
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    if baseline.get('svn') != current.get('svn'):
+        print(f'note: svn {baseline.get("svn")} vs {current.get("svn")}', file=sys.stderr)
+    sys.exit(0 if compare(baseline, current, args.threshold) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+'''Synthetic repository generator for the pysvn benchmarks.
+
+Builds a local `file://` repository by streaming an svn dump (format 2)
+into `svnadmin load`, which is much faster than committing revision by
+revision, and checks out its trunk. The content is pseudo-random but
+seeded, so the same spec always gives the same repository.
+
+    python benchmarks/repogen.py /tmp/bench --revisions 500 --files 200
+'''
+import argparse
+from dataclasses import asdict, dataclass
+import os
+import random
+import subprocess
+import sys
+from typing import IO, Dict, Iterator, List, Tuple
+
+_DATE = '2022-04-26T10:00:00.000000Z'
+_WORDS = ('svn', 'commit', 'revision', 'branch', 'merge', 'trunk', 'update', 'log', 'diff', 'blame',
+          'working', 'copy', 'lock', 'property', 'conflict', 'pristine', 'checksum', 'repository')
+
+
+@dataclass
+class RepoSpec:
+    """Shape of a generated repository.
+
+    Revision 1 adds `files` files under `trunk/`; every later revision
+    either modifies `changes_per_revision` of them (one line replaced and
+    one appended) or, `branches` times spread over the history, copies
+    trunk to `branches/branch-N`.
+    """
+    revisions: int = 100
+    files: int = 50
+    changes_per_revision: int = 3
+    file_size: int = 2000
+    branches: int = 2
+    seed: int = 0
+
+
+SIZES: Dict[str, RepoSpec] = {
+    'small': RepoSpec(revisions=100, files=50, changes_per_revision=3, file_size=2000, branches=2),
+    'medium': RepoSpec(revisions=1000, files=500, changes_per_revision=5, file_size=4000, branches=5),
+    'large': RepoSpec(revisions=5000, files=2000, changes_per_revision=10, file_size=8000, branches=10),
+}
+
+
+def file_path(index: int) -> str:
+    """Path of a generated file inside trunk, 100 files per directory."""
+    return f'src/dir{index // 100:03d}/file{index:05d}.txt'
+
+
+def _line(rnd: random.Random) -> str:
+    return ' '.join(rnd.choice(_WORDS) for _ in range(rnd.randint(4, 12))) + '\n'
+
+
+def _text(rnd: random.Random, size: int) -> List[str]:
+    lines, total = [], 0
+    while total < size:
+        lines.append(_line(rnd))
+        total += len(lines[-1])
+    return lines
+
+
+def _props(props: Dict[str, str]) -> bytes:
+    block = b''
+    for key, value in props.items():
+        key_b, value_b = key.encode(), value.encode()
+        block += b'K %d\n%s\nV %d\n%s\n' % (len(key_b), key_b, len(value_b), value_b)
+    return block + b'PROPS-END\n'
+
+
+def _revision_record(revision: int, message: str = None) -> bytes:
+    props = {'svn:date': _DATE} if message is None else {'svn:author': f'user{revision % 7}', 'svn:date': _DATE,
+                                                       'svn:log': message}
+    block = _props(props)
+    return (b'Revision-number: %d\nProp-content-length: %d\nContent-length: %d\n\n' % (revision, len(block), len(block))
+            + block + b'\n')
+
+
+def _node(path: str, kind: str, action: str, text: bytes = None, copyfrom: Tuple[int, str] = None,
+          with_props: bool = False) -> bytes:
+    headers = [f'Node-path: {path}', f'Node-kind: {kind}', f'Node-action: {action}']
+    if copyfrom is not None:
+        headers += [f'Node-copyfrom-rev: {copyfrom[0]}', f'Node-copyfrom-path: {copyfrom[1]}']
+    props = _props({}) if with_props else b''
+    content = props + (text or b'')
+    if with_props:
+        headers.append(f'Prop-content-length: {len(props)}')
+    if text is not None:
+        headers.append(f'Text-content-length: {len(text)}')
+    if with_props or text is not None:
+        headers.append(f'Content-length: {len(content)}')
+    return '\n'.join(headers).encode() + b'\n\n' + content + b'\n\n'
+
+
+def branch_revisions(spec: RepoSpec) -> List[int]:
+    """Revisions at which trunk is copied to a branch, evenly spread after revision 1."""
+    step = (spec.revisions - 1) // (spec.branches + 1) if spec.branches > 0 else 0
+    if step == 0:
+        return []
+    return [1 + step * (n + 1) for n in range(spec.branches)]
+
+
+def dump_stream(spec: RepoSpec) -> Iterator[bytes]:
+    """The repository as svn dump records, one revision at a time."""
+    rnd = random.Random(spec.seed)
+    yield b'SVN-fs-dump-format-version: 2\n\n'
+    yield b'UUID: %s\n\n' % ('%08x-0000-4000-8000-%012x' % (spec.seed, spec.seed)).encode()
+    yield _revision_record(0)
+
+    contents = [_text(rnd, spec.file_size) for _ in range(spec.files)]
+    record = _revision_record(1, 'initial import')
+    record += _node('trunk', 'dir', 'add', with_props=True) + _node('branches', 'dir', 'add', with_props=True)
+    directories = sorted({os.path.dirname(file_path(i)) for i in range(spec.files)})
+    added = set()
+    for directory in directories:
+        parts = directory.split('/')
+        for depth in range(1, len(parts) + 1):
+            sub = '/'.join(parts[:depth])
+            if sub not in added:
+                added.add(sub)
+                record += _node(f'trunk/{sub}', 'dir', 'add', with_props=True)
+    for i, lines in enumerate(contents):
+        record += _node(f'trunk/{file_path(i)}', 'file', 'add', ''.join(lines).encode(), with_props=True)
+    yield record
+
+    branch_at = branch_revisions(spec)
+    for revision in range(2, spec.revisions + 1):
+        if revision in branch_at:
+            name = f'branch-{branch_at.index(revision) + 1}'
+            record = _revision_record(revision, f'create {name}')
+            record += _node(f'branches/{name}', 'dir', 'add', copyfrom=(revision - 1, 'trunk'))
+            yield record
+            continue
+
+        record = _revision_record(revision, f'change {spec.changes_per_revision} files in r{revision}')
+        for i in sorted(rnd.sample(range(spec.files), min(spec.changes_per_revision, spec.files))):
+            lines = contents[i]
+            lines[rnd.randrange(len(lines))] = _line(rnd)
+            lines.append(_line(rnd))
+            record += _node(f'trunk/{file_path(i)}', 'file', 'change', ''.join(lines).encode())
+        yield record
+
+
+def write_dump(spec: RepoSpec, out: IO[bytes]) -> None:
+    for record in dump_stream(spec):
+        out.write(record)
+
+
+def build_repository(directory: str, spec: RepoSpec) -> Tuple[str, str]:
+    """Create `directory/repo` from `spec` and check out its trunk to `directory/wc`.
+
+    Returns:
+        Tuple[str, str]: repository URL, working copy path
+    """
+    os.makedirs(directory, exist_ok=True)
+    repo = os.path.abspath(os.path.join(directory, 'repo'))
+    wc = os.path.abspath(os.path.join(directory, 'wc'))
+    subprocess.run(['svnadmin', 'create', repo], check=True)
+
+    load = subprocess.Popen(['svnadmin', 'load', '--quiet', repo], stdin=subprocess.PIPE)
+    try:
+        write_dump(spec, load.stdin)
+    finally:
+        load.stdin.close()
+    if load.wait() != 0:
+        raise subprocess.CalledProcessError(load.returncode, load.args)
+
+    url = 'file://' + repo.replace(os.sep, '/')
+    subprocess.run(['svn', 'checkout', '--quiet', f'{url}/trunk', wc], check=True)
+    return url, wc
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Generate a synthetic svn repository and working copy.')
+    parser.add_argument('directory')
+    parser.add_argument('--size', choices=sorted(SIZES), default='small')
+    for field, value in asdict(RepoSpec()).items():
+        parser.add_argument(f'--{field.replace("_", "-")}', type=int, default=None,
+                            help=f'overrides the size preset (e.g. {value})')
+    parser.add_argument('--dump-only', action='store_true', help='write the dump stream to stdout instead')
+    args = parser.parse_args()
+
+    spec = spec_from_args(args)
+    if args.dump_only:
+        write_dump(spec, sys.stdout.buffer)
+        return
+    url, wc = build_repository(args.directory, spec)
+    print(f'{url}\n{wc}')
+
+
+def spec_from_args(args: argparse.Namespace) -> RepoSpec:
+    """Size preset from `--size`, with any field given on the command line overridden."""
+    values = asdict(SIZES[args.size])
+    for field in values:
+        if getattr(args, field, None) is not None:
+            values[field] = getattr(args, field)
+    return RepoSpec(**values)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+'''pysvn benchmark runner.
+
+Generates a repository per size (see `repogen.py`), times `Client`
+operations against it and writes the results as JSON:
+
+    python benchmarks/run.py --sizes small medium --repeat 5 --output results.json
+    python benchmarks/compare.py baseline.json results.json
+
+Each measurement runs in a forked worker, so its svn children are the only
+ones `RUSAGE_CHILDREN` accounts for: the recorded `svn_max_rss_kb` is the
+peak resident size of the largest svn process the operation started, and
+`python_peak_bytes` is the peak of Python allocations (`tracemalloc`).
+Linux (or another POSIX system with `fork`) only; no network is needed.
+'''
+import argparse
+from dataclasses import asdict
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pysvn
+from repogen import SIZES, RepoSpec, build_repository, file_path, spec_from_args
+
+SCHEMA_VERSION = 1
+
+
+class Context:
+    """What an operation needs: a client on the working copy and the repository's shape."""
+    def __init__(self, url: str, wc: str, spec: RepoSpec) -> None:
+        self.url = url
+        self.wc = wc
+        self.spec = spec
+        self.client = pysvn.Client(repository_dir=wc)
+        self.head = spec.revisions
+        self.commits = 0
+
+
+    def svn(self, *args: str) -> None:
+        subprocess.run(['svn', *args], cwd=self.wc, check=True, stdout=subprocess.DEVNULL)
+
+
+def _prepare_update(ctx: Context) -> None:
+    ctx.svn('update', '--quiet', '--revision', str(max(1, ctx.head - 10)))
+
+
+def _prepare_commit(ctx: Context) -> None:
+    for i in range(min(ctx.spec.files, ctx.spec.changes_per_revision)):
+        with open(os.path.join(ctx.wc, file_path(i)), 'a') as f:
+            f.write(f'benchmark commit {ctx.commits}\n')
+    ctx.commits += 1
+
+
+def _prepare_modified(ctx: Context) -> None:
+    for i in range(0, ctx.spec.files, max(1, ctx.spec.files // 10)):
+        with open(os.path.join(ctx.wc, file_path(i)), 'a') as f:
+            f.write('local change\n')
+
+
+# name -> (setup run before each measurement and not timed, timed operation)
+OPERATIONS: Dict[str, Tuple[Optional[Callable[[Context], None]], Callable[[Context], Any]]] = {
+    'info': (None, lambda ctx: ctx.client.info()),
+    'log': (None, lambda ctx: ctx.client.log()),
+    'log_verbose': (None, lambda ctx: ctx.client.log(verbose=True)),
+    'log_limit_100': (None, lambda ctx: ctx.client.log(limit=100)),
+    'iter_log': (None, lambda ctx: sum(1 for _ in ctx.client.iter_log())),
+    'log_file': (None, lambda ctx: ctx.client.log(file_path(0))),
+    'diff_summarize': (None, lambda ctx: ctx.client.diff(1)),
+    'iter_diff_last_10': (None, lambda ctx: sum(1 for _ in ctx.client.iter_diff(max(1, ctx.head - 10)))),
+    'numstat_last_10': (None, lambda ctx: ctx.client.numstat(max(1, ctx.head - 10))),
+    'blame': (None, lambda ctx: ctx.client.blame(file_path(0))),
+    'status_quiet': (_prepare_modified, lambda ctx: ctx.client.status(quiet=True)),
+    'status': (None, lambda ctx: ctx.client.status()),
+    'update_last_10': (_prepare_update, lambda ctx: ctx.client.update()),
+    'commit': (_prepare_commit, lambda ctx: ctx.client.commit('benchmark commit')),
+}
+
+
+def _measure(ctx: Context, operation: Callable[[Context], Any], conn) -> None:
+    # runs in the forked worker
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        operation(ctx)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        conn.send({'seconds': elapsed, 'python_peak_bytes': peak, 'svn_max_rss_kb': children.ru_maxrss,
+                   'svn_cpu_seconds': children.ru_utime + children.ru_stime})
+    except BaseException as e:
+        conn.send({'error': f'{type(e).__name__}: {e}'})
+    finally:
+        conn.close()
+
+
+def measure(ctx: Context, name: str, repeat: int) -> Dict[str, Any]:
+    """Time one operation `repeat` times, each in its own forked worker."""
+    setup, operation = OPERATIONS[name]
+    fork = multiprocessing.get_context('fork')
+    samples: List[Dict[str, Any]] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup(ctx)
+        receiver, sender = fork.Pipe(duplex=False)
+        worker = fork.Process(target=_measure, args=(ctx, operation, sender))
+        worker.start()
+        sender.close()
+        sample = receiver.recv()
+        worker.join()
+        if 'error' in sample:
+            return {'operation': name, 'error': sample['error']}
+        if name == 'commit':
+            # the commit happened in the worker; keep the parent's view in step
+            ctx.head += 1
+        samples.append(sample)
+
+    seconds = [s['seconds'] for s in samples]
+    return {
+        'operation': name,
+        'repeat': repeat,
+        'seconds': {
+            'min': min(seconds),
+            'median': statistics.median(seconds),
+            'mean': statistics.mean(seconds),
+            'max': max(seconds),
+        },
+        'python_peak_bytes': max(s['python_peak_bytes'] for s in samples),
+        'svn_max_rss_kb': max(s['svn_max_rss_kb'] for s in samples),
+        'svn_cpu_seconds': statistics.median(s['svn_cpu_seconds'] for s in samples),
+    }
+
+
+def _svn_version() -> str:
+    version = pysvn.svn_capabilities().version
+    return '.'.join(str(part) for part in version) if version else 'unknown'
+
+
+def run(sizes: Dict[str, RepoSpec], operations: List[str], repeat: int, workdir: str) -> Dict[str, Any]:
+    results = []
+    for size, spec in sizes.items():
+        directory = os.path.join(workdir, size)
+        shutil.rmtree(directory, ignore_errors=True)
+        start = time.perf_counter()
+        url, wc = build_repository(directory, spec)
+        print(f'{size}: built in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+
+        ctx = Context(url, wc, spec)
+        for name in operations:
+            result = measure(ctx, name, repeat)
+            result.update(size=size, spec=asdict(spec))
+            results.append(result)
+            if 'error' in result:
+                print(f'  {name:<20} ERROR {result["error"]}', file=sys.stderr)
+            else:
+                print(f'  {name:<20} {result["seconds"]["median"] * 1000:10.1f} ms '
+                      f'{result["svn_max_rss_kb"] / 1024:8.1f} MiB svn', file=sys.stderr)
+
+    return {
+        'schema': SCHEMA_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'svn': _svn_version(),
+        'results': results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark pysvn Client operations on generated repositories.')
+    parser.add_argument('--sizes', nargs='+', choices=sorted(SIZES), default=['small'])
+    parser.add_argument('--operations', nargs='+', choices=list(OPERATIONS), default=list(OPERATIONS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='JSON file to write (default: stdout)')
+    parser.add_argument('--workdir', help='where to build repositories (default: a temporary directory)')
+    for field in asdict(RepoSpec()):
+        parser.add_argument(f'--{field.replace("_", "-")}', type=int, default=None,
+                            help='override this field of every size preset')
+    args = parser.parse_args()
+
+    sizes = {}
+    for size in args.sizes:
+        args.size = size
+        sizes[size] = spec_from_args(args)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='pysvn-bench-')
+    try:
+        report = run(sizes, args.operations, args.repeat, workdir)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    data = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(data + '\n')
+    else:
+        print(data)
+
+
+if __name__ == '__main__':
+    main()
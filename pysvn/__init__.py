@@ -88,11 +88,58 @@ svn.update(path=['foo.txt', 'bar.c'])
 Ryan Bender - [@itsmeryan.hihello](https://www.instagram.com/itsmeryan.hihello/) - [ryan.bender@cfacorp.com](mailto:ryan.bender@cfacorp.com)
 '''
 
+import sys
+import types
+
 from pysvn.client import Client
-from pysvn.utils import *
-from pysvn.models import *
-from pysvn.errors import *
-from pysvn.constants import *
+from pysvn.instrumentation import CommandEvent, HistogramCollector
+from pysvn.paging import LogCursor
+from pysvn.retry import RetryPolicy
+from pysvn.utils import (check_svn_installed, find_svn, get_longest_line_len, get_output, parse_svn_date,
+                         svn_capabilities, targets_file)
+from pysvn.models import (BlameLine, CatResult, Churn, CommitResult, Diff, FileDiff, FleetResult, Hunk, Info,
+                          LogEntry, LogPath, NumStat, RevisionChurn, SparseStep, StatusEntry, SVNCapabilities, SVNItemPath,
+                          UpdateEvent, UpdateRevision)
+from pysvn.errors import (ERROR_CODES, LOCK_ERROR_CODES, RE_FILE_LOCK_PATTERN, CommandTimeoutError,
+                          CommitConflictError, DatabaseDiskImageMalformedError, FileLockedError,
+                          NoSuchRevisionError, PreviousOperationNotFinishedError,
+                          PristineTextChecksumNotFoundError, RepositoryDirDoesNotExistError,
+                          RevisionSyntaxError, SVNError, SVNNotInstalledError, TargetsNotWorkingCopiesError,
+                          UnsupportedOptionError, handle_stderr)
+from pysvn.constants import CRAction, Depth, Revision, UpdateAction
+
+
+# these pull in asyncio, concurrent.futures, sqlite3, bisect or calendar, so
+# they are only imported on first access
+_LAZY = {
+    'ChurnReport': 'pysvn.analytics',
+    'LogBatch': 'pysvn.columnar',
+    'LogRow': 'pysvn.columnar',
+    'LogIndex': 'pysvn.index',
+    'AsyncClient': 'pysvn.async_client',
+    'Fleet': 'pysvn.fleet',
+    'BlameCache': 'pysvn.cache',
+    'LogCache': 'pysvn.cache',
+    'QueryCache': 'pysvn.cache',
+}
+
+
+class _LazyModule(types.ModuleType):
+    # a module class rather than a module level __getattr__, which needs Python 3.7
+    def __getattr__(self, name: str):
+        if name in _LAZY:
+            import importlib
+            value = getattr(importlib.import_module(_LAZY[name]), name)
+            setattr(self, name, value)
+            return value
+        raise AttributeError(f"module 'pysvn' has no attribute '{name}'")
+
+
+    def __dir__(self):
+        return sorted(list(self.__dict__) + list(_LAZY))
+
+
+sys.modules[__name__].__class__ = _LazyModule
 
 
 name = "pysvn"
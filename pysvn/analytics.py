@@ -0,0 +1,134 @@
+'''pysvn analytics module.
+
+Churn and hotspots over a revision range: the changed paths of every
+revision come from one streamed `svn log --verbose`, and its changed
+lines from a `svn diff -c N` per revision, run on a thread pool a bounded
+number of revisions ahead of the consumer. Revisions come out in order,
+and `ChurnReport` keeps totals per path only, so memory does not grow
+with the length of the history.
+'''
+import posixpath
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pysvn.models import Churn, LogEntry, NumStat, RevisionChurn
+from pysvn.utils import iter_ordered
+
+
+def changed_files(entry: LogEntry, root: str) -> List[str]:
+    """Files (not directories) a revision changed below repository path `root`, relative to it."""
+    prefix = root.rstrip('/') + '/'
+    paths = []
+    for changed in entry.paths or []:
+        if changed.kind != 'dir' and changed.path.startswith(prefix):
+            paths.append(changed.path[len(prefix):])
+    return paths
+
+
+def iter_revision_churn(entries: Iterable[LogEntry], root: str,
+                        numstat: Callable[[int], Optional[List[NumStat]]],
+                        max_workers: int = 4) -> Iterator[RevisionChurn]:
+    """Pair each log entry with the line counts of its revision, in order.
+
+    Args:
+        entries (Iterable[LogEntry]): verbose log entries.
+        root (str): repository path the analysis is restricted to.
+        numstat (Callable[[int], Optional[List[NumStat]]]): line counts of one revision.
+        max_workers (int, optional): revisions diffed at once. Defaults to 4.
+
+    Yields:
+        RevisionChurn: one per entry, in the order of `entries`.
+    """
+    def count_lines(entry: LogEntry) -> Tuple[List[str], Optional[List[NumStat]]]:
+        paths = changed_files(entry, root)
+        # revisions that only touched directories or other paths have no lines to count
+        return paths, numstat(entry.revision) if paths else []
+
+    for entry, (paths, stats) in iter_ordered(count_lines, entries, max_workers):
+        yield RevisionChurn(revision=entry.revision, author=entry.author, date=entry.date, paths=paths, stats=stats)
+
+
+def _parents(path: str) -> Iterator[str]:
+    path = posixpath.dirname(path)
+    while path:
+        yield path
+        path = posixpath.dirname(path)
+
+
+class ChurnReport:
+    """Running totals of commits, changed lines and authors per file and per
+    directory, fed one `RevisionChurn` at a time.
+
+    Attributes:
+        files (Dict[str, Churn]): totals per file.
+        directories (Dict[str, Churn]): totals per directory, over everything below it.
+        revisions (int): number of revisions added.
+    """
+    ORDERS = ('commits', 'churn', 'authors')
+
+    def __init__(self) -> None:
+        self.files: Dict[str, Churn] = {}
+        self.directories: Dict[str, Churn] = {}
+        self.revisions = 0
+
+
+    def add(self, revision: RevisionChurn) -> None:
+        self.revisions += 1
+        lines = {stat.path: stat for stat in revision.stats or []}
+        # a directory counts a revision once, however many of its files changed
+        directories: Dict[str, List[int]] = {}
+        for path in revision.paths:
+            stat = lines.get(path)
+            self._count(self.files, path, revision.author, stat)
+            for directory in _parents(path):
+                counts = directories.setdefault(directory, [0, 0])
+                if stat is not None:
+                    counts[0] += stat.added or 0
+                    counts[1] += stat.removed or 0
+
+        for directory, (added, removed) in directories.items():
+            churn = self._count(self.directories, directory, revision.author, None)
+            churn.added += added
+            churn.removed += removed
+
+
+    @staticmethod
+    def _count(totals: Dict[str, Churn], path: str, author: Optional[str], stat: Optional[NumStat]) -> Churn:
+        churn = totals.get(path)
+        if churn is None:
+            churn = totals[path] = Churn(path=path)
+        churn.commits += 1
+        if author is not None:
+            churn.authors[author] = churn.authors.get(author, 0) + 1
+        if stat is not None:
+            churn.added += stat.added or 0
+            churn.removed += stat.removed or 0
+        return churn
+
+
+    def hotspots(self, limit: int = 10, by: str = 'commits', directories: bool = False) -> List[Churn]:
+        """## The most changed files or directories.
+
+        Args:
+            limit (int, optional): number of paths to return. Defaults to 10.
+            by (str, optional): `commits`, `churn` (lines added and removed) or `authors`. Defaults to `commits`.
+            directories (bool, optional): rank directories instead of files. Defaults to False.
+
+        Raises:
+            ValueError: unknown order.
+
+        Returns:
+            List[Churn]: totals of the top paths, highest first.
+        """
+        if by not in self.ORDERS:
+            raise ValueError(f'by must be one of {", ".join(self.ORDERS)}')
+        import heapq
+        totals = self.directories if directories else self.files
+        if by == 'authors':
+            key = lambda churn: (len(churn.authors), churn.commits)
+        else:
+            key = lambda churn: (getattr(churn, by), churn.commits if by == 'churn' else churn.churn)
+        return heapq.nlargest(limit, totals.values(), key=key)
+
+
+    def __repr__(self) -> str:
+        return f'ChurnReport(revisions={self.revisions}, files={len(self.files)}, directories={len(self.directories)})'
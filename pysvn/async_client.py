@@ -0,0 +1,278 @@
+'''pysvn asyncio client module.
+'''
+import asyncio
+from typing import Any, Callable, List, Union
+import weakref
+
+from pysvn import instrumentation
+from pysvn.client import Client, _LogEntryParser, _diff_from_xml, _info_from_xml, _resolve_repository_dir
+from pysvn.constants import CRAction, Depth, Revision
+from pysvn.errors import handle_stderr
+from pysvn.models import Diff, Info, LogEntry
+from pysvn.process import output_encoding
+from pysvn.retry import RetryPolicy
+
+
+class AsyncClient:
+    """# A command-line SVN client for asyncio.
+
+    Same operations as `Client`, as coroutines backed by
+    `asyncio.create_subprocess_exec`, so waiting on svn never blocks the
+    event loop. At most `max_concurrency` svn processes run at once; other
+    calls wait for a free slot.
+
+    Example:
+        `logs = await pysvn.AsyncClient().log(limit=10)`
+    """
+    def __init__(self, repository_dir: str = None, max_concurrency: int = 16,
+                 retry_policy: RetryPolicy = None) -> None:
+        """# A command-line SVN client for asyncio.
+
+        Args:
+            repository_dir (str, optional): svn repository directory. Defaults to the current directory.
+            max_concurrency (int, optional): maximum number of svn processes running at once. Defaults to 16.
+            retry_policy (RetryPolicy, optional): how to retry commands that fail on a working copy
+                                                  lock. Defaults to `RetryPolicy()`.
+
+        Raises:
+            SVNNotInstalledError: svn command line client is not installed.
+            RepositoryDirDoesNotExistError: repository_dir provided does not exist.
+            NotADirectoryError: reposiory_dir provided is not a directory.
+        """
+        self.cwd = _resolve_repository_dir(repository_dir)
+        self.max_concurrency = max_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        # one per event loop the client is used in, as a semaphore only works in the loop it was first used in
+        self._semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = \
+            weakref.WeakKeyDictionary()
+        self._wc_info: Info = None
+
+
+    async def log(self, file: str = None, revision: Union[int, Revision, str] = 'HEAD:1', limit: int = None,
+                  verbose: bool = False) -> List[LogEntry]:
+        """## Show the log messages for a set of revision(s) and/or path(s).
+
+        Args:
+            file (str, optional): file to get logs for. Defaults to None.
+            revision (int | Revision | str, optional): revision. Defaults to `HEAD:1`.
+            limit (int, optional): maximum number of log entries. Defaults to None.
+            verbose (bool, optional): also fetch the paths changed by each revision. Defaults to False.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+            RevisionSyntaxError: invalid revision syntax when providing a str.
+
+        Returns:
+            List[LogEntry]: list of log entries.
+        """
+        args = Client._log_args(file, revision, limit, verbose)
+        async with self._slot():
+            with instrumentation.command(args, self.cwd) as event:
+                with event.phase('spawn'):
+                    proc = await self._create_process(args)
+                stderr_task = asyncio.ensure_future(proc.stderr.read())
+                parser = _LogEntryParser()
+                entries: List[LogEntry] = []
+                try:
+                    while True:
+                        with event.phase('wait'):
+                            chunk = await proc.stdout.read(65536)
+                        if not chunk:
+                            break
+                        event.stdout_bytes += len(chunk)
+                        with event.phase('parse'):
+                            entries.extend(parser.feed(chunk))
+                    with event.phase('wait'):
+                        stderr = await stderr_task
+                        await proc.wait()
+                    event.stderr_bytes = len(stderr)
+                    if stderr:
+                        handle_stderr(stderr.decode(output_encoding(), 'replace').strip())
+                    with event.phase('parse'):
+                        entries.extend(parser.close())
+                finally:
+                    if proc.returncode is None:
+                        proc.kill()
+                        await proc.wait()
+                    event.returncode = proc.returncode
+                    stderr_task.cancel()
+        return entries
+
+
+    async def info(self, path: str = None, revision: Union[int, Revision, str] = None) -> Info:
+        """## Display information about a local or remote item.
+
+        Args:
+            path (str, optional): working copy path or URL. Defaults to the working copy.
+            revision (int | Revision | str, optional): revision. Defaults to None.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Returns:
+            Info: information about the item.
+        """
+        return await self._execute(Client._info_args(path, revision), _info_from_xml)
+
+
+    async def diff(self, start_revision: int, end_revision: int = None, update: bool = False) -> Diff:
+        """## Display local changes or differences between two revisions or paths.
+
+        See `Client.diff`.
+
+        Args:
+            start_revision (int): starting revision
+            end_revision (int, optional): ending revision. Defaults to `HEAD`.
+            update (bool, optional): update the working copy first. Defaults to False.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Returns:
+            Diff: diff between starting and ending revisions.
+        """
+        if update:
+            await self._execute(['update'])
+
+        if self._wc_info is None:
+            self._wc_info = await self.info()
+        url = self._wc_info.url
+        return await self._execute(Client._diff_args(url, start_revision, end_revision),
+                                  lambda data: _diff_from_xml(data, url))
+
+
+    async def revert(self, path: str, recursive: bool = False, remove_added: bool = False, depth: Depth = None) -> str:
+        """## Restore pristine working copy state (undo local changes).
+
+        See `Client.revert`.
+
+        Args:
+            path (str): path of item to revert.
+            recursive (bool, optional): descend recursively, same as Depth.INFINITY. Defaults to False.
+            remove_added (bool, optional): reverting an added item will remove it from disk. Defaults to False.
+            depth (Depth, optional): limit operation by depth. Defaults to None.
+
+        Returns:
+            str: revert output
+        """
+        return await self._execute(Client._revert_args(path, recursive, remove_added, depth))
+
+
+    async def update(self, path: Union[str, List[str]] = None,
+                     revision: int = None,
+                     accept: CRAction = None,
+                     depth: Depth = None,
+                     force: bool = False,
+                     ignore_externals: bool = False,
+                     parents: bool = False,
+                     adds_as_modification: bool = False) -> str:
+        """## Bring changes from the repository into the working copy.
+
+        See `Client.update`.
+
+        Args:
+            path (str | List[str], optional): path to file(s) to update (Example: `'foo.txt'` or `['foo.txt']`). Defaults to `'.'`.
+            revision (int, optional): revision number to update to. Defaults to None.
+            accept (CRAction, optional): specify automatic conflict resolution action. Defaults to None.
+            depth (Depth, optional): limit operation by depth. Defaults to None.
+            force (bool, optional): handle unversioned obstructions as changes. Defaults to False.
+            ignore_externals (bool, optional): ignore externals definitions. Defaults to False.
+            parents (bool, optional): make intermediate directories. Defaults to False.
+            adds_as_modification (bool, optional): Local additions are merged with incoming additions
+                                                   instead of causing a tree conflict. Defaults to False.
+
+        Raises:
+            NoSuchRevisionError: raised if a revision is given and its unknown.
+
+        Returns:
+            str: command output
+        """
+        return await self._execute(Client._update_args(path, revision, accept, depth, force,
+                                                       ignore_externals, parents, adds_as_modification))
+
+
+    async def cleanup(self, remove_unversioned: bool = False,
+                            remove_ignored: bool = False,
+                            vacuum_pristines: bool = False,
+                            include_externals: bool = False) -> str:
+        """## Either recover from an interrupted operation that left the working copy locked, or remove unwanted files.
+
+        See `Client.cleanup`.
+
+        Args:
+            remove_unversioned (bool, optional): remove unversioned items. Defaults to False.
+            remove_ignored (bool, optional): remove ignored items. Defaults to False.
+            vacuum_pristines (bool, optional): remove unreferenced pristines from .svn directory. Defaults to False.
+            include_externals (bool, optional): also operate on externals defined by svn:externals properties. Defaults to False.
+
+        Returns:
+            str: cleanup command output
+        """
+        return await self._execute(Client._cleanup_args(remove_unversioned, remove_ignored,
+                                                        vacuum_pristines, include_externals))
+
+
+    async def commit(self, message: str,
+                           path: str = '.',
+                           depth: Depth = None,
+                           no_unlock: bool = False,
+                           include_externals: bool = False) -> str:
+        """## Send changes from your working copy to the repository.
+
+        See `Client.commit`.
+
+        Args:
+            message (str): specify log message
+            path (str, optional): path to file or directory to commit. Defaults to `'.'`.
+            depth (Depth, optional): limit operation by depth. Defaults to None.
+            no_unlock (bool, optional): don't unlock the targets. Defaults to False.
+            include_externals (bool, optional): also operate on externals defined by svn:externals properties. Defaults to False.
+
+        Returns:
+            str: commit command output
+        """
+        return await self._execute(Client._commit_args(message, path, depth, no_unlock, include_externals))
+
+
+    def _slot(self) -> asyncio.Semaphore:
+        # called from a coroutine, so this is the running loop (get_running_loop needs Python 3.7)
+        loop = asyncio.get_event_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+
+    async def _create_process(self, args: List[str]) -> asyncio.subprocess.Process:
+        return await asyncio.create_subprocess_exec(
+            'svn', *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=self.cwd)
+
+
+    async def _execute(self, args: List[str], parse: Callable[[str], Any] = None) -> Any:
+        """Run an svn command to completion and return its stdout (or what
+        `parse` makes of it), retrying working copy lock errors according to
+        `retry_policy`.
+        """
+        async def run() -> Any:
+            async with self._slot():
+                with instrumentation.command(args, self.cwd) as event:
+                    with event.phase('spawn'):
+                        proc = await self._create_process(args)
+                    with event.phase('wait'):
+                        stdout, stderr = await proc.communicate()
+                    event.returncode = proc.returncode
+                    event.stdout_bytes, event.stderr_bytes = len(stdout), len(stderr)
+                    if stderr:
+                        handle_stderr(stderr.decode(output_encoding(), 'replace').strip())
+                    if parse is None:
+                        with event.phase('decode'):
+                            return stdout.decode(output_encoding(), 'replace').strip()
+                    with event.phase('parse'):
+                        # xml output is parsed from bytes, in the encoding it declares
+                        return parse(stdout)
+
+        return await self.retry_policy.call_async(run)
+
+
+    def __repr__(self) -> str:
+        return f'AsyncClient(cwd={self.cwd}, max_concurrency={self.max_concurrency})'
@@ -0,0 +1,284 @@
+'''pysvn Subversion bindings backend module.
+
+Serves some `Client` operations in-process through the Subversion SWIG
+bindings (`svn.core`, `svn.client`, `svn.ra`) instead of running `svn`.
+The bindings are optional: `BINDINGS_AVAILABLE` is False when they can't
+be imported, and `Client` then keeps using the command line client. They
+are built with Subversion itself (e.g. the `python3-subversion` system
+package), not installed from PyPI.
+'''
+from datetime import datetime, timedelta
+import os
+import threading
+from typing import List, Union
+
+from pysvn.constants import Depth, Revision
+from pysvn.errors import handle_stderr
+from pysvn.models import Diff, Info, LogEntry, LogPath, SVNItemPath
+from pysvn.utils import parse_svn_date
+
+try:
+    from svn import core, ra, wc
+    from svn import client as svn_client
+    BINDINGS_AVAILABLE = True
+except ImportError:
+    BINDINGS_AVAILABLE = False
+
+
+_LOG_REVPROPS = ['svn:author', 'svn:date', 'svn:log']
+
+
+def _raise_svn_error(e: Exception) -> None:
+    """Raise the `pysvn.errors` exception matching a `SubversionException`."""
+    apr_err = getattr(e, 'apr_err', None)
+    if apr_err is None and len(e.args) > 1:
+        apr_err = e.args[1]
+    message = e.args[0] if e.args else str(e)
+    handle_stderr(f'svn: E{apr_err:06d}: {message}' if apr_err else f'svn: {message}')
+
+
+def _opt_revision(revision: Union[int, Revision, str, None]):
+    rev = core.svn_opt_revision_t()
+    if revision is None:
+        rev.kind = core.svn_opt_revision_unspecified
+        return rev
+
+    name = revision.name if type(revision) == Revision else str(revision).upper()
+    if name.isdigit():
+        rev.kind = core.svn_opt_revision_number
+        rev.value.number = int(name)
+    elif name == 'HEAD':
+        rev.kind = core.svn_opt_revision_head
+    elif name == 'BASE':
+        rev.kind = core.svn_opt_revision_base
+    elif name == 'COMMITTED':
+        rev.kind = core.svn_opt_revision_committed
+    elif name == 'PREV':
+        rev.kind = core.svn_opt_revision_previous
+    else:
+        handle_stderr(f"svn: E205000: Syntax error in revision argument '{revision}'")
+    return rev
+
+
+def _node_kind(kind) -> str:
+    if kind == core.svn_node_file:
+        return 'file'
+    if kind == core.svn_node_dir:
+        return 'dir'
+    return ''
+
+
+def _apr_time(value: int) -> datetime:
+    if not value:
+        return None
+    return (datetime(1970, 1, 1) + timedelta(microseconds=value)).replace(microsecond=0)
+
+
+class BindingsBackend:
+    """In-process backend for a working copy, built on the Subversion bindings.
+
+    One client context (config and auth) is created up front, and one RA
+    session to the repository root is opened on first use and reused by
+    every log query after that, which is where most of the fixed cost of an
+    `svn` process goes.
+    """
+    def __init__(self, cwd: str) -> None:
+        """In-process backend for a working copy, built on the Subversion bindings.
+
+        Args:
+            cwd (str): working copy directory.
+
+        Raises:
+            ImportError: the Subversion bindings are not installed.
+        """
+        if not BINDINGS_AVAILABLE:
+            raise ImportError('the Subversion Python bindings (svn.client, svn.ra) are not installed')
+
+        self.cwd = cwd
+        self._lock = threading.RLock()
+        self._ctx = svn_client.svn_client_create_context()
+        self._ctx.auth_baton = core.svn_auth_open([
+            svn_client.svn_client_get_simple_provider(),
+            svn_client.svn_client_get_username_provider(),
+            svn_client.svn_client_get_ssl_server_trust_file_provider(),
+            svn_client.svn_client_get_ssl_client_cert_file_provider(),
+            svn_client.svn_client_get_ssl_client_cert_pw_file_provider(),
+        ])
+        self._ctx.config = core.svn_config_get_config(None)
+        self._session = None
+        self._session_root: str = None
+
+
+    def log(self, repository_root: str, repository_path: str, start: Union[int, str], end: Union[int, str],
+            limit: int = None, verbose: bool = False) -> List[LogEntry]:
+        """Log entries of a repository path (e.g. `/trunk/foo.txt`) between two revisions."""
+        entries: List[LogEntry] = []
+
+        def receiver(log_entry, pool) -> None:
+            revprops = log_entry.revprops or {}
+            paths = None
+            if verbose:
+                paths = []
+                for path, change in sorted((log_entry.changed_paths2 or {}).items()):
+                    copyfrom_revision = change.copyfrom_rev if change.copyfrom_path else None
+                    paths.append(LogPath(path=path,
+                                         action=change.action,
+                                         kind=_node_kind(change.node_kind),
+                                         copyfrom_path=change.copyfrom_path,
+                                         copyfrom_revision=copyfrom_revision))
+            entries.append(LogEntry(message=revprops.get('svn:log'),
+                                    author=revprops.get('svn:author'),
+                                    revision=log_entry.revision,
+                                    date=parse_svn_date(revprops.get('svn:date')),
+                                    paths=paths))
+
+        with self._lock:
+            try:
+                session = self._ra_session(repository_root)
+                if 'HEAD' in (start, end):
+                    head = ra.svn_ra_get_latest_revnum(session)
+                    start = head if start == 'HEAD' else start
+                    end = head if end == 'HEAD' else end
+                ra.svn_ra_get_log2(session, [repository_path.lstrip('/')], start, end, limit or 0,
+                                   verbose, False, False, _LOG_REVPROPS, receiver)
+            except core.SubversionException as e:
+                _raise_svn_error(e)
+        return entries
+
+
+    def info(self, path: str = None, revision: Union[int, Revision, str] = None) -> Info:
+        """Information about a working copy path or URL, like `svn info`."""
+        target = self._target(path)
+        infos: List[Info] = []
+
+        def receiver(info_path, info, pool) -> None:
+            infos.append(Info(path=path or '.',
+                              kind=_node_kind(info.kind),
+                              revision=info.rev,
+                              url=info.URL,
+                              relative_url='^' + info.URL[len(info.repos_root_URL):],
+                              repository_root=info.repos_root_URL,
+                              uuid=info.repos_UUID,
+                              last_changed_revision=info.last_changed_rev,
+                              last_changed_author=info.last_changed_author,
+                              last_changed_date=_apr_time(info.last_changed_date)))
+
+        with self._lock:
+            try:
+                svn_client.svn_client_info2(target, _opt_revision(None), _opt_revision(revision), receiver,
+                                            core.svn_depth_empty, None, self._ctx)
+            except core.SubversionException as e:
+                _raise_svn_error(e)
+        return infos[0]
+
+
+    def diff_summarize(self, url: str, start_revision: int, end_revision: int = None) -> Diff:
+        """Summary of the changes between two revisions of a URL, like `svn diff --summarize`."""
+        kinds = {
+            svn_client.svn_client_diff_summarize_kind_normal: 'none',
+            svn_client.svn_client_diff_summarize_kind_added: 'added',
+            svn_client.svn_client_diff_summarize_kind_modified: 'modified',
+            svn_client.svn_client_diff_summarize_kind_deleted: 'deleted',
+        }
+        paths: List[SVNItemPath] = []
+
+        def receiver(summary, pool) -> None:
+            paths.append(SVNItemPath(item=kinds.get(summary.summarize_kind, 'none'),
+                                     props='modified' if summary.prop_changed else 'none',
+                                     kind=_node_kind(summary.node_kind),
+                                     filepath=summary.path))
+
+        with self._lock:
+            try:
+                target = self._target(url)
+                svn_client.svn_client_diff_summarize2(target, _opt_revision(start_revision),
+                                                      target, _opt_revision(end_revision or 'HEAD'),
+                                                      core.svn_depth_infinity, False, None, receiver, self._ctx)
+            except core.SubversionException as e:
+                _raise_svn_error(e)
+        return Diff(paths)
+
+
+    def update(self, path: Union[str, List[str]] = None,
+               revision: int = None,
+               depth: Depth = None,
+               force: bool = False,
+               ignore_externals: bool = False,
+               parents: bool = False,
+               adds_as_modification: bool = False,
+               set_depth: Depth = None) -> str:
+        """Update the working copy, returning the same report `svn update` prints.
+
+        Like `svn update`, `depth` only limits this update; `set_depth` changes
+        the depth recorded in the working copy.
+        """
+        paths = [path] if type(path) == str else (path or ['.'])
+        lines: List[str] = []
+        changed = []
+
+        def notify(n, pool) -> None:
+            shown = os.path.relpath(n.path, self.cwd) if os.path.isabs(n.path) else n.path
+            if n.action == wc.svn_wc_notify_update_started:
+                lines.append(f"Updating '{shown}':")
+                changed.clear()
+            elif n.action == wc.svn_wc_notify_update_completed:
+                lines.append(f'Updated to revision {n.revision}.' if changed else f'At revision {n.revision}.')
+            elif n.action == wc.svn_wc_notify_tree_conflict:
+                lines.append(f'   C {shown}')
+                changed.append(shown)
+            else:
+                code = {wc.svn_wc_notify_update_add: 'A',
+                        wc.svn_wc_notify_update_delete: 'D',
+                        wc.svn_wc_notify_update_replace: 'R',
+                        wc.svn_wc_notify_exists: 'E'}.get(n.action)
+                if code is not None:
+                    lines.append(f'{code}    {shown}')
+                    changed.append(shown)
+                elif n.action == wc.svn_wc_notify_update_update:
+                    text, props = self._state_char(n.content_state), self._state_char(n.prop_state)
+                    if text != ' ' or props != ' ':
+                        lines.append(f'{text}{props}   {shown}')
+                        changed.append(shown)
+
+        requested = set_depth or depth
+        svn_depth = core.svn_depth_from_word(requested.value) if requested else core.svn_depth_unknown
+        with self._lock:
+            self._ctx.notify_func2 = notify
+            try:
+                svn_client.svn_client_update4([self._target(p) for p in paths],
+                                              _opt_revision(revision if revision else 'HEAD'),
+                                              svn_depth, set_depth is not None, ignore_externals, force,
+                                              adds_as_modification, parents, self._ctx)
+            except core.SubversionException as e:
+                _raise_svn_error(e)
+            finally:
+                self._ctx.notify_func2 = None
+        return '\n'.join(lines)
+
+
+    @staticmethod
+    def _state_char(state) -> str:
+        if state == wc.svn_wc_notify_state_conflicted:
+            return 'C'
+        if state == wc.svn_wc_notify_state_merged:
+            return 'G'
+        if state == wc.svn_wc_notify_state_changed:
+            return 'U'
+        return ' '
+
+
+    def _target(self, path: str = None) -> str:
+        if path and '://' in path:
+            return core.svn_uri_canonicalize(path)
+        return core.svn_dirent_canonicalize(os.path.join(self.cwd, path or ''))
+
+
+    def _ra_session(self, repository_root: str):
+        if self._session is None or self._session_root != repository_root:
+            self._session = svn_client.svn_client_open_ra_session(repository_root, self._ctx)
+            self._session_root = repository_root
+        return self._session
+
+
+    def __repr__(self) -> str:
+        return f'BindingsBackend(cwd={self.cwd})'
@@ -0,0 +1,489 @@
+'''pysvn cache module.
+'''
+from collections import OrderedDict
+import copy
+import dataclasses
+from datetime import datetime
+from enum import Enum
+import posixpath
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from pysvn.models import BlameLine, LogEntry, LogPath
+from pysvn.utils import parse_svn_date
+
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS log_entries (
+    uuid TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    author TEXT,
+    date TEXT,
+    message TEXT,
+    PRIMARY KEY (uuid, revision)
+);
+CREATE TABLE IF NOT EXISTS changed_paths (
+    uuid TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    action TEXT,
+    kind TEXT,
+    copyfrom_path TEXT,
+    copyfrom_revision INTEGER
+);
+CREATE INDEX IF NOT EXISTS changed_paths_revision ON changed_paths (uuid, revision);
+CREATE INDEX IF NOT EXISTS changed_paths_path ON changed_paths (uuid, path, revision);
+'''
+
+
+class LogCache:
+    """Persistent, incremental cache of `svn log` output.
+
+    Entries are stored in a SQLite file, keyed by repository UUID and revision,
+    together with the paths each revision changed. Revisions below `HEAD`
+    never change (apart from revision property edits, see `invalidate`),
+    so a client only has to ask svn for revisions newer than the highest one
+    cached; every other log query is answered from the file.
+
+    Example:
+        `svn = pysvn.Client(log_cache=pysvn.LogCache('log-cache.sqlite'))`
+    """
+    def __init__(self, path: str = ':memory:') -> None:
+        """Persistent, incremental cache of `svn log` output.
+
+        Args:
+            path (str, optional): SQLite database file. Defaults to `:memory:`.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+
+    def highest_revision(self, uuid: str) -> int:
+        """Highest revision cached for a repository, 0 if nothing is cached."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT MAX(revision) FROM log_entries WHERE uuid = ?', (uuid,)).fetchone()
+        return row[0] or 0
+
+
+    def missing_ranges(self, uuid: str) -> List[Tuple[int, int]]:
+        """Ranges of revisions below the highest cached one that are not cached
+        (e.g. because they were invalidated), as inclusive `(start, end)` pairs.
+        """
+        with self._lock:
+            count, highest = self._conn.execute(
+                'SELECT COUNT(*), MAX(revision) FROM log_entries WHERE uuid = ?', (uuid,)).fetchone()
+            if not highest or count == highest:
+                return []
+            revisions = [r for r, in self._conn.execute(
+                'SELECT revision FROM log_entries WHERE uuid = ? ORDER BY revision', (uuid,))]
+
+        ranges = []
+        expected = 1
+        for revision in revisions:
+            if revision > expected:
+                ranges.append((expected, revision - 1))
+            expected = revision + 1
+        return ranges
+
+
+    def store(self, uuid: str, entries: Iterable[LogEntry], batch_size: int = 1000) -> int:
+        """Store log entries (fetched with changed paths) for a repository.
+
+        Entries are committed in batches, so an interrupted fetch keeps what
+        it already stored.
+
+        Args:
+            uuid (str): repository UUID.
+            entries (Iterable[LogEntry]): log entries to store.
+            batch_size (int, optional): entries per transaction. Defaults to 1000.
+
+        Returns:
+            int: number of entries stored.
+        """
+        stored = 0
+        batch: List[LogEntry] = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                stored += self._store_batch(uuid, batch)
+                batch = []
+        if batch:
+            stored += self._store_batch(uuid, batch)
+        return stored
+
+
+    def _store_batch(self, uuid: str, entries: List[LogEntry]) -> int:
+        revisions = [(uuid, e.revision) for e in entries]
+        rows = [(uuid, e.revision, e.author, e.date.strftime('%Y-%m-%dT%H:%M:%S') if e.date else None, e.message)
+                for e in entries]
+        paths = [(uuid, e.revision, p.path, p.action, p.kind, p.copyfrom_path, p.copyfrom_revision)
+                 for e in entries for p in (e.paths or [])]
+        with self._lock, self._conn:
+            self._conn.executemany('DELETE FROM changed_paths WHERE uuid = ? AND revision = ?', revisions)
+            self._conn.executemany('INSERT OR REPLACE INTO log_entries VALUES (?, ?, ?, ?, ?)', rows)
+            self._conn.executemany('INSERT INTO changed_paths VALUES (?, ?, ?, ?, ?, ?, ?)', paths)
+        return len(rows)
+
+
+    def invalidate(self, uuid: str, revisions: Iterable[int] = None) -> None:
+        """Drop cached revisions, e.g. from a `post-revprop-change` hook after a
+        log message or author was edited. They are fetched again on the next query.
+
+        Args:
+            uuid (str): repository UUID.
+            revisions (Iterable[int], optional): revisions to drop. Defaults to None (the whole repository).
+        """
+        with self._lock, self._conn:
+            if revisions is None:
+                self._conn.execute('DELETE FROM changed_paths WHERE uuid = ?', (uuid,))
+                self._conn.execute('DELETE FROM log_entries WHERE uuid = ?', (uuid,))
+                return
+            keys = [(uuid, int(r)) for r in revisions]
+            self._conn.executemany('DELETE FROM changed_paths WHERE uuid = ? AND revision = ?', keys)
+            self._conn.executemany('DELETE FROM log_entries WHERE uuid = ? AND revision = ?', keys)
+
+
+    def entries(self, uuid: str, start: int, end: int, path: str = None,
+                limit: int = None, verbose: bool = False) -> Iterator[LogEntry]:
+        """Cached log entries between two revisions, in the same order and with
+        the same path filtering `svn log` would use.
+
+        Args:
+            uuid (str): repository UUID.
+            start (int): first revision; entries are returned newest first if it is the higher one.
+            end (int): last revision.
+            path (str, optional): repository path (e.g. `/trunk/foo.txt`) to get logs for. Defaults to None.
+            limit (int, optional): maximum number of log entries. Defaults to None.
+            verbose (bool, optional): include the changed paths of each entry. Defaults to False.
+
+        Yields:
+            LogEntry: log entries.
+        """
+        low, high = min(start, end), max(start, end)
+        if path is None or path == '/':
+            with self._lock:
+                revisions = [r for r, in self._conn.execute(
+                    'SELECT revision FROM log_entries WHERE uuid = ? AND revision BETWEEN ? AND ? '
+                    'ORDER BY revision DESC', (uuid, low, high))]
+        else:
+            revisions = self._path_history(uuid, path, low, high)
+
+        if start < end:
+            revisions.reverse()
+        if limit:
+            revisions = revisions[:limit]
+
+        for i in range(0, len(revisions), 500):
+            chunk = revisions[i:i + 500]
+            entries = self._load(uuid, chunk, verbose)
+            for revision in chunk:
+                yield entries[revision]
+
+
+    def _load(self, uuid: str, revisions: List[int], verbose: bool) -> Dict[int, LogEntry]:
+        marks = ', '.join('?' * len(revisions))
+        with self._lock:
+            entries = {
+                revision: LogEntry(message=message, author=author, revision=revision, date=parse_svn_date(date))
+                for revision, author, date, message in self._conn.execute(
+                    f'SELECT revision, author, date, message FROM log_entries '
+                    f'WHERE uuid = ? AND revision IN ({marks})', (uuid, *revisions))
+            }
+            if verbose:
+                for entry in entries.values():
+                    entry.paths = []
+                for revision, *path in self._conn.execute(
+                        f'SELECT revision, path, action, kind, copyfrom_path, copyfrom_revision FROM changed_paths '
+                        f'WHERE uuid = ? AND revision IN ({marks}) ORDER BY rowid', (uuid, *revisions)):
+                    entries[revision].paths.append(LogPath(*path))
+        return entries
+
+
+    def _path_history(self, uuid: str, path: str, low: int, high: int) -> List[int]:
+        """Revisions in `[low, high]` that changed `path` (or anything below it), newest
+        first, following the path back through copies like `svn log` does.
+        """
+        revisions: List[int] = []
+        while high >= low:
+            ancestors = _ancestors(path)
+            marks = ', '.join('?' * len(ancestors))
+            with self._lock:
+                rows = self._conn.execute(
+                    f'SELECT revision, path, action, copyfrom_path, copyfrom_revision FROM changed_paths '
+                    f'WHERE uuid = ? AND revision BETWEEN ? AND ? '
+                    f'AND (path = ? OR substr(path, 1, ?) = ? OR (path IN ({marks}) AND action IN (\'A\', \'R\'))) '
+                    f'ORDER BY revision DESC, length(path)',
+                    (uuid, low, high, path, len(path) + 1, path + '/', *ancestors)).fetchall()
+
+            copied_from = None
+            for revision, changed_path, action, copyfrom_path, copyfrom_revision in rows:
+                if copied_from is not None and revision < copied_from[0]:
+                    break
+                if not revisions or revisions[-1] != revision:
+                    revisions.append(revision)
+                if action in ('A', 'R') and (changed_path == path or changed_path in ancestors):
+                    # the node was created here; continue with the path it was copied from, if any
+                    if copyfrom_path:
+                        copied_from = (revision, copyfrom_path + path[len(changed_path):], copyfrom_revision)
+                    else:
+                        copied_from = (revision, None, None)
+
+            if copied_from is None or copied_from[1] is None:
+                break
+            _, path, high = copied_from
+        return revisions
+
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+    def __repr__(self) -> str:
+        return f'LogCache(path={self.path})'
+
+
+class BlameCache:
+    """In-memory LRU cache of `svn blame` results.
+
+    Annotations are keyed by `(repository UUID, repository path, revision)`,
+    where revision is the one in which the file last changed. An annotation
+    at a fixed revision never changes, and blaming the file at any later
+    revision where it is unchanged gives the same result, so all those
+    queries share one entry.
+
+    Example:
+        `svn = pysvn.Client(blame_cache=pysvn.BlameCache())`
+    """
+    def __init__(self, max_entries: int = 128) -> None:
+        """In-memory LRU cache of `svn blame` results.
+
+        Args:
+            max_entries (int, optional): number of annotations to keep. Defaults to 128.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[str, str, int], List[BlameLine]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key: Tuple[str, str, int]) -> Optional[List[BlameLine]]:
+        with self._lock:
+            lines = self._entries.get(key)
+            if lines is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return list(lines)
+
+
+    def put(self, key: Tuple[str, str, int], lines: List[BlameLine]) -> None:
+        with self._lock:
+            self._entries[key] = list(lines)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def __repr__(self) -> str:
+        return f'BlameCache(entries={len(self)}, max_entries={self.max_entries})'
+
+
+class QueryCache:
+    """In-memory LRU cache of read query results (`log`, `diff`), bounded by
+    number of entries and by size.
+
+    A query between numeric revisions always gets the same answer and is
+    kept until evicted. A query reaching `HEAD` is kept along with the
+    `HEAD` revision it was answered at, and reused as long as `HEAD` has not
+    moved. `HEAD` is probed with `svn info --show-item revision` at most
+    once every `head_interval` seconds, so results may lag that long behind
+    a new commit.
+
+    Queries are keyed by their arguments and the working copy directory;
+    after switching a working copy to another URL, `clear()` the cache.
+    Results are deep-copied in and out, so callers may change them.
+
+    Example:
+        `svn = pysvn.Client(query_cache=pysvn.QueryCache(max_bytes=256 * 2**20))`
+
+    Attributes:
+        hits (int): queries answered from the cache.
+        misses (int): queries that had to run svn, including those whose `HEAD` had moved.
+        evictions (int): entries dropped to stay within the bounds.
+        head_probes (int): times `HEAD` was asked of svn.
+    """
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 2**20, head_interval: float = 2.) -> None:
+        """In-memory LRU cache of read query results.
+
+        Args:
+            max_entries (int, optional): number of results to keep. Defaults to 256.
+            max_bytes (int, optional): approximate memory the results may take. Defaults to 64 MiB.
+            head_interval (float, optional): seconds a probed `HEAD` revision is trusted. Defaults to 2.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.head_interval = head_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.head_probes = 0
+        self.size = 0
+        # key -> (result, size, HEAD revision it was answered at or None if it can't change)
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int, Optional[int]]]' = OrderedDict()
+        self._heads: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+
+    def head(self, repository: str, probe: Callable[[], int]) -> int:
+        """## `HEAD` revision of a repository, probed if the last probe is older than `head_interval`.
+
+        Args:
+            repository (str): repository the revision is for, e.g. its root URL.
+            probe (Callable[[], int]): asks svn for the youngest revision.
+
+        Returns:
+            int: `HEAD` revision
+        """
+        with self._lock:
+            known = self._heads.get(repository)
+        if known is not None and time.monotonic() - known[1] < self.head_interval:
+            return known[0]
+        revision = probe()
+        with self._lock:
+            self.head_probes += 1
+            self._heads[repository] = (revision, time.monotonic())
+        return revision
+
+
+    def get(self, key: Hashable, head: int = None) -> Optional[Any]:
+        """## Cached result of a query, None if there is none.
+
+        Args:
+            key (Hashable): query.
+            head (int, optional): current `HEAD` revision, for queries reaching `HEAD`. Defaults to None.
+
+        Returns:
+            Any | None: a copy of the result
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] != head:
+                # answered at an older HEAD
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return _copy(entry[0])
+
+
+    def put(self, key: Hashable, result: Any, head: int = None) -> None:
+        """## Cache the result of a query.
+
+        Args:
+            key (Hashable): query.
+            result (Any): its result.
+            head (int, optional): `HEAD` revision the query reaching `HEAD` was answered at. Defaults to None.
+        """
+        size = _sizeof(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (_copy(result), size, head)
+            self.size += size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._heads.clear()
+            self.size = 0
+
+
+    @property
+    def hit_rate(self) -> float:
+        queries = self.hits + self.misses
+        return self.hits / queries if queries else 0.
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def __repr__(self) -> str:
+        return (f'QueryCache(entries={len(self)}, size={self.size}, hits={self.hits}, misses={self.misses}, '
+                f'evictions={self.evictions}, head_probes={self.head_probes})')
+
+
+def _copy(result: Any) -> Any:
+    """Deep copy of a query result, so callers can't change what is cached."""
+    if result is None or isinstance(result, (str, bytes, int, float, datetime, Enum)):
+        return result
+    if isinstance(result, list):
+        return [_copy(item) for item in result]
+    if isinstance(result, tuple):
+        return tuple(_copy(item) for item in result)
+    if isinstance(result, dict):
+        return {key: _copy(value) for key, value in result.items()}
+    if dataclasses.is_dataclass(result):
+        return type(result)(**{field.name: _copy(getattr(result, field.name)) for field in dataclasses.fields(result)})
+    # e.g. a LogBatch: its columns are arrays, copied in one go each
+    return copy.deepcopy(result)
+
+
+def _sizeof(value: Any) -> int:
+    """Rough size in bytes of a query result; shared objects are counted each time."""
+    if isinstance(value, (Enum, type)):
+        return 0
+    if isinstance(value, (str, bytes, bytearray, int, float)) or value is None:
+        return sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_sizeof(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(key) + _sizeof(item) for key, item in value.items())
+    if dataclasses.is_dataclass(value):
+        return sys.getsizeof(value) + sum(_sizeof(getattr(value, field.name)) for field in dataclasses.fields(value))
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + _sizeof(vars(value))
+    return sys.getsizeof(value)
+
+
+def _ancestors(path: str) -> List[str]:
+    ancestors = []
+    parent = posixpath.dirname(path)
+    while parent and parent != '/':
+        ancestors.append(parent)
+        parent = posixpath.dirname(parent)
+    ancestors.append('/')
+    return ancestors
@@ -1,18 +1,371 @@
-from datetime import datetime
+from contextlib import contextmanager, suppress
 import subprocess
 from subprocess import Popen
 import os
-from typing import List, Union
-import xml.etree.ElementTree
+import posixpath
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote
 import pathlib
-import time
 import re
-import locale
+import time
 
 from pysvn.errors import *
 from pysvn.models import *
 from pysvn.utils import *
 from pysvn.constants import *
+from pysvn import instrumentation
+from pysvn.process import CommandOutput, StderrDrain, capture_output, output_encoding
+from pysvn.paging import LogCursor
+from pysvn.retry import RetryPolicy
+
+# xml, locale, sqlite3, the diff parser and the columnar log are imported where they are used, so
+# that creating a client doesn't pay for what it may never need
+XMLData = Union[str, bytes, 'CommandOutput']
+
+if TYPE_CHECKING:
+    import xml.etree.ElementTree
+    from pysvn.analytics import ChurnReport
+    from pysvn.cache import BlameCache, LogCache, QueryCache
+    from pysvn.columnar import LogBatch
+    from pysvn.sparse import SparseSpec
+
+
+def _revision_str(revision: Union[int, Revision, str]) -> str:
+    return revision.name if type(revision) == Revision else str(revision)
+
+
+def _is_url(path: str) -> bool:
+    return bool(path) and (path.startswith('^/') or '://' in path)
+
+
+def _parse_revision_range(revision: Union[int, Revision, str]) -> Optional[Tuple[Union[int, str], Union[int, str]]]:
+    """Split a revision argument into numeric (or `'HEAD'`) start and end revisions.
+
+    Returns None for anything else (`BASE`, `PREV`, `{DATE}`, bad syntax...),
+    which only svn itself can resolve.
+    """
+    if type(revision) == Revision:
+        return ('HEAD', 'HEAD') if revision == Revision.HEAD else None
+    if type(revision) == int:
+        return revision, revision
+
+    parts = str(revision).split(':')
+    if len(parts) > 2:
+        return None
+    bounds = []
+    for part in parts:
+        part = part.strip()
+        if part.isdigit():
+            bounds.append(int(part))
+        elif part.upper() == 'HEAD':
+            bounds.append('HEAD')
+        else:
+            return None
+    return bounds[0], bounds[-1]
+
+
+def _log_entry_from_element(e: 'xml.etree.ElementTree.Element') -> LogEntry:
+    entry_info = {x.tag: x.text for x in list(e)}
+
+    paths = None
+    paths_element = e.find('paths')
+    if paths_element is not None:
+        paths = []
+        for p in paths_element.iter('path'):
+            copyfrom_revision = p.get('copyfrom-rev')
+            paths.append(LogPath(
+                path=p.text,
+                action=p.get('action'),
+                kind=p.get('kind'),
+                copyfrom_path=p.get('copyfrom-path'),
+                copyfrom_revision=int(copyfrom_revision) if copyfrom_revision else None
+            ))
+
+    return LogEntry(
+        message=entry_info.get('msg'),
+        author=entry_info.get('author'),
+        revision=int(e.get('revision')),
+        date=parse_svn_date(entry_info.get('date')),
+        paths=paths
+    )
+
+
+class _LogEntryParser:
+    """Incremental `svn log --xml` parser: feed it chunks of output as they
+    arrive and get back the log entries they completed.
+    """
+    def __init__(self, factory: Callable[['xml.etree.ElementTree.Element'], Any] = _log_entry_from_element) -> None:
+        import xml.etree.ElementTree
+        self._parser = xml.etree.ElementTree.XMLPullParser(events=('start', 'end'))
+        self._factory = factory
+        self._root = None
+
+
+    def feed(self, data: bytes) -> List[LogEntry]:
+        self._parser.feed(data)
+        return self._read_entries()
+
+
+    def close(self) -> List[LogEntry]:
+        self._parser.close()
+        return self._read_entries()
+
+
+    def _read_entries(self) -> List[LogEntry]:
+        entries = []
+        for event, e in self._parser.read_events():
+            if self._root is None:
+                self._root = e
+            if event == 'end' and e.tag == 'logentry':
+                entries.append(self._factory(e))
+                # drop the parsed entry so the tree never holds more than one
+                self._root.clear()
+        return entries
+
+
+def _relative_to(url: str, path: str) -> str:
+    """Path of a diff target below `url`, the way a working copy diff would show it."""
+    if path == url:
+        return '.'
+    if path.startswith(url + '/'):
+        return unquote(path[len(url) + 1:])
+    return path
+
+
+def _xml_root(data: XMLData) -> 'xml.etree.ElementTree.Element':
+    """Parse svn's `--xml` output. Bytes are left to the parser to decode (svn
+    writes UTF-8 and says so), and captured output is fed to it in chunks, so
+    no copy of the whole document is made.
+    """
+    import xml.etree.ElementTree
+    if isinstance(data, CommandOutput):
+        parser = xml.etree.ElementTree.XMLParser()
+        for chunk in data.chunks(2 ** 20):
+            parser.feed(chunk)
+        return parser.close()
+    return xml.etree.ElementTree.fromstring(data)
+
+
+def _diff_from_xml(data: XMLData, url: str = None) -> Diff:
+    paths: List[SVNItemPath] = []
+    root = _xml_root(data)
+
+    for e in root.iter('path'):
+        attrs = e.attrib
+        filepath = _relative_to(url, e.text) if url else e.text
+        svn_path = SVNItemPath(
+            item=attrs.get('item'),
+            props=attrs.get('props'),
+            kind=attrs.get('kind'),
+            filepath=filepath
+        )
+        paths.append(svn_path)
+
+    return Diff(paths)
+
+
+def _blame_from_xml(data: XMLData) -> List[BlameLine]:
+    lines: List[BlameLine] = []
+    root = _xml_root(data)
+
+    for e in root.iter('entry'):
+        commit = e.find('commit')
+        if commit is None:
+            # locally modified line, not committed yet
+            lines.append(BlameLine(line_number=int(e.get('line-number')), revision=None, author=None, date=None))
+            continue
+        lines.append(BlameLine(
+            line_number=int(e.get('line-number')),
+            revision=int(commit.get('revision')),
+            author=commit.findtext('author'),
+            date=parse_svn_date(commit.findtext('date'))
+        ))
+
+    return lines
+
+
+def _info_from_xml(data: XMLData) -> Info:
+    root = _xml_root(data)
+    return _info_from_element(root.find('entry'))
+
+
+def _sparse_working_copy_from_xml(data: XMLData, path: str) -> Tuple[Info, Dict[str, Tuple[str, Depth]]]:
+    """Info of the root of `svn info --depth infinity path`, and the kind and depth of every path below."""
+    root = _xml_root(data)
+    entries = root.findall('entry')
+    working_copy = {}
+    for e in entries:
+        kind, depth = e.get('kind'), e.findtext('wc-info/depth')
+        if depth == 'exclude' or (kind == 'dir' and depth):
+            depth = Depth(depth)
+        else:
+            # files have no depth of their own
+            depth = Depth.INFINITY
+        working_copy[os.path.relpath(e.get('path'), path)] = (kind, depth)
+    return _info_from_element(entries[0]), working_copy
+
+
+def _status_from_xml(data: XMLData) -> List[StatusEntry]:
+    root = _xml_root(data)
+    entries: List[StatusEntry] = []
+    # entries in a changelist are nested one level deeper
+    for e in root.iter('entry'):
+        wc_status = e.find('wc-status')
+        revision = int(wc_status.get('revision', -1))
+        entries.append(StatusEntry(
+            path=e.get('path'),
+            item=wc_status.get('item'),
+            props=wc_status.get('props'),
+            revision=revision if revision >= 0 else None
+        ))
+    return entries
+
+
+# the four status columns of an `svn update` item line, then the path
+_RE_UPDATE_ITEM = re.compile(r'([ADUCGER ])([ UCG])([ B])([ C]) (.+)$')
+_RE_UPDATE_REVISION = re.compile(r'(Updated to|At|Updated external to|External at) revision (\d+)\.$')
+_RE_UPDATE_TARGET = re.compile(r"(Updating|Fetching external item into) '(.*)':$")
+
+
+def _iter_update_events(lines: Iterable[str],
+                        target: Optional[str] = None) -> Iterator[Union[UpdateEvent, UpdateRevision]]:
+    """Events of the lines of `svn update` output; `target` is the path of a single target."""
+    external = None
+    for line in lines:
+        match = _RE_UPDATE_ITEM.match(line)
+        if match is not None and not line.startswith('    '):
+            action, property_action, lock, tree = match.group(1, 2, 3, 4)
+            yield UpdateEvent(path=match.group(5),
+                              action=UpdateAction(action) if action != ' ' else None,
+                              property_action=UpdateAction(property_action) if property_action != ' ' else None,
+                              lock_broken=lock == 'B', tree_conflict=tree == 'C')
+            continue
+        match = _RE_UPDATE_REVISION.match(line)
+        if match is not None:
+            is_external = match.group(1) in ('Updated external to', 'External at')
+            yield UpdateRevision(revision=int(match.group(2)), path=external if is_external else target,
+                                 external=is_external)
+            continue
+        match = _RE_UPDATE_TARGET.match(line)
+        if match is not None:
+            if match.group(1) == 'Updating':
+                target = match.group(2)
+            else:
+                external = match.group(2)
+
+
+def _local_path(path: str) -> str:
+    """Relative file name for a working copy path or URL: `^/trunk/a.c` and `https://host/repo/trunk/a.c`
+    become `trunk/a.c` and `repo/trunk/a.c`.
+    """
+    if path.startswith('^/'):
+        path = path[2:]
+    elif _is_url(path):
+        from urllib.parse import urlsplit
+        path = unquote(urlsplit(path).path)
+    parts = [part for part in path.replace('\\', '/').split('/') if part not in ('', '.', '..')]
+    return os.path.join('', *parts)
+
+
+def _depth_arg(depth: Depth) -> str:
+    """Value of a `--depth` option; `Depth.EXCLUDE` is only for `update(set_depth=...)`."""
+    if depth == Depth.EXCLUDE:
+        raise ValueError('Depth.EXCLUDE can only be used with update(set_depth=...)')
+    return depth.value
+
+
+def _committed_revision(output: str) -> Optional[int]:
+    """Revision number of svn's `Committed revision N.` line, None if there is no such line
+    (nothing was committed, or svn's messages are translated).
+    """
+    match = re.search(r'^Committed revision (\d+)\.', output, re.MULTILINE)
+    return int(match.group(1)) if match else None
+
+
+def _resolve_repository_dir(repository_dir: str) -> str:
+    if not check_svn_installed():
+        raise SVNNotInstalledError(
+            'Is the command line svn client installed? If so, check that it\'s in path.')
+
+    repo_dir = pathlib.Path(repository_dir or os.getcwd())
+    if not repo_dir.exists():
+        raise RepositoryDirDoesNotExistError(
+            'the repository_dir provided does not exist')
+    if not repo_dir.is_dir():
+        raise NotADirectoryError(
+            'the repository_dir provided is not a directory')
+
+    return str(repo_dir.resolve())
+
+
+def _path_history(entries: List[LogEntry], path: str) -> List[LogEntry]:
+    """Entries (newest first, fetched with `verbose`) that changed a repository
+    path or anything below it, following the path back through copies like
+    `svn log` does.
+    """
+    history: List[LogEntry] = []
+    copied_from = None
+    prefix = path.rstrip('/') + '/'
+    for entry in entries:
+        if copied_from is not None and entry.revision > copied_from:
+            continue
+
+        matched = False
+        created = None
+        for changed in sorted(entry.paths or [], key=lambda p: len(p.path)):
+            if changed.path == path or changed.path.startswith(prefix):
+                matched = True
+            if changed.action in ('A', 'R') and (changed.path == path or path.startswith(changed.path + '/')):
+                matched = True
+                created = changed
+        if matched:
+            history.append(entry)
+
+        if created is not None:
+            # the node was created here; continue with the path it was copied from, if any
+            if not created.copyfrom_path:
+                break
+            path = created.copyfrom_path + path[len(created.path):]
+            prefix = path.rstrip('/') + '/'
+            copied_from = created.copyfrom_revision
+    return history
+
+
+def _info_from_element(e: 'xml.etree.ElementTree.Element') -> Info:
+    url = e.findtext('url')
+    root = e.findtext('repository/root')
+    relative_url = e.findtext('relative-url')
+    if relative_url is None and url and root:
+        relative_url = '^' + url[len(root):]
+
+    commit = e.find('commit')
+    last_changed_revision = None
+    if commit is not None and commit.get('revision'):
+        last_changed_revision = int(commit.get('revision'))
+
+    return Info(
+        path=e.get('path'),
+        kind=e.get('kind'),
+        revision=int(e.get('revision')) if e.get('revision') else None,
+        url=url,
+        relative_url=relative_url,
+        repository_root=root,
+        uuid=e.findtext('repository/uuid'),
+        last_changed_revision=last_changed_revision,
+        last_changed_author=e.findtext('commit/author'),
+        last_changed_date=parse_svn_date(e.findtext('commit/date'))
+    )
+
+
+
+# a partitioned log is split into at least this many ranges per worker, so
+# that dense ranges don't leave the other workers idle...
+PARTITIONS_PER_WORKER = 4
+# ...and into ranges of at most this many revisions, which bounds the entries held at once
+PARTITION_SIZE = 5000
+PARTITION_ATTEMPTS = 3
+# bytes `cat` reads from svn at once
+CAT_CHUNK_SIZE = 2 ** 16
 
 
 class Client:
@@ -21,136 +374,1027 @@ class Client:
     Subversion is a tool for version control.
     For additional information, see [the subversion website](http://subversion.apache.org/)
     """
-    def __init__(self, repository_dir: str = os.getcwd()) -> None:
+    def __init__(self, repository_dir: str = None, log_cache: 'LogCache' = None,
+                 retry_policy: RetryPolicy = None, timeout: float = None, use_bindings: bool = False,
+                 blame_cache: 'BlameCache' = None, use_wc_db: bool = True, query_cache: 'QueryCache' = None) -> None:
         """# A command-line SVN client.
         
         Subversion is a tool for version control.
         For additional information, see [the subversion website](http://subversion.apache.org/)
 
         Args:
-            repository_dir (str, optional): svn repository directory. Defaults to os.getcwd().
+            repository_dir (str, optional): svn repository directory. Defaults to the current directory.
+            log_cache (LogCache, optional): answer `log` queries from this cache, only asking svn
+                                            for revisions it has not seen yet. Defaults to None.
+            retry_policy (RetryPolicy, optional): how to retry commands that fail on a working copy
+                                                  lock. Defaults to `RetryPolicy()`.
+            timeout (float, optional): seconds an svn command may run before it is killed. Streaming
+                                       methods (`iter_log`) are not limited. Defaults to None.
+            use_bindings (bool, optional): serve `log`, `info`, `diff` and `update` in-process through the
+                                           Subversion Python bindings when they are installed, falling back
+                                           to the svn command otherwise. Defaults to False.
+            blame_cache (BlameCache, optional): reuse `blame` results for files that have not changed
+                                                since they were last annotated. Defaults to None.
+            use_wc_db (bool, optional): answer `info` of working copy paths and `status(quiet=True)` by
+                                        reading the working copy database (`.svn/wc.db`) when its format
+                                        is known, asking svn only about what it can't settle. Defaults to True.
+            query_cache (QueryCache, optional): reuse the results of `log` and `diff` queries between numeric
+                                                revisions, and of those reaching `HEAD` until `HEAD` moves.
+                                                Defaults to None.
 
         Raises:
             SVNNotInstalledError: svn command line client is not installed.
             RepositoryDirDoesNotExistError: repository_dir provided does not exist.
             NotADirectoryError: reposiory_dir provided is not a directory.
         """
-        if not check_svn_installed():
-            raise SVNNotInstalledError(
-                'Is the command line svn client installed? If so, check that it\'s in path.')
+        self.cwd = _resolve_repository_dir(repository_dir)
+        self.log_cache = log_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self.blame_cache = blame_cache
+        self.use_wc_db = use_wc_db
+        self.query_cache = query_cache
+        self._wc_info: Info = None
+        self._bindings = None
+        if use_bindings:
+            from pysvn import bindings
+            if bindings.BINDINGS_AVAILABLE:
+                self._bindings = bindings.BindingsBackend(self.cwd)
+
+
+    def log(self, file: Union[str, List[str]] = None, revision: Union[int, Revision, str] = 'HEAD:1', limit: int = None,
+            verbose: bool = False, columnar: bool = False,
+            partitions: int = None) -> Union[List[LogEntry], Dict[str, List[LogEntry]], 'LogBatch', Dict[str, 'LogBatch']]:
+        """## Show the log messages for a set of revision(s) and/or path(s).
 
-        repo_dir = pathlib.Path(repository_dir)
-        if not repo_dir.exists():
-            raise RepositoryDirDoesNotExistError(
-                'the repository_dir provided does not exist')
-        if not repo_dir.is_dir():
-            raise NotADirectoryError(
-                'the repository_dir provided is not a directory')
+        Examples:
+            `svn.log()`\n
+            `svn.log('foo.txt', revision='1:3')`\n
+            `svn.log(['foo.txt', 'bar/baz.c'])['foo.txt']`\n
+            `svn.log(columnar=True).revisions`
 
-        self.cwd = str(repo_dir.resolve())
+        When `file` is a list, the logs of all the paths are fetched with a
+        single svn call and a mapping from each path to its log entries is
+        returned.
 
+        With `columnar`, the log is returned as a `LogBatch`: one array per
+        field instead of one `LogEntry` per revision, built without creating
+        the entries, which saves most of the memory and time of long histories.
 
-    def log(self, file: str = None, revision: Union[int, Revision, str] = 'HEAD:1') -> List[LogEntry]:
-        """## Show the log messages for a set of revision(s) and/or path(s).
+        With `partitions`, a numeric revision range is fetched by that many
+        svn processes at once (see `iter_log`).
+
+        Args:
+            file (str | List[str], optional): file(s) to get logs for. Defaults to None.
+            revision (int | Revision | str, optional): revision. Defaults to `HEAD:1`.
+            limit (int, optional): maximum number of log entries. Defaults to None.
+            verbose (bool, optional): also fetch the paths changed by each revision. Defaults to False.
+            columnar (bool, optional): return a `LogBatch` (not with `verbose`). Defaults to False.
+            partitions (int, optional): number of svn processes fetching parts of the range in parallel
+                                        (not with a list of files). Defaults to None.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+            RevisionSyntaxError: invalid revision syntax when providing a str.
+            ValueError: `columnar` and `verbose` together, or `partitions` with a list of files.
+
+        Returns:
+            List[LogEntry] | Dict[str, List[LogEntry]] | LogBatch | Dict[str, LogBatch]: log entries, or log entries
+                                                                                        per file when `file` is a list.
+        """
+        if partitions and type(file) == list:
+            raise ValueError('partitions needs a single file')
+        if columnar and verbose:
+            raise ValueError('columnar logs do not hold changed paths, use verbose=False')
+        key = ('log', tuple(file) if type(file) == list else file, _parse_revision_range(revision), limit, verbose,
+               columnar)
+        return self._memoized(key, key[2], lambda: self._log(file, revision, limit, verbose, columnar, partitions))
+
+
+    def _log(self, file: Union[str, List[str]], revision: Union[int, Revision, str], limit: int, verbose: bool,
+             columnar: bool, partitions: int) -> Union[List[LogEntry], Dict[str, List[LogEntry]], 'LogBatch',
+                                                       Dict[str, 'LogBatch']]:
+        if columnar:
+            from pysvn.columnar import LogBatch
+            if type(file) == list:
+                return {path: LogBatch.from_entries(entries)
+                        for path, entries in self._log_many(file, revision, limit).items()}
+            return self._log_batch(file, revision, limit, partitions)
+
+        if type(file) == list:
+            return self._log_many(file, revision, limit, verbose)
+        return list(self.iter_log(file, revision, limit, verbose, partitions))
+
+
+    def _log_batch(self, file: str, revision: Union[int, Revision, str], limit: int = None,
+                   partitions: int = None) -> 'LogBatch':
+        from pysvn.columnar import LogBatch
+        revision_range = _parse_revision_range(revision)
+        if revision_range and (self.log_cache is not None or self._bindings is not None or partitions):
+            # entries come from the cache, the bindings or several svn processes, not from one xml stream
+            return LogBatch.from_entries(self.iter_log(file, revision, limit, partitions=partitions))
+
+        import xml.etree.ElementTree
+        batch = LogBatch()
+        with self._stream_svn_cmd(self._log_args(file, revision, limit)) as stdout:
+            parser = _LogEntryParser(batch.append_element)
+            try:
+                for chunk in iter(lambda: stdout.read1(65536), b''):
+                    parser.feed(chunk)
+                parser.close()
+            except xml.etree.ElementTree.ParseError as e:
+                raise xml.etree.ElementTree.ParseError(f'parsing error: {e}')
+        return batch
+
+
+    def _log_many(self, files: List[str], revision: Union[int, Revision, str], limit: int = None,
+                  verbose: bool = False) -> Dict[str, List[LogEntry]]:
+        revision_range = _parse_revision_range(revision)
+        if self.log_cache is not None and revision_range:
+            info = self._working_copy_info()
+            start, end = self._cached_log_range(info, revision_range)
+            return {file: list(self.log_cache.entries(info.uuid, start, end, path=self._repository_path(file, info),
+                                                      limit=limit, verbose=verbose))
+                    for file in files}
+        if self._bindings is not None or len(files) < 2:
+            # nothing to gain from merging in-process queries
+            return {file: list(self._iter_svn_log(file, revision, limit, verbose)) for file in files}
+
+        # `svn log URL PATH...` logs several paths in one go, as long as they all exist at HEAD
+        info = self._working_copy_info()
+        repository_paths = {file: self._repository_path(file, info) for file in files}
+        targets = [info.repository_root]
+        targets.extend(sorted({path.lstrip('/') or '.' for path in repository_paths.values()}))
+        try:
+            with targets_file(targets) as targets_path:
+                log_cmd = self._log_args(None, revision, verbose=True) + ['--targets', targets_path]
+                entries = list(self._iter_log_output(log_cmd))
+        except SVNError:
+            return {file: list(self._iter_svn_log(file, revision, limit, verbose)) for file in files}
+
+        ascending = len(entries) > 1 and entries[0].revision < entries[-1].revision
+        if ascending:
+            entries.reverse()
+
+        logs: Dict[str, List[LogEntry]] = {}
+        for file, path in repository_paths.items():
+            history = _path_history(entries, path)
+            if ascending:
+                history.reverse()
+            logs[file] = history[:limit] if limit else history
+        if not verbose:
+            for entry in entries:
+                entry.paths = None
+        return logs
+
+
+    def iter_log(self, file: str = None, revision: Union[int, Revision, str] = 'HEAD:1', limit: int = None,
+                 verbose: bool = False, partitions: int = None) -> Iterator[LogEntry]:
+        """## Stream the log messages for a set of revision(s) and/or path(s).
+
+        Same as `log`, but the svn output is parsed incrementally and each
+        entry is yielded as soon as it arrives, so memory use does not grow
+        with the length of the history. Stopping the iteration early kills
+        the svn process.
+
+        With `partitions`, a range of numeric revisions (or `HEAD`) is split
+        into parts holding about as many of the path's revisions each (found
+        with a quick `svn log --quiet`), which `partitions` svn processes
+        fetch in parallel; a part that fails is retried on its own. Entries
+        still come out in the order of the range, a few parts ahead of the
+        caller. Other revisions (`BASE`, dates...), the log cache and the
+        bindings fetch the log in one go.
+
+        Examples:
+            `for entry in svn.iter_log(revision='HEAD:1'): ...`\n
+            `for entry in svn.iter_log(revision='HEAD:1', partitions=4): ...`
 
         Args:
             file (str, optional): file to get logs for. Defaults to None.
             revision (int | Revision | str, optional): revision. Defaults to `HEAD:1`.
+            limit (int, optional): maximum number of log entries. Defaults to None.
+            verbose (bool, optional): also fetch the paths changed by each revision. Defaults to False.
+            partitions (int, optional): number of svn processes fetching parts of the range in parallel.
+                                        Defaults to None.
 
         Raises:
             NoSuchRevisionError: unknown revision.
             RevisionSyntaxError: invalid revision syntax when providing a str.
 
+        Yields:
+            LogEntry: log entries, in the order svn reports them.
+        """
+        if self.log_cache is not None:
+            revision_range = _parse_revision_range(revision)
+            if revision_range:
+                yield from self._iter_cached_log(file, revision_range, limit, verbose)
+                return
+
+        if partitions and partitions > 1 and self._bindings is None:
+            revision_range = _parse_revision_range(revision)
+            if revision_range:
+                yield from self._iter_partitioned_log(file, revision_range, limit, verbose, partitions)
+                return
+
+        yield from self._iter_svn_log(file, revision, limit, verbose)
+
+
+    def _iter_partitioned_log(self, file: str, revision_range: Tuple[Union[int, str], Union[int, str]],
+                              limit: int, verbose: bool, partitions: int) -> Iterator[LogEntry]:
+        def fetch(part: str) -> List[LogEntry]:
+            for attempt in range(1, PARTITION_ATTEMPTS + 1):
+                try:
+                    return list(self._iter_log_output(self._log_args(file, part, verbose=verbose)))
+                except (SVNError, CommandTimeoutError):
+                    if attempt == PARTITION_ATTEMPTS:
+                        raise
+
+        parts = self._log_partitions(file, revision_range, limit, partitions)
+        for _, entries in iter_ordered(fetch, parts, max_workers=partitions):
+            yield from entries
+
+
+    def _log_partitions(self, file: str, revision_range: Tuple[Union[int, str], Union[int, str]], limit: int,
+                        partitions: int) -> List[str]:
+        """Split a revision range into ranges (`'hi:lo'` or `'lo:hi'`, in the
+        direction of the range) holding about as many of the path's revisions each.
+        """
+        from array import array
+        import xml.etree.ElementTree
+        start, end = revision_range
+        revisions = array('q')
+        with self._stream_svn_cmd(self._log_args(file, f'{start}:{end}', limit) + ['--quiet']) as stdout:
+            # only the revision numbers are needed
+            parser = _LogEntryParser(lambda e: int(e.get('revision')))
+            try:
+                for chunk in iter(lambda: stdout.read1(65536), b''):
+                    revisions.extend(parser.feed(chunk))
+                revisions.extend(parser.close())
+            except xml.etree.ElementTree.ParseError as e:
+                raise xml.etree.ElementTree.ParseError(f'parsing error: {e}')
+
+        if not revisions:
+            # the path didn't change in the range
+            return []
+        # the probe may find fewer revisions than partitions, but never less than one part
+        count = max(1, min(len(revisions), max(partitions * PARTITIONS_PER_WORKER,
+                                               -(-len(revisions) // PARTITION_SIZE))))
+        bounds = [len(revisions) * i // count for i in range(count + 1)]
+        return [f'{revisions[low]}:{revisions[high - 1]}' for low, high in zip(bounds, bounds[1:])]
+
+
+    def _iter_svn_log(self, file: str, revision: Union[int, Revision, str], limit: int = None,
+                      verbose: bool = False) -> Iterator[LogEntry]:
+        revision_range = _parse_revision_range(revision)
+        if self._bindings is not None and revision_range:
+            info = self._working_copy_info()
+            start, end = revision_range
+            yield from self._bindings.log(info.repository_root, self._repository_path(file or '.', info),
+                                          start, end, limit, verbose)
+            return
+
+        yield from self._iter_log_output(self._log_args(file, revision, limit, verbose))
+
+
+    def _iter_log_output(self, log_cmd: List[str]) -> Iterator[LogEntry]:
+        import xml.etree.ElementTree
+        with self._stream_svn_cmd(log_cmd) as stdout:
+            parser = _LogEntryParser()
+            try:
+                for chunk in iter(lambda: stdout.read1(65536), b''):
+                    yield from parser.feed(chunk)
+                yield from parser.close()
+            except xml.etree.ElementTree.ParseError as e:
+                raise xml.etree.ElementTree.ParseError(f'parsing error: {e}')
+
+
+    def log_pages(self, file: str = None, page_size: int = 50, after: int = None, end: int = 1) -> LogCursor:
+        """## Page through the log messages, newest first.
+
+        Each page is fetched with its own `svn log --limit` call, so the
+        cost of a page depends on `page_size` rather than on the age of
+        the repository. The cursor remembers the last revision returned;
+        store `cursor.last_revision` and pass it back as `after` to resume.
+
+        Examples:
+            `svn.log_pages(file='foo.txt', page_size=50).next_page()`\n
+            `for page in svn.log_pages(after=1200): ...`
+
+        Args:
+            file (str, optional): file to get logs for. Defaults to None.
+            page_size (int, optional): number of log entries per page. Defaults to 50.
+            after (int, optional): only return revisions older than this one. Defaults to None (start at `HEAD`).
+            end (int, optional): oldest revision to return. Defaults to 1.
+
         Returns:
-            List[LogEntry]: list of log entries.
+            LogCursor: cursor over the pages.
         """
-        revision = revision.name if type(revision) == Revision else revision
+        return LogCursor(self, file=file, page_size=page_size, after=after, end=end)
+
+
+    def _iter_cached_log(self, file: str, revision_range: Tuple[Union[int, str], Union[int, str]],
+                         limit: int = None, verbose: bool = False) -> Iterator[LogEntry]:
+        info = self._working_copy_info()
+        start, end = self._cached_log_range(info, revision_range)
+
+        # like svn, log the working copy directory itself when no file is given
+        path = self._repository_path(file or '.', info)
+        yield from self.log_cache.entries(info.uuid, start, end, path=path, limit=limit, verbose=verbose)
+
+
+    def _cached_log_range(self, info: Info, revision_range: Tuple[Union[int, str], Union[int, str]]) -> Tuple[int, int]:
+        """Make sure the log cache covers a revision range, and resolve `HEAD` in it."""
+        start, end = revision_range
+
+        up_to_date = (type(start) == int and type(end) == int
+                      and max(start, end) <= self.log_cache.highest_revision(info.uuid)
+                      and not self.log_cache.missing_ranges(info.uuid))
+        if not up_to_date:
+            head = self._sync_log_cache(info)
+            start = head if start == 'HEAD' else start
+            end = head if end == 'HEAD' else end
+            for r in (start, end):
+                if r > head:
+                    raise NoSuchRevisionError(f'no such revision {r}')
+        return start, end
+
+
+    def _sync_log_cache(self, info: Info) -> int:
+        """Fetch every revision the log cache is missing, returns the `HEAD` revision."""
+        head = self.info(info.repository_root, revision=Revision.HEAD).revision
+        ranges = self.log_cache.missing_ranges(info.uuid)
+        highest = self.log_cache.highest_revision(info.uuid)
+        if highest < head:
+            ranges.append((highest + 1, head))
+
+        for start, end in ranges:
+            entries = self._iter_svn_log(info.repository_root, f'{start}:{end}', verbose=True)
+            self.log_cache.store(info.uuid, entries)
+        return head
+
+
+    def invalidate_log_cache(self, revisions: List[int] = None) -> None:
+        """## Drop revisions from the log cache, e.g. after their log message was edited.
+
+        Args:
+            revisions (List[int], optional): revisions to drop. Defaults to None (all of them).
+        """
+        if self.log_cache is not None:
+            self.log_cache.invalidate(self._working_copy_info().uuid, revisions)
+
+
+    def info(self, path: str = None, revision: Union[int, Revision, str] = None) -> Info:
+        """## Display information about a local or remote item.
+
+        Examples:
+            `svn.info()`\n
+            `svn.info('foo.txt')`\n
+            `svn.info('^/trunk', revision=Revision.HEAD)`
+
+        Args:
+            path (str, optional): working copy path or URL. Defaults to the working copy.
+            revision (int | Revision | str, optional): revision. Defaults to None.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Returns:
+            Info: information about the item.
+        """
+        if self.use_wc_db and revision is None and not _is_url(path):
+            info = self._wc_db_info(path)
+            if info is not None:
+                return info
+        if self._bindings is not None and not (path or '').startswith('^/'):
+            return self._bindings.info(path, revision)
+        return self._execute(self._info_args(path, revision), _info_from_xml)
+
+
+    def _wc_db_info(self, path: str = None) -> Optional[Info]:
+        import sqlite3
+        from pysvn.wc import WorkingCopyDB
+        target = os.path.join(self.cwd, path or '')
+        db = WorkingCopyDB.find(target)
+        if db is None:
+            return None
+        try:
+            relpath = db.relpath(target)
+            info = db.info(relpath) if relpath is not None else None
+        except sqlite3.Error:
+            return None
+        finally:
+            db.close()
+        if info is not None:
+            info.path = path or '.'
+        return info
+
+
+    @property
+    def capabilities(self) -> SVNCapabilities:
+        """Version of the installed svn and the options it supports, probed once per process."""
+        return svn_capabilities()
+
+
+    def _require(self, supported: bool, option: str) -> None:
+        if not supported:
+            version = '.'.join(str(part) for part in self.capabilities.version)
+            raise UnsupportedOptionError(f'svn {version} does not support {option}')
+
+
+    def _memoized(self, key: Tuple, revision_range: Optional[Tuple[Union[int, str], Union[int, str]]],
+                  query: Callable[[], Any]) -> Any:
+        """Answer a query from the query cache if its revisions are numeric or `HEAD`, else run it."""
+        if self.query_cache is None or revision_range is None:
+            return query()
+        key = (self.cwd, *key)
+        head = None
+        if 'HEAD' in revision_range:
+            head = self.query_cache.head(self._working_copy_info().repository_root, self._youngest_revision)
+        result = self.query_cache.get(key, head)
+        if result is None:
+            result = query()
+            self.query_cache.put(key, result, head)
+        return result
+
+
+    def _youngest_revision(self) -> int:
+        root = self._working_copy_info().repository_root
+        if self.capabilities.show_item:
+            return int(self._execute(['info', '--show-item', 'revision', root]))
+        return self.info(root, revision=Revision.HEAD).revision
+
+
+    def _working_copy_info(self) -> Info:
+        if self._wc_info is None:
+            self._wc_info = self.info()
+        return self._wc_info
+
+
+    def _repository_path(self, file: str, info: Info) -> str:
+        """Path of a working copy file or URL inside the repository, e.g. `/trunk/foo.txt`."""
+        if file.startswith('^/'):
+            return posixpath.normpath(file[1:])
+        if file.startswith(info.repository_root):
+            return posixpath.normpath('/' + unquote(file[len(info.repository_root):]))
+        if os.path.isabs(file):
+            file = os.path.relpath(file, self.cwd)
+        base = unquote(info.relative_url[1:]) or '/'
+        return posixpath.normpath(posixpath.join(base, file.replace(os.sep, '/')))
+
+
+    @staticmethod
+    def _info_args(path: str = None, revision: Union[int, Revision, str] = None) -> List[str]:
+        info_cmd = ['info', '--xml']
+        if path:
+            info_cmd.append(path)
+        if revision is not None:
+            info_cmd.extend(['--revision', _revision_str(revision)])
+        return info_cmd
+
+
+    @staticmethod
+    def _log_args(file: str, revision: Union[int, Revision, str], limit: int = None, verbose: bool = False) -> List[str]:
+        revision = _revision_str(revision)
         if not file:
             log_cmd = ['log', '--xml', '--revision', revision]
         else:
             log_cmd = ['log', file, '--xml', '--revision', revision]
-        log_entries: List[LogEntry] = []
-        cmd = self._run_svn_cmd(log_cmd)
-        data, stderr = get_output(cmd)
+        if limit:
+            log_cmd.extend(['--limit', str(limit)])
+        if verbose:
+            log_cmd.append('--verbose')
+        return log_cmd
+
+
+    def _run_svn_cmd(self, args: List[str], stdout: Union[int, IO[bytes]] = subprocess.PIPE) -> Popen:
+        return subprocess.Popen(['svn', *args], stdout=stdout, stderr=subprocess.PIPE, cwd=self.cwd)
+
+
+    def _execute_to_file(self, args: List[str], file: IO[bytes]) -> None:
+        """Run an svn command to completion with its stdout going straight into
+        a file, without passing through Python.
+        """
+        with instrumentation.command(args, self.cwd) as event:
+            with event.phase('spawn'):
+                cmd = self._run_svn_cmd(args, stdout=file)
+            with event.phase('wait'):
+                try:
+                    _, stderr = cmd.communicate(timeout=self.timeout)
+                except subprocess.TimeoutExpired:
+                    cmd.kill()
+                    cmd.communicate()
+                    raise CommandTimeoutError(f'svn {args[0]} did not finish within {self.timeout} seconds')
+            event.returncode = cmd.returncode
+            self._raise_stream_error(stderr, event)
+
+
+    def _execute(self, args: List[str], parse: Callable[[str], Any] = None) -> Any:
+        """Run an svn command to completion and return its stdout, or what
+        `parse` makes of it.
+
+        Commands that fail because the working copy is locked by another
+        operation are retried according to `retry_policy`. Each attempt is
+        reported to the `pysvn.instrumentation` listeners.
+        """
+        def run() -> Any:
+            with instrumentation.command(args, self.cwd) as event:
+                with event.phase('spawn'):
+                    cmd = self._run_svn_cmd(args)
+                with event.phase('wait'):
+                    stdout, stderr = capture_output(cmd, self.timeout)
+                with stdout:
+                    event.returncode = cmd.returncode
+                    event.stdout_bytes, event.stderr_bytes = len(stdout), len(stderr)
+                    if stderr:
+                        handle_stderr(stderr.decode(output_encoding(), 'replace').strip())
+                    if parse is None:
+                        with event.phase('decode'):
+                            return stdout.text()
+                    with event.phase('parse'):
+                        return parse(stdout)
+
+        return self.retry_policy.call(run)
+
+
+    @contextmanager
+    def _stream_svn_cmd(self, args: List[str], drain: bool = False) -> Iterator[IO[bytes]]:
+        """Run an svn command and hand its stdout pipe to the caller for streaming.
+
+        The process is killed if the caller stops reading early, or with
+        `drain`, left to finish while the rest of its output is discarded.
+        svn's stderr is mapped to the matching error once the output is
+        consumed.
+        """
+        with instrumentation.command(args, self.cwd) as event:
+            with event.phase('spawn'):
+                cmd = self._run_svn_cmd(args)
+            stderr = StderrDrain(cmd.stderr)
+            start = time.perf_counter()
+            try:
+                yield instrumentation.TimedReader(cmd.stdout, event) if instrumentation.enabled() else cmd.stdout
+            except Exception:
+                # svn stops writing when it fails, which usually shows up here as a
+                # parse error. Prefer the error svn reported, if there is one.
+                self._stop_stream(cmd, drain)
+                self._raise_stream_error(stderr.result(), event)
+                raise
+            else:
+                cmd.wait()
+                self._raise_stream_error(stderr.result(), event)
+            finally:
+                if cmd.poll() is None:
+                    # the caller stopped early
+                    self._stop_stream(cmd, drain)
+                event.returncode = cmd.wait()
+                stderr.result()
+                cmd.stdout.close()
+                cmd.stderr.close()
+                # the time the caller held the stream without waiting on it
+                event.phases['parse'] = max(0., time.perf_counter() - start - event.phases.get('wait', 0.))
+
+
+    @staticmethod
+    def _stop_stream(cmd: Popen, drain: bool) -> None:
+        if drain:
+            # killing svn in the middle of a working copy operation would leave it locked
+            while cmd.stdout.read(65536):
+                pass
+        else:
+            cmd.kill()
+        cmd.wait()
+
 
+    @staticmethod
+    def _raise_stream_error(stderr: bytes, event: 'instrumentation.CommandEvent') -> None:
+        event.stderr_bytes = len(stderr)
         if stderr:
-            handle_stderr(stderr)
+            handle_stderr(stderr.decode(output_encoding(), 'replace').strip())
 
-        try:
-            root = xml.etree.ElementTree.fromstring(data)
 
-            for e in root.iter('logentry'):
-                entry_info = {x.tag: x.text for x in list(e)}
+    def __svn_update__(self) -> None:
+        if self._bindings is not None:
+            self._bindings.update()
+        else:
+            self._execute(['update'])
+
+
+    def diff(self, start_revision: int, end_revision: int = None, update: bool = False) -> Diff:
+        """## Display local changes or differences between two revisions or paths.
+
+        The diff is computed in the repository, between the working copy's
+        URL at both revisions, so the working copy is neither modified nor
+        locked.
+
+        Args:
+            start_revision (int): starting revision
+            end_revision (int, optional): ending revision. Defaults to `HEAD`.
+            update (bool, optional): update the working copy first. Defaults to False.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
 
-                date = None
-                if entry_info.get('date'):
-                    date_str = entry_info.get('date').split('.', 1)[0]
-                    date = datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S')
+        Returns:
+            Diff: diff between starting and ending revisions.
+        """
+        if update:
+            self.__svn_update__()
 
-                log_entry = LogEntry(
-                    message=entry_info.get('msg'),
-                    author=entry_info.get('author'),
-                    revision=int(e.get('revision')),
-                    date=date
-                )
+        url = self._working_copy_info().url
+        revision_range = _parse_revision_range(f'{start_revision}:{end_revision or "HEAD"}')
+        return self._memoized(('diff', url, revision_range), revision_range,
+                              lambda: self._diff(url, start_revision, end_revision))
 
-                log_entries.append(log_entry)
 
-            return log_entries
-        except xml.etree.ElementTree.ParseError as e:
-            raise xml.etree.ElementTree.ParseError(f'parsing error: {e}')
+    def _diff(self, url: str, start_revision: int, end_revision: int = None) -> Diff:
+        if self._bindings is not None:
+            return self._bindings.diff_summarize(url, start_revision, end_revision)
+        return self._execute(self._diff_args(url, start_revision, end_revision), lambda data: _diff_from_xml(data, url))
 
 
-    def _run_svn_cmd(self, args: List[str]) -> Popen:
-        args.insert(0, 'svn')
-        time.sleep(.5)
-        return subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=self.cwd)
+    @staticmethod
+    def _diff_args(url: str, start_revision: int, end_revision: int = None) -> List[str]:
+        if not end_revision:
+            end_revision = 'HEAD'
+        return ['diff', '--xml', '--summarize', f'--old={url}@{start_revision}', f'--new={url}@{end_revision}']
 
 
-    def __svn_update__(self) -> None:
-        self._run_svn_cmd(['update'])
+    def iter_diff(self, start_revision: int, end_revision: int = None, path: str = None) -> Iterator[FileDiff]:
+        """## Stream the full differences between two revisions, one file at a time.
 
+        The svn output is parsed as it arrives and each `FileDiff` (with its
+        hunks) is yielded once the file is complete, so the whole patch is
+        never held in memory. Binary files are yielded without hunks.
+        Stopping the iteration early kills the svn process. Like `diff`, it
+        runs against the repository and never touches the working copy.
 
-    def diff(self, start_revision: int, end_revision: int = None) -> Diff:
-        """## Display local changes or differences between two revisions or paths.
+        Example:
+            `for file_diff in svn.iter_diff(3, 4): ...`
 
         Args:
             start_revision (int): starting revision
             end_revision (int, optional): ending revision. Defaults to `HEAD`.
+            path (str, optional): only diff this path. Defaults to None.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Yields:
+            FileDiff: per-file differences.
+        """
+        from pysvn.unidiff import iter_file_diffs
+        url = self._working_copy_info().url
+        with self._stream_svn_cmd(self._unified_diff_args(url, start_revision, end_revision, path)) as stdout:
+            for file_diff in iter_file_diffs(stdout, output_encoding()):
+                file_diff.path = _relative_to(url, file_diff.path)
+                yield file_diff
+
+
+    def numstat(self, start_revision: int, end_revision: int = None, path: str = None) -> List[NumStat]:
+        """## Count the lines added and removed per file between two revisions.
+
+        The diff is streamed and only the counts are kept. Binary files are
+        reported with `binary=True` and no counts.
+
+        Example:
+            `sum(stat.added or 0 for stat in svn.numstat(3, 4))`
+
+        Args:
+            start_revision (int): starting revision
+            end_revision (int, optional): ending revision. Defaults to `HEAD`.
+            path (str, optional): only diff this path. Defaults to None.
 
         Raises:
             NoSuchRevisionError: unknown revision.
 
         Returns:
-            Diff: diff between starting and ending revisions.
+            List[NumStat]: line counts per file.
         """
-        self.__svn_update__()
+        from pysvn.unidiff import iter_numstat
+        url = self._working_copy_info().url
+        with self._stream_svn_cmd(self._unified_diff_args(url, start_revision, end_revision, path)) as stdout:
+            stats = list(iter_numstat(stdout, output_encoding()))
+        for stat in stats:
+            stat.path = _relative_to(url, stat.path)
+        return stats
+
+
+    def iter_churn(self, start_revision: int = 1, end_revision: int = None, path: str = None,
+                   max_workers: int = 4) -> Iterator[RevisionChurn]:
+        """## Stream the changed files and line counts of every revision in a range.
+
+        The changed paths come from one streamed `svn log --verbose`; the
+        line counts of each revision from `svn diff -c`, run on
+        `max_workers` threads a few revisions ahead. Revisions are yielded
+        in ascending order, and only a bounded number are held at once.
+
+        Example:
+            `for revision in svn.iter_churn(1000, 2000): ...`
+
+        Args:
+            start_revision (int, optional): first revision. Defaults to 1.
+            end_revision (int, optional): last revision. Defaults to `HEAD`.
+            path (str, optional): only count changes below this path. Defaults to the working copy.
+            max_workers (int, optional): revisions diffed at once. Defaults to 4.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Yields:
+            RevisionChurn: changed files (relative to `path`) and their line counts per revision. `stats`
+                           is None when svn could not diff the revision.
+        """
+        from pysvn.analytics import iter_revision_churn
+        info = self._working_copy_info()
+        root = self._repository_path(path or '.', info)
+        url = info.repository_root + quote(root if root != '/' else '')
+        entries = self.iter_log(path, revision=f'{start_revision}:{end_revision or "HEAD"}', verbose=True)
+        yield from iter_revision_churn(entries, root, lambda revision: self._change_numstat(url, revision),
+                                       max_workers)
+
+
+    def churn(self, start_revision: int = 1, end_revision: int = None, path: str = None,
+              max_workers: int = 4) -> 'ChurnReport':
+        """## Count commits, changed lines and authors per file and directory over a revision range.
+
+        Examples:
+            `svn.churn(1000).hotspots(10, by='churn')`\n
+            `svn.churn(path='core').hotspots(by='authors', directories=True)`
+
+        Args:
+            start_revision (int, optional): first revision. Defaults to 1.
+            end_revision (int, optional): last revision. Defaults to `HEAD`.
+            path (str, optional): only count changes below this path. Defaults to the working copy.
+            max_workers (int, optional): revisions diffed at once. Defaults to 4.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
 
+        Returns:
+            ChurnReport: totals per file and directory, with their `hotspots`.
+        """
+        from pysvn.analytics import ChurnReport
+        report = ChurnReport()
+        for revision in self.iter_churn(start_revision, end_revision, path, max_workers):
+            report.add(revision)
+        return report
+
+
+    def _change_numstat(self, url: str, revision: int) -> Optional[List[NumStat]]:
+        from pysvn.unidiff import iter_numstat
+        try:
+            with self._stream_svn_cmd(['diff', '--internal-diff', '-c', str(revision), f'{url}@{revision}']) as stdout:
+                stats = list(iter_numstat(stdout, output_encoding()))
+        except SVNError:
+            # e.g. `url` did not exist before the revision
+            return None
+        for stat in stats:
+            stat.path = _relative_to(url, stat.path)
+        return stats
+
+
+    @staticmethod
+    def _unified_diff_args(url: str, start_revision: int, end_revision: int = None, path: str = None) -> List[str]:
         if not end_revision:
             end_revision = 'HEAD'
+        diff_cmd = ['diff', '--internal-diff', f'--old={url}@{start_revision}', f'--new={url}@{end_revision}']
+        if path:
+            # relative to both --old and --new
+            diff_cmd.append(path.replace(os.sep, '/'))
+        return diff_cmd
 
-        cmd = self._run_svn_cmd(
-            ['diff', '-r', f'{start_revision}:{end_revision}', '--xml', '--summarize'])
-        data, stderr = get_output(cmd)
 
-        if stderr:
-            handle_stderr(stderr)
+    def blame(self, path: str, revision: Union[int, Revision, str] = None) -> List[BlameLine]:
+        """## Show the revision and author of each line of a file.
+
+        With a `blame_cache`, the file's last changed revision is looked up
+        first (`svn info`), and the annotation is reused if the file hasn't
+        changed since it was cached. Working copy files with local changes
+        are always annotated by svn, as they are without a cache.
+
+        Examples:
+            `svn.blame('foo.txt')`\n
+            `svn.blame('foo.txt', revision=42)`
+
+        Args:
+            path (str): file (working copy path or URL) to annotate.
+            revision (int | Revision | str, optional): revision. Defaults to None (the working file,
+                                                       local changes included, for working copy paths,
+                                                       `HEAD` for URLs).
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Returns:
+            List[BlameLine]: one record per line of the file, lines changed locally have no revision.
+        """
+        if (self.blame_cache is None
+                or revision is None and not _is_url(path) and self.status(path, quiet=True)):
+            # local changes aren't in the repository, only svn can annotate them
+            blame_cmd = ['blame', '--xml', path]
+            if revision is not None:
+                blame_cmd.extend(['--revision', _revision_str(revision)])
+            return self._execute(blame_cmd, _blame_from_xml)
+
+        info = self.info(path, revision)
+        key = (info.uuid, unquote(info.relative_url[1:]), info.last_changed_revision)
+        lines = self.blame_cache.get(key)
+        if lines is None:
+            lines = self._execute(['blame', '--xml', f'{info.url}@{info.last_changed_revision}'], _blame_from_xml)
+            self.blame_cache.put(key, lines)
+        return lines
+
+
+    def cat(self, path: str, revision: Union[int, Revision, str] = None,
+            chunk_size: int = CAT_CHUNK_SIZE) -> Iterator[bytes]:
+        """## Stream the contents of a file, as bytes.
+
+        The contents are never decoded, so binary files come out unchanged,
+        and are yielded in chunks as svn writes them. Stopping the iteration
+        early kills the svn process.
+
+        Examples:
+            `b''.join(svn.cat('logo.png'))`\n
+            `for chunk in svn.cat('^/trunk/big.bin', revision=42): ...`
+
+        Args:
+            path (str): file (working copy path or URL).
+            revision (int | Revision | str, optional): revision. Defaults to None (`BASE` for working
+                                                       copy paths, `HEAD` for URLs).
+            chunk_size (int, optional): most bytes per chunk. Defaults to 64 KiB.
 
-        paths: List[SVNItemPath] = []
-        root = xml.etree.ElementTree.fromstring(data)
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Yields:
+            bytes: the contents, chunk by chunk.
+        """
+        with self._stream_svn_cmd(self._cat_args(path, revision)) as stdout:
+            for chunk in iter(lambda: stdout.read1(chunk_size), b''):
+                yield chunk
+
+
+    def cat_to(self, path: str, out: Union[str, os.PathLike, IO[bytes]],
+               revision: Union[int, Revision, str] = None) -> int:
+        """## Write the contents of a file into a file or a binary buffer.
+
+        Given a file name, svn writes into the file directly and the
+        contents never pass through Python. Given an object with a `write`
+        method (an open binary file, `io.BytesIO`...), the contents are
+        copied into it through one reused buffer.
+
+        Examples:
+            `svn.cat_to('logo.png', 'build/logo.png')`\n
+            `svn.cat_to('^/trunk/data.bin', buffer, revision=42)`
+
+        Args:
+            path (str): file (working copy path or URL).
+            out (str | PathLike | IO[bytes]): file name to (over)write, or binary stream to write into.
+            revision (int | Revision | str, optional): revision. Defaults to None (`BASE` for working
+                                                       copy paths, `HEAD` for URLs).
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Returns:
+            int: number of bytes written
+        """
+        cat_cmd = self._cat_args(path, revision)
+        if not hasattr(out, 'write'):
+            with open(out, 'wb', buffering=0) as file:
+                self._execute_to_file(cat_cmd, file)
+                return os.fstat(file.fileno()).st_size
+
+        size = 0
+        buffer = bytearray(CAT_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with self._stream_svn_cmd(cat_cmd) as stdout:
+            for count in iter(lambda: stdout.readinto(buffer), 0):
+                out.write(view[:count])
+                size += count
+        return size
+
+
+    def cat_many(self, paths: Union[List[str], Dict[str, str]], destination: str = '.',
+                 revision: Union[int, Revision, str] = None, max_workers: int = 8) -> List[CatResult]:
+        """## Write the contents of many files at one revision into files.
+
+        Up to `max_workers` svn processes run at once, each writing straight
+        into its file (see `cat_to`). A path that fails does not stop the
+        others: its error is returned in its result, and its file is removed.
+
+        Examples:
+            `svn.cat_many(['lib/a.so', 'lib/b.so'], 'build', revision=42)`\n
+            `svn.cat_many({'^/trunk/a.bin': '/tmp/a.bin'})`
+
+        Args:
+            paths (List[str] | Dict[str, str]): files (working copy paths or URLs), or a mapping of
+                                                files to the file names to write them to.
+            destination (str, optional): directory a list of files is written into, each at its
+                                         path (URLs at their path on the server). Defaults to `'.'`.
+            revision (int | Revision | str, optional): revision of all the files. Defaults to None
+                                                       (`BASE` for working copy paths, `HEAD` for URLs).
+            max_workers (int, optional): svn processes at once. Defaults to 8.
+
+        Returns:
+            List[CatResult]: one per file, in the order of `paths`.
+        """
+        if not isinstance(paths, dict):
+            paths = {path: os.path.join(destination, _local_path(path)) for path in paths}
+
+        def fetch(path: str) -> CatResult:
+            result = CatResult(path=path, destination=paths[path])
+            try:
+                os.makedirs(os.path.dirname(result.destination) or '.', exist_ok=True)
+                result.size = self.cat_to(path, result.destination, revision)
+            except Exception as e:
+                result.error = e
+                with suppress(OSError):
+                    os.remove(result.destination)
+            return result
+
+        return [result for _, result in iter_ordered(fetch, list(paths), max_workers)]
+
+
+    @staticmethod
+    def _cat_args(path: str, revision: Union[int, Revision, str] = None) -> List[str]:
+        cat_cmd = ['cat', path]
+        if revision is not None:
+            cat_cmd.extend(['--revision', _revision_str(revision)])
+        return cat_cmd
+
+
+    def status(self, path: str = None, quiet: bool = False) -> List[StatusEntry]:
+        """## Print the status of working copy files and directories.
+
+        With `quiet`, only versioned items with local changes are reported,
+        which (with `use_wc_db`) is read straight from the working copy
+        database: files are compared with the size and timestamp svn
+        recorded for them, and svn is only asked about files whose
+        timestamp changed but not their size, conflicts, switched items and
+        files inside copies. Working copies in the middle of an operation,
+        with externals, or in a format this module doesn't know are handed
+        to svn as a whole.
+
+        Examples:
+            `svn.status()`\n
+            `svn.status('trunk', quiet=True)`
 
-        for e in root.iter('path'):
-            attrs = e.attrib
-            filepath = e.text
-            svn_path = SVNItemPath(
-                item=attrs.get('item'),
-                props=attrs.get('props'),
-                kind=attrs.get('kind'),
-                filepath=filepath
-            )
-            paths.append(svn_path)
+        Args:
+            path (str, optional): working copy path. Defaults to the working copy.
+            quiet (bool, optional): don't report unversioned or unmodified items. Defaults to False.
 
-        return Diff(paths)
+        Returns:
+            List[StatusEntry]: one record per reported item.
+        """
+        if quiet and self.use_wc_db:
+            entries = self._wc_db_status(path or '.')
+            if entries is not None:
+                return entries
+        return self._execute(self._status_args(path, quiet), _status_from_xml)
+
+
+    def _wc_db_status(self, path: str) -> Optional[List[StatusEntry]]:
+        import sqlite3
+        from pysvn.wc import WorkingCopyDB
+        target = os.path.join(self.cwd, path)
+        db = WorkingCopyDB.find(target)
+        if db is None:
+            return None
+        try:
+            relpath = db.relpath(target)
+            if relpath is None or db.is_busy() or db.has_externals():
+                return None
+            result = db.status(relpath)
+        except sqlite3.Error:
+            return None
+        finally:
+            db.close()
+        if result is None:
+            return None
+
+        def shown(node_relpath: str) -> str:
+            # the way svn shows paths: relative to the current directory, unless given as absolute
+            local_path = os.path.join(db.root, node_relpath)
+            return local_path if os.path.isabs(path) else os.path.relpath(local_path, self.cwd)
+
+        entries, undecided = result
+        for entry in entries:
+            entry.path = shown(entry.path)
+        if undecided:
+            with targets_file(shown(node_relpath) for node_relpath in sorted(undecided)) as targets_path:
+                entries.extend(self._execute(['status', '--xml', '--quiet', '--depth', 'empty', '--targets', targets_path],
+                                             _status_from_xml))
+        return sorted(entries, key=lambda e: e.path)
+
+
+    @staticmethod
+    def _status_args(path: str = None, quiet: bool = False) -> List[str]:
+        status_cmd = ['status', '--xml']
+        if path:
+            status_cmd.append(path)
+        if quiet:
+            status_cmd.append('--quiet')
+        return status_cmd
 
 
     def revert(self, path: str, recursive: bool = False, remove_added: bool = False, depth: Depth = None) -> str:
@@ -170,6 +1414,11 @@ class Client:
         Returns:
             str: revert output
         """
+        return self._execute(self._revert_args(path, recursive, remove_added, depth))
+
+
+    @staticmethod
+    def _revert_args(path: str, recursive: bool = False, remove_added: bool = False, depth: Depth = None) -> List[str]:
         revert_cmd = ['revert', path]
         if recursive:
             revert_cmd.append('--recursive')
@@ -177,15 +1426,8 @@ class Client:
             revert_cmd.append('--remove-added')
         if depth:
             revert_cmd.append('--depth')
-            revert_cmd.append(depth.value)
-        
-        cmd = self._run_svn_cmd(revert_cmd)
-        stdout, stderr = get_output(cmd)
-
-        if stderr:
-            handle_stderr(stderr)
-
-        return '' + stdout.strip() + stderr.strip()
+            revert_cmd.append(_depth_arg(depth))
+        return revert_cmd
     
 
     def update(self, path: Union[str, List[str]] = None,
@@ -195,7 +1437,8 @@ class Client:
                force: bool = False,
                ignore_externals: bool = False,
                parents: bool = False,
-               adds_as_modification: bool = False) -> str:
+               adds_as_modification: bool = False,
+               set_depth: Depth = None) -> str:
         """## Bring changes from the repository into the working copy.
         Examples:
             `output = svn.update()`\n
@@ -244,8 +1487,9 @@ class Client:
         create any missing parent directories of the target by checking them
         out, too, at `depth=EMPTY`.
 
-        Use `depth` to set a new working copy depth on the
-        targets of this operation.
+        Use `set_depth` to set a new working copy depth on the
+        targets of this operation (`Depth.EXCLUDE` removes them from the
+        working copy), and `depth` to limit the update without changing it.
 
         Args:
             path (str | List[str], optional): path to file(s) to update (Example: `'foo.txt'` or `['foo.txt']`). Defaults to `'.'`.
@@ -258,14 +1502,81 @@ class Client:
             adds_as_modification (bool, optional): Local additions are merged with incoming additions
                                                    instead of causing a tree conflict. Use of this
                                                    option is not recommended!. Defaults to False.
+            set_depth (Depth, optional): set the sticky depth of the targets. Defaults to None.
 
         Raises:
             NoSuchRevisionError: raised if a revision is given and its unknown.
             SVNUpdateError: raised if something goes wrong in the svn update command.
+            UnsupportedOptionError: the installed svn doesn't have the `--adds-as-modification` option.
+            ValueError: `Depth.EXCLUDE` as `depth` (it is only a `set_depth`).
 
         Returns:
             str: command output
         """
+        if depth == Depth.EXCLUDE:
+            raise ValueError('Depth.EXCLUDE can only be used with update(set_depth=...)')
+        if self._bindings is not None and not accept:
+            return self._bindings.update(path, revision, depth, force, ignore_externals, parents, adds_as_modification,
+                                         set_depth)
+        if adds_as_modification:
+            self._require(self.capabilities.adds_as_modification, '--adds-as-modification')
+        return self._execute(self._update_args(path, revision, accept, depth, force,
+                                               ignore_externals, parents, adds_as_modification, set_depth))
+
+
+    def iter_update(self, path: Union[str, List[str]] = None,
+                    revision: int = None,
+                    accept: CRAction = None,
+                    depth: Depth = None,
+                    force: bool = False,
+                    ignore_externals: bool = False,
+                    parents: bool = False,
+                    adds_as_modification: bool = False,
+                    set_depth: Depth = None) -> Iterator[Union[UpdateEvent, UpdateRevision]]:
+        """## Update like `update`, yielding what svn reports as it goes.
+
+        Each item line becomes an `UpdateEvent` as soon as svn prints it, so
+        conflicts can be handled and finished directories processed while
+        the update runs. The revision each target (and external) reached
+        comes as an `UpdateRevision`. Other lines, such as the conflict
+        summary, are skipped. Stopping the iteration early does not stop
+        the update: svn runs to the end and the rest of its output is
+        discarded, so the working copy is not left locked.
+
+        Example:
+            `for event in svn.iter_update(): ...`
+
+        Args:
+            Same as `update`.
+
+        Raises:
+            NoSuchRevisionError: raised if a revision is given and its unknown.
+            SVNUpdateError: raised if something goes wrong in the svn update command.
+            UnsupportedOptionError: the installed svn doesn't have the `--adds-as-modification` option.
+
+        Yields:
+            UpdateEvent | UpdateRevision: item changes, and the revision reached by each target.
+        """
+        if adds_as_modification:
+            self._require(self.capabilities.adds_as_modification, '--adds-as-modification')
+        update_cmd = self._update_args(path, revision, accept, depth, force,
+                                       ignore_externals, parents, adds_as_modification, set_depth)
+        encoding = output_encoding()
+        with self._stream_svn_cmd(update_cmd, drain=True) as stdout:
+            lines = (line.decode(encoding, 'replace').rstrip('\r\n') for line in stdout)
+            yield from _iter_update_events(lines, path if type(path) == str else None)
+
+
+    @staticmethod
+    def _update_args(path: Union[str, List[str]] = None,
+                     revision: int = None,
+                     accept: CRAction = None,
+                     depth: Depth = None,
+                     force: bool = False,
+                     ignore_externals: bool = False,
+                     parents: bool = False,
+                     adds_as_modification: bool = False,
+                     set_depth: Depth = None) -> List[str]:
         update_cmd = ['update']
         if path:
             if type(path) == str:
@@ -277,7 +1588,7 @@ class Client:
         if accept:
             update_cmd.extend(['--accept', accept.value])
         if depth:
-            update_cmd.extend(['--depth', depth.value])
+            update_cmd.extend(['--depth', _depth_arg(depth)])
         if force:
             update_cmd.append('--force')
         if ignore_externals:
@@ -286,13 +1597,168 @@ class Client:
             update_cmd.append('--parents')
         if adds_as_modification:
             update_cmd.append('--adds-as-modification')
-        
-        stdout, stderr = get_output(self._run_svn_cmd(update_cmd))
+        if set_depth:
+            update_cmd.extend(['--set-depth', set_depth.value])
+        return update_cmd
 
-        if stderr:
-            handle_stderr(stderr)
-        
-        return stdout
+
+    def checkout(self, url: str, path: str = None, revision: int = None, depth: Depth = None,
+                 force: bool = False, ignore_externals: bool = False) -> str:
+        """## Check out a working copy from a repository.
+
+        Examples:
+            `svn.checkout('https://svn.example.com/repo/trunk', 'trunk')`\n
+            `svn.checkout(url, 'trunk', depth=Depth.EMPTY)`
+
+        Args:
+            url (str): URL to check out.
+            path (str, optional): directory to check out into, relative to `repository_dir`. Defaults to
+                                  the last component of `url`.
+            revision (int, optional): revision to check out. Defaults to `HEAD`.
+            depth (Depth, optional): depth of the working copy. Defaults to `INFINITY`.
+            force (bool, optional): handle unversioned obstructions as changes. Defaults to False.
+            ignore_externals (bool, optional): ignore externals definitions. Defaults to False.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Returns:
+            str: command output
+        """
+        return self._execute(self._checkout_args('checkout', url, path, revision, depth, force, ignore_externals))
+
+
+    def export(self, source: str, destination: str = None, revision: int = None, depth: Depth = None,
+               force: bool = False, ignore_externals: bool = False) -> str:
+        """## Create an unversioned copy of a tree.
+
+        Examples:
+            `svn.export('https://svn.example.com/repo/trunk', 'build/trunk')`\n
+            `svn.export('.', '/tmp/snapshot')`
+
+        Args:
+            source (str): URL, or working copy path (exported with its local changes).
+            destination (str, optional): directory to export into, relative to `repository_dir`. Defaults
+                                         to the last component of `source`.
+            revision (int, optional): revision to export. Defaults to `HEAD` for URLs and the working
+                                      copy for paths.
+            depth (Depth, optional): limit the export by depth. Defaults to `INFINITY`.
+            force (bool, optional): overwrite an existing destination. Defaults to False.
+            ignore_externals (bool, optional): ignore externals definitions. Defaults to False.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+
+        Returns:
+            str: command output
+        """
+        return self._execute(self._checkout_args('export', source, destination, revision, depth, force,
+                                                 ignore_externals))
+
+
+    @staticmethod
+    def _checkout_args(command: str, source: str, destination: str = None, revision: int = None,
+                       depth: Depth = None, force: bool = False, ignore_externals: bool = False) -> List[str]:
+        checkout_cmd = [command, source]
+        if destination:
+            checkout_cmd.append(destination)
+        if revision:
+            checkout_cmd.extend(['--revision', str(revision)])
+        if depth:
+            checkout_cmd.extend(['--depth', _depth_arg(depth)])
+        if force:
+            checkout_cmd.append('--force')
+        if ignore_externals:
+            checkout_cmd.append('--ignore-externals')
+        return checkout_cmd
+
+
+    def sparse_checkout(self, url: str, path: str, spec: 'SparseSpec', revision: int = None,
+                        dry_run: bool = False) -> List[SparseStep]:
+        """## Check out only the parts of a tree listed in a sparse spec, or change a sparse checkout to a new spec.
+
+        A new working copy is checked out at the depth the spec gives its
+        root (`EMPTY` by default), and the other entries are brought in with
+        as few `update --set-depth --parents` calls as possible. An existing
+        working copy of `url` is changed incrementally, from the depths svn
+        records in it (`svn info --depth infinity`): paths the new spec drops
+        are excluded or trimmed, and only the subtrees it adds are fetched
+        (see `pysvn.sparse.plan_reconcile`).
+
+        Examples:
+            `svn.sparse_checkout(url, 'ws', [('', Depth.FILES), ('src/core', Depth.INFINITY)])`\n
+            `svn.sparse_checkout(url, 'ws', [('src/core', Depth.INFINITY), ('docs', Depth.FILES)])`
+
+        Args:
+            url (str): URL to check out.
+            path (str): working copy directory, relative to `repository_dir`.
+            spec (Iterable[Tuple[str, Depth]]): paths relative to `url` and the depth of each.
+            revision (int, optional): revision to check out or update to. Defaults to `HEAD`.
+            dry_run (bool, optional): only plan, don't check out or update anything. Defaults to False.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+            ValueError: `Depth.EXCLUDE` in the spec, or `path` is a working copy of another URL.
+
+        Returns:
+            List[SparseStep]: the `update --set-depth` steps, in the order they are (or would be) run.
+        """
+        from pysvn import sparse
+        spec = sparse.normalize(spec)
+        if os.path.isdir(os.path.join(self.cwd, path, '.svn')):
+            info, working_copy = self._execute(['info', '--xml', '--depth', 'infinity', path],
+                                               lambda data: _sparse_working_copy_from_xml(data, path))
+            wc_url = info.relative_url if url.startswith('^/') else info.url
+            if unquote(url).rstrip('/') != unquote(wc_url).rstrip('/'):
+                raise ValueError(f'{path} is a working copy of {info.url}, not of {url}')
+            steps = sparse.plan_reconcile(working_copy, spec)
+        else:
+            depth, steps = sparse.plan_checkout(spec)
+            if not dry_run:
+                self.checkout(url, path, revision, depth)
+        if dry_run:
+            return steps
+
+        for step in steps:
+            targets = [os.path.join(path, target) for target in step.targets]
+            with targets_file(targets) as targets_path:
+                self._execute(self._update_args(revision=revision, parents=step.depth != Depth.EXCLUDE,
+                                                set_depth=step.depth) + ['--targets', targets_path])
+        return steps
+
+
+    def sparse_export(self, url: str, destination: str, spec: 'SparseSpec', revision: int = None) -> str:
+        """## Export only the parts of a tree listed in a sparse spec.
+
+        Example:
+            `svn.sparse_export(url, 'build/src', [('src/core', Depth.INFINITY), ('docs', Depth.FILES)])`
+
+        Args:
+            url (str): URL to export from.
+            destination (str): directory to export into, relative to `repository_dir`.
+            spec (Iterable[Tuple[str, Depth]]): paths relative to `url` and the depth of each.
+            revision (int, optional): revision to export. Defaults to `HEAD`.
+
+        Raises:
+            NoSuchRevisionError: unknown revision.
+            ValueError: `Depth.EXCLUDE` in the spec.
+
+        Returns:
+            str: command output
+        """
+        from pysvn import sparse
+        spec = sparse.normalize(spec)
+        spec.setdefault('', Depth.EMPTY)
+        outputs = []
+        # parents first, so that what they bring doesn't overwrite the deeper entries below them
+        for entry in sorted(spec, key=lambda entry: entry.count('/') + bool(entry)):
+            target = os.path.join(self.cwd, destination, entry)
+            os.makedirs(os.path.dirname(target.rstrip(os.sep)), exist_ok=True)
+            source = f'{url.rstrip("/")}/{quote(entry)}' if entry else url
+            export_to = os.path.join(destination, entry) if entry else destination
+            outputs.append(self._execute(self._checkout_args('export', source, export_to, revision, spec[entry],
+                                                             force=True)))
+        return '\n'.join(output for output in outputs if output)
     
 
     def cleanup(self, remove_unversioned: bool = False,
@@ -327,9 +1793,25 @@ class Client:
             vacuum_pristines (bool, optional): remove unreferenced pristines from .svn directory. Defaults to False.
             include_externals (bool, optional): also operate on externals defined by svn:externals properties. Defaults to False.
 
+        Raises:
+            UnsupportedOptionError: the installed svn doesn't have one of the requested options.
+
         Returns:
             str: cleanup command output
         """
+        if remove_unversioned or remove_ignored:
+            self._require(self.capabilities.remove_unversioned, '--remove-unversioned/--remove-ignored')
+        if vacuum_pristines or include_externals:
+            self._require(self.capabilities.vacuum_pristines, '--vacuum-pristines/--include-externals')
+        return self._execute(self._cleanup_args(remove_unversioned, remove_ignored,
+                                                vacuum_pristines, include_externals))
+
+
+    @staticmethod
+    def _cleanup_args(remove_unversioned: bool = False,
+                      remove_ignored: bool = False,
+                      vacuum_pristines: bool = False,
+                      include_externals: bool = False) -> List[str]:
         cleanup_cmd = ['cleanup']
         if remove_unversioned:
             cleanup_cmd.append('--remove-unversioned')
@@ -339,13 +1821,7 @@ class Client:
             cleanup_cmd.append('--vacuum-pristines')
         if include_externals:
             cleanup_cmd.append('--include-externals')
-        
-        stdout, stderr = get_output(self._run_svn_cmd(cleanup_cmd))
-
-        if stderr:
-            handle_stderr(stderr)
-        
-        return stdout
+        return cleanup_cmd
 
     
     def commit(self, message: str,
@@ -372,27 +1848,155 @@ class Client:
         Returns:
             str: commit command output
         """
+        return self._execute(self._commit_args(message, path, depth, no_unlock, include_externals))
+
+
+    @staticmethod
+    def _commit_args(message: str,
+                     path: str = '.',
+                     depth: Depth = None,
+                     no_unlock: bool = False,
+                     include_externals: bool = False) -> List[str]:
         commit_cmd = ['commit', '--message', message]
         if path != '.':
             commit_cmd.insert(1, path)
         if depth:
-            commit_cmd.extend(['--depth', depth.value])
+            commit_cmd.extend(['--depth', _depth_arg(depth)])
         if no_unlock:
             commit_cmd.append('--no-unlock')
         if include_externals:
             commit_cmd.append('--include-externals')
+        return commit_cmd
         
-        stdout, stderr = get_output(self._run_svn_cmd(commit_cmd))
 
-        if stderr:
-            handle_stderr(stderr)
-        
-        return stdout
-        
+    def add(self, paths: Union[str, List[str]], depth: Depth = None, force: bool = False, parents: bool = False,
+            no_ignore: bool = False) -> str:
+        """## Put files and directories under version control.
+
+        Any number of paths is passed to svn in a `--targets` file, so a
+        single svn call adds them all.
+
+        Examples:
+            `svn.add('foo.txt')`\n
+            `svn.add(['src/a.c', 'src/b.c'], parents=True)`
+
+        Args:
+            paths (str | List[str]): paths to add.
+            depth (Depth, optional): limit the recursion into directories. Defaults to None.
+            force (bool, optional): don't fail on paths already versioned, add what is not below them. Defaults to False.
+            parents (bool, optional): add unversioned parent directories too. Defaults to False.
+            no_ignore (bool, optional): also add what svn:ignore and global-ignores would skip. Defaults to False.
+
+        Returns:
+            str: add command output
+        """
+        add_cmd = ['add']
+        if depth:
+            add_cmd.extend(['--depth', _depth_arg(depth)])
+        if force:
+            add_cmd.append('--force')
+        if parents:
+            add_cmd.append('--parents')
+        if no_ignore:
+            add_cmd.append('--no-ignore')
+        return self._execute_with_targets(add_cmd, paths)
+
+
+    def delete(self, paths: Union[str, List[str]], force: bool = False, keep_local: bool = False) -> str:
+        """## Schedule working copy files and directories for removal at the next commit.
+
+        Any number of paths is passed to svn in a `--targets` file.
+
+        Examples:
+            `svn.delete('foo.txt')`\n
+            `svn.delete(obsolete_paths, keep_local=True)`
+
+        Args:
+            paths (str | List[str]): paths to delete.
+            force (bool, optional): also delete modified or unversioned items. Defaults to False.
+            keep_local (bool, optional): keep the files on disk, only unversion them. Defaults to False.
+
+        Returns:
+            str: delete command output
+        """
+        delete_cmd = ['delete']
+        if force:
+            delete_cmd.append('--force')
+        if keep_local:
+            delete_cmd.append('--keep-local')
+        return self._execute_with_targets(delete_cmd, paths)
+
+
+    def changelist(self, name: Optional[str], paths: Union[str, List[str]], depth: Depth = None) -> str:
+        """## Add paths to a changelist, or take them out of theirs.
+
+        A changelist names a group of files to commit together
+        (`batch_commit(message, changelist=name)`); a file is in at most one.
+
+        Examples:
+            `svn.changelist('fix-123', ['src/a.c', 'src/b.c'])`\n
+            `svn.changelist(None, 'src/a.c')`
+
+        Args:
+            name (str | None): changelist to add the paths to, None to remove them from theirs.
+            paths (str | List[str]): files, or directories together with `depth`.
+            depth (Depth, optional): also apply to what is below directories. Defaults to None.
+
+        Returns:
+            str: changelist command output
+        """
+        changelist_cmd = ['changelist', name] if name is not None else ['changelist', '--remove']
+        if depth:
+            changelist_cmd.extend(['--depth', _depth_arg(depth)])
+        return self._execute_with_targets(changelist_cmd, paths)
+
+
+    def batch_commit(self, message: str, paths: Union[str, List[str]] = None,
+                     changelist: Union[str, List[str]] = None, depth: Depth = None, keep_changelists: bool = False,
+                     no_unlock: bool = False, include_externals: bool = False) -> CommitResult:
+        """## Commit any number of paths, or the members of changelists, at once.
+
+        The paths are passed to svn in a `--targets` file, so thousands of
+        scattered files make one commit without committing `.`. With
+        `changelist`, only the members of the changelist(s) below `paths`
+        (the working copy by default) are committed.
+
+        Examples:
+            `svn.batch_commit('Update headers', changed_files).revision`\n
+            `svn.batch_commit('Fix #123', changelist='fix-123')`
+
+        Args:
+            message (str): log message.
+            paths (str | List[str], optional): paths to commit. Defaults to the working copy.
+            changelist (str | List[str], optional): only commit members of these changelists. Defaults to None.
+            depth (Depth, optional): limit the recursion into directories. Defaults to None.
+            keep_changelists (bool, optional): don't clear the changelists of what was committed. Defaults to False.
+            no_unlock (bool, optional): don't unlock the targets. Defaults to False.
+            include_externals (bool, optional): also commit externals reached by recursion. Defaults to False.
+
+        Raises:
+            CommitConflictError: a target is out of date.
+
+        Returns:
+            CommitResult: the new revision (None if there was nothing to commit, or if svn's messages are
+                          translated) and the command output.
+        """
+        commit_cmd = self._commit_args(message, '.', depth, no_unlock, include_externals)
+        for name in [changelist] if type(changelist) == str else changelist or []:
+            commit_cmd.extend(['--changelist', name])
+        if keep_changelists:
+            commit_cmd.append('--keep-changelists')
+        output = self._execute_with_targets(commit_cmd, paths if paths is not None else '.')
+        return CommitResult(revision=_committed_revision(output), output=output)
+
+
+    def _execute_with_targets(self, args: List[str], paths: Union[str, List[str]], parse: Callable[[str], Any] = None) -> Any:
+        with targets_file([paths] if type(paths) == str else paths) as targets_path:
+            return self._execute(args + ['--targets', targets_path], parse)
+
 
     def __str__(self) -> str:
-        cmd = self._run_svn_cmd(['info'])
-        stats = cmd.stdout.read().decode('utf-8').strip()
+        stats, _ = get_output(self._run_svn_cmd(['info']))
         if stats:
             num_of_signs = get_longest_line_len(stats.split('\n'))
             signs = '=' * num_of_signs
@@ -0,0 +1,221 @@
+'''pysvn columnar log module.
+
+`LogBatch` holds a log as columns instead of one `LogEntry` per revision:
+revisions and dates (epoch seconds) in `array('q')`s, authors as indexes
+into a table of distinct names, and messages as offsets into one UTF-8
+buffer. `svn.log(columnar=True)` fills it straight from svn's XML, without
+building per-entry objects or `datetime`s; rows are materialized only when
+they are looked at.
+'''
+from array import array
+import calendar
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Union
+
+from pysvn.models import LogEntry
+
+if TYPE_CHECKING:
+    import xml.etree.ElementTree
+
+# stored for entries without a date (e.g. revisions whose properties can't be read)
+NO_DATE = -2 ** 63
+
+# dates are converted to epoch seconds this many at a time
+_DATE_BATCH = 4096
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def epoch_seconds(dates: Iterable[Optional[str]]) -> List[int]:
+    """Convert svn dates (`2022-04-26T10:00:00.123456Z`) to epoch seconds, in bulk.
+
+    Dates are UTC and commits cluster on the same days, so each distinct
+    day is converted once and the time of day is added by slicing.
+    """
+    days: Dict[str, int] = {}
+    seconds = []
+    for date in dates:
+        if not date:
+            seconds.append(NO_DATE)
+            continue
+        day = days.get(date[:10])
+        if day is None:
+            day = days[date[:10]] = calendar.timegm((int(date[:4]), int(date[5:7]), int(date[8:10]), 0, 0, 0))
+        seconds.append(day + int(date[11:13]) * 3600 + int(date[14:16]) * 60 + int(date[17:19]))
+    return seconds
+
+
+class LogRow:
+    """View of one entry of a `LogBatch`; fields are read from the columns on access."""
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch: 'LogBatch', index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    @property
+    def revision(self) -> int:
+        return self._batch.revisions[self._index]
+
+    @property
+    def author(self) -> Optional[str]:
+        return self._batch.author_at(self._index)
+
+    @property
+    def date(self) -> Optional[datetime]:
+        return self._batch.date_at(self._index)
+
+    @property
+    def message(self) -> Optional[str]:
+        return self._batch.message_at(self._index)
+
+    @property
+    def paths(self) -> None:
+        return None
+
+    def to_entry(self) -> LogEntry:
+        return LogEntry(message=self.message, author=self.author, revision=self.revision, date=self.date)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LogRow, LogEntry)):
+            return (self.revision, self.author, self.date, self.message) == \
+                   (other.revision, other.author, other.date, other.message)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (f'LogRow(revision={self.revision}, author={self.author!r}, date={self.date!r}, '
+                f'message={self.message!r})')
+
+
+class LogBatch:
+    """Log entries stored as columns.
+
+    Attributes:
+        revisions (array): revision numbers (`array('q')`).
+        dates (array): commit dates in seconds since the epoch, UTC (`array('q')`),
+                       `NO_DATE` where there is none.
+        author_ids (array): index of each entry's author in `authors`, -1 for none (`array('i')`).
+        authors (List[str]): distinct author names, in order of appearance.
+    """
+    def __init__(self) -> None:
+        self.revisions = array('q')
+        self.author_ids = array('i')
+        self.authors: List[str] = []
+        self._author_index: Dict[str, int] = {}
+        self._dates = array('q')
+        self._pending_dates: List[Optional[str]] = []
+        self._messages = bytearray()
+        self._message_offsets = array('q', [0])
+        self._no_message: set = set()
+
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[LogEntry]) -> 'LogBatch':
+        """Build a batch from log entries (e.g. `iter_log`), which are not kept."""
+        batch = cls()
+        for entry in entries:
+            date = entry.date.strftime('%Y-%m-%dT%H:%M:%S') if entry.date else None
+            batch.append(entry.revision, entry.author, date, entry.message)
+        return batch
+
+
+    def append(self, revision: int, author: Optional[str], date: Optional[str], message: Optional[str]) -> None:
+        """Add an entry, with its date as svn prints it."""
+        index = len(self.revisions)
+        self.revisions.append(revision)
+
+        if author is None:
+            self.author_ids.append(-1)
+        else:
+            author_id = self._author_index.get(author)
+            if author_id is None:
+                author_id = self._author_index[author] = len(self.authors)
+                self.authors.append(author)
+            self.author_ids.append(author_id)
+
+        self._pending_dates.append(date)
+        if len(self._pending_dates) >= _DATE_BATCH:
+            self._flush_dates()
+
+        if message is None:
+            self._no_message.add(index)
+        else:
+            self._messages += message.encode('utf-8')
+        self._message_offsets.append(len(self._messages))
+
+
+    def append_element(self, e: 'xml.etree.ElementTree.Element') -> None:
+        """Add a `<logentry>` element of `svn log --xml` output."""
+        fields = {x.tag: x.text for x in e}
+        self.append(int(e.get('revision')), fields.get('author'), fields.get('date'), fields.get('msg'))
+
+
+    def _flush_dates(self) -> None:
+        if self._pending_dates:
+            self._dates.extend(epoch_seconds(self._pending_dates))
+            self._pending_dates.clear()
+
+
+    @property
+    def dates(self) -> array:
+        self._flush_dates()
+        return self._dates
+
+
+    def author_at(self, index: int) -> Optional[str]:
+        author_id = self.author_ids[index]
+        return self.authors[author_id] if author_id >= 0 else None
+
+
+    def date_at(self, index: int) -> Optional[datetime]:
+        seconds = self.dates[index]
+        return _EPOCH + timedelta(seconds=seconds) if seconds != NO_DATE else None
+
+
+    def message_at(self, index: int) -> Optional[str]:
+        index = range(len(self.revisions))[index]
+        if index in self._no_message:
+            return None
+        return self._messages[self._message_offsets[index]:self._message_offsets[index + 1]].decode('utf-8')
+
+
+    def entries(self) -> List[LogEntry]:
+        """Materialize all rows as `LogEntry` objects."""
+        return [row.to_entry() for row in self]
+
+
+    def to_numpy(self) -> Dict[str, 'numpy.ndarray']:
+        """Columns as NumPy arrays (NumPy must be installed): `revision` (int64),
+        `date` (datetime64[s], NaT where missing) and `author_id` (int32,
+        indexes into `authors`, -1 for none).
+        """
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError('LogBatch.to_numpy requires numpy') from e
+
+        dates = numpy.frombuffer(self.dates, dtype=numpy.int64).copy()
+        return {
+            'revision': numpy.frombuffer(self.revisions, dtype=numpy.int64).copy(),
+            'date': dates.astype('datetime64[s]'),  # NO_DATE is the int64 value of NaT
+            'author_id': numpy.frombuffer(self.author_ids, dtype=numpy.int32).copy(),
+        }
+
+
+    def __len__(self) -> int:
+        return len(self.revisions)
+
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[LogRow, List[LogRow]]:
+        if isinstance(index, slice):
+            return [LogRow(self, i) for i in range(len(self))[index]]
+        return LogRow(self, range(len(self))[index])
+
+
+    def __iter__(self) -> Iterator[LogRow]:
+        for index in range(len(self)):
+            yield LogRow(self, index)
+
+
+    def __repr__(self) -> str:
+        return f'LogBatch(entries={len(self)}, authors={len(self.authors)})'
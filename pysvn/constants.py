@@ -6,6 +6,9 @@ class Depth(Enum):
     FILES = 'files'
     IMMEDIATES = 'immediates'
     INFINITY = 'infinity'
+    # only for `update(set_depth=...)`: remove the path from the working copy; the
+    # methods taking a `depth` raise ValueError for it, like svn rejects `--depth exclude`
+    EXCLUDE = 'exclude'
 
 class Revision(Enum):
     HEAD = auto()
@@ -13,6 +16,16 @@ class Revision(Enum):
     COMMITTED = auto()
     PREV = auto()
 
+class UpdateAction(Enum):
+    """What `svn update` did to an item or its properties."""
+    ADDED = 'A'
+    DELETED = 'D'
+    UPDATED = 'U'
+    CONFLICT = 'C'
+    MERGED = 'G'
+    EXISTED = 'E'
+    REPLACED = 'R'
+
 class CRAction(Enum):
     """Automatic conflict resolution action."""
     POSTPONE = 'postpone'
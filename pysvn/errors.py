@@ -44,6 +44,12 @@ class TargetsNotWorkingCopiesError(Exception):
     def __init__(self, *args: object) -> None:
         super().__init__('none of the targets are working copies')
 
+class CommandTimeoutError(Exception):
+    pass
+
+class UnsupportedOptionError(Exception):
+    pass
+
 ERROR_CODES: Dict[str, Exception] = {
     'E155037': PreviousOperationNotFinishedError,
     'E200030': DatabaseDiskImageMalformedError,
@@ -55,6 +61,9 @@ ERROR_CODES: Dict[str, Exception] = {
     'E155007': TargetsNotWorkingCopiesError
 }
 
+# working copy lock contention, usually gone once the other operation finishes
+LOCK_ERROR_CODES = ('E155037', 'E155004')
+
 def handle_stderr(stderr: str) -> None:
     error_cd_search = list(filter(lambda error_cd: error_cd in stderr, ERROR_CODES.keys()))
     if not error_cd_search:
@@ -0,0 +1,181 @@
+'''pysvn fleet module.
+'''
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import subprocess
+import threading
+import time
+from typing import IO, Any, Dict, Iterable, Iterator, List, Union
+import weakref
+
+from pysvn.client import Client
+from pysvn.errors import CommandTimeoutError
+from pysvn.models import FleetResult
+from pysvn.retry import RetryPolicy
+
+
+# svn commands that don't lock the working copy, so they can be killed at any point
+_READ_ONLY_COMMANDS = frozenset(('blame', 'cat', 'diff', 'export', 'info', 'list', 'log', 'status'))
+
+
+class _WorkingCopyClient(Client):
+    """`Client` whose operations can be given a deadline: the read-only svn
+    processes still running at the deadline are killed, the others are left
+    to finish, and none are started after it.
+    """
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.deadline: float = None
+        self.expired = False
+        # running svn processes and their subcommands
+        self._processes: 'weakref.WeakKeyDictionary[subprocess.Popen, str]' = weakref.WeakKeyDictionary()
+
+
+    def _run_svn_cmd(self, args: List[str], stdout: Union[int, IO[bytes]] = subprocess.PIPE) -> subprocess.Popen:
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.expired = True
+            raise CommandTimeoutError(f'svn {args[0]} not started, the operation ran out of time')
+        cmd = super()._run_svn_cmd(args, stdout)
+        self._processes[cmd] = args[0]
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            # started while the deadline passed
+            self.expire()
+        return cmd
+
+
+    def expire(self) -> None:
+        for cmd, command in list(self._processes.items()):
+            if cmd.poll() is None:
+                self.expired = True
+                if command in _READ_ONLY_COMMANDS:
+                    cmd.kill()
+                # killing svn while it holds the working copy lock would leave it locked
+                # (E155037) for the next operation, so the command is left to finish
+
+
+class Fleet:
+    """Runs the same `Client` operation on many working copies in parallel.
+
+    Each working copy gets its own `Client`. Operations run on a pool of
+    `max_workers` threads (the work itself happens in the svn processes,
+    so threads are enough), and each working copy's operation, with all its
+    svn commands and retries, gets `timeout` seconds. At the timeout, svn
+    commands that only read (`log`, `info`, `status`, `diff`...) are killed,
+    while those that lock the working copy (`update`, `commit`, `cleanup`...)
+    are left to finish so that it isn't left locked; either way no further
+    command is started and the operation fails with `CommandTimeoutError`.
+    A failure in one working copy is returned in its `FleetResult` and never
+    stops the rest of the batch.
+
+    Example:
+        `results = pysvn.Fleet(paths, max_workers=16, timeout=300).update()`
+    """
+    def __init__(self, paths: Iterable[str], max_workers: int = 8, timeout: float = None,
+                 retry_policy: RetryPolicy = None) -> None:
+        """Runs the same `Client` operation on many working copies in parallel.
+
+        Args:
+            paths (Iterable[str]): working copy directories; a path given twice is operated on once.
+            max_workers (int, optional): number of working copies operated on at once. Defaults to 8.
+            timeout (float, optional): seconds the operation may take in a working copy, all its svn commands
+                                       and retries included, before it fails with `CommandTimeoutError`
+                                       (commands locking the working copy are still left to finish).
+                                       Defaults to None.
+            retry_policy (RetryPolicy, optional): how to retry commands that fail on a working copy lock. Defaults to `RetryPolicy()`.
+        """
+        # the same working copy twice would run into its own lock
+        self.paths = list(dict.fromkeys(paths))
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self._clients: Dict[str, _WorkingCopyClient] = {}
+        self._lock = threading.Lock()
+
+
+    def run(self, operation: str, *args: Any, **kwargs: Any) -> List[FleetResult]:
+        """Run a `Client` operation on every working copy.
+
+        Examples:
+            `fleet.run('update', depth=Depth.INFINITY)`\\n
+            `fleet.run('log', limit=1)`
+
+        Args:
+            operation (str): name of the `Client` method to call, e.g. `'update'`.
+            *args: positional arguments for the operation.
+            **kwargs: keyword arguments for the operation.
+
+        Raises:
+            ValueError: operation is not a `Client` method.
+
+        Returns:
+            List[FleetResult]: one result per working copy, in the order of `paths`.
+        """
+        results = {result.path: result for result in self.iter_run(operation, *args, **kwargs)}
+        return [results[path] for path in self.paths]
+
+
+    def iter_run(self, operation: str, *args: Any, **kwargs: Any) -> Iterator[FleetResult]:
+        """Same as `run`, but yields each result as soon as its working copy is done."""
+        if operation.startswith('_') or not callable(getattr(Client, operation, None)):
+            raise ValueError(f'{operation} is not a Client operation')
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._run_one, path, operation, args, kwargs) for path in self.paths]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+    def update(self, **kwargs: Any) -> List[FleetResult]:
+        """Run `Client.update` on every working copy."""
+        return self.run('update', **kwargs)
+
+
+    def cleanup(self, **kwargs: Any) -> List[FleetResult]:
+        """Run `Client.cleanup` on every working copy."""
+        return self.run('cleanup', **kwargs)
+
+
+    def _run_one(self, path: str, operation: str, args: tuple, kwargs: dict) -> FleetResult:
+        start = time.perf_counter()
+        try:
+            result = self._call(self._client(path), operation, args, kwargs)
+            return FleetResult(path, result=result, elapsed=time.perf_counter() - start)
+        except Exception as e:
+            return FleetResult(path, error=e, elapsed=time.perf_counter() - start)
+
+
+    def _call(self, client: '_WorkingCopyClient', operation: str, args: tuple, kwargs: dict) -> Any:
+        """Run an operation within `timeout`, whatever number of svn commands it takes."""
+        if self.timeout is None:
+            return getattr(client, operation)(*args, **kwargs)
+
+        client.deadline, client.expired = time.monotonic() + self.timeout, False
+        timer = threading.Timer(self.timeout, client.expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            result = getattr(client, operation)(*args, **kwargs)
+        except Exception:
+            if not client.expired:
+                raise
+        finally:
+            timer.cancel()
+            client.deadline = None
+        if client.expired:
+            # also when the output of the killed processes parsed fine, or a command locking the
+            # working copy was left to finish
+            raise CommandTimeoutError(f'{operation} did not finish within {self.timeout} seconds')
+        return result
+
+
+    def _client(self, path: str) -> '_WorkingCopyClient':
+        with self._lock:
+            client = self._clients.get(path)
+        if client is None:
+            client = _WorkingCopyClient(path, retry_policy=self.retry_policy)
+            with self._lock:
+                self._clients[path] = client
+        return client
+
+
+    def __repr__(self) -> str:
+        return f'Fleet(paths={len(self.paths)}, max_workers={self.max_workers}, timeout={self.timeout})'
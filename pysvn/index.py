@@ -0,0 +1,289 @@
+'''pysvn log index module.
+
+`LogIndex` answers repeated questions about a log already fetched
+(`svn.log(verbose=True)`) without scanning it or asking svn again:
+
+    index = LogIndex(svn.log(verbose=True))
+    index.query(author='alice', since=datetime(2022, 3, 1), until=datetime(2022, 4, 1))
+    index.query(path='trunk/core', start=1000, end=5000)
+
+Every filter maps to a sorted list of revisions (all revisions, the
+revisions of an author, the revisions below a path) or of dates, which
+is cut to the queried range by bisection; the smallest of those ranges
+is then checked against the other filters, again by bisection.
+'''
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from pysvn.errors import NoSuchRevisionError
+from pysvn.models import LogEntry
+
+
+class _PathNode:
+    __slots__ = ('children', 'revisions')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_PathNode'] = {}
+        # revisions that changed this path or anything below it, ascending
+        self.revisions: List[int] = []
+
+
+def _path_parts(path: str) -> List[str]:
+    return [part for part in path.strip('/').split('/') if part and part != '.']
+
+
+def _add_sorted(revisions: List[int], revision: int) -> None:
+    # `LogIndex.append` adds entries in ascending order, which makes this an append
+    if not revisions or revisions[-1] < revision:
+        revisions.append(revision)
+    else:
+        index = bisect_left(revisions, revision)
+        if index == len(revisions) or revisions[index] != revision:
+            revisions.insert(index, revision)
+
+
+def _contains(revisions: List[int], revision: int) -> bool:
+    index = bisect_left(revisions, revision)
+    return index < len(revisions) and revisions[index] == revision
+
+
+class _Span:
+    """The part of an ascending revision list between two revisions, inclusive."""
+    __slots__ = ('revisions', 'low', 'high')
+
+    def __init__(self, revisions: List[int], start: Optional[int], end: Optional[int]) -> None:
+        self.revisions = revisions
+        self.low = bisect_left(revisions, start) if start is not None else 0
+        self.high = bisect_right(revisions, end) if end is not None else len(revisions)
+
+
+    def __contains__(self, revision: int) -> bool:
+        index = bisect_left(self.revisions, revision, self.low, self.high)
+        return index < self.high and self.revisions[index] == revision
+
+
+    def __reversed__(self) -> Iterator[int]:
+        for index in range(self.high - 1, self.low - 1, -1):
+            yield self.revisions[index]
+
+
+    def __len__(self) -> int:
+        return self.high - self.low
+
+
+class LogIndex:
+    """In-memory index of log entries by revision, date, author and changed path.
+
+    Entries without changed paths (from a log fetched without `verbose`)
+    are indexed by everything but path; querying by path then raises
+    `ValueError`.
+    """
+    def __init__(self, entries: Iterable[LogEntry] = ()) -> None:
+        """In-memory index of log entries.
+
+        Args:
+            entries (Iterable[LogEntry], optional): entries to index, in any order. Defaults to none.
+        """
+        self._entries: Dict[int, LogEntry] = {}
+        self._revisions: List[int] = []
+        self._dates: List[datetime] = []
+        self._date_revisions: List[int] = []
+        self._authors: Dict[str, List[int]] = {}
+        self._paths = _PathNode()
+        self._without_paths = 0
+        self.append(entries)
+
+
+    def append(self, entries: Iterable[LogEntry]) -> int:
+        """## Add entries to the index.
+
+        Entries are added in ascending revision order, whatever order they
+        come in (`log` returns them newest first), so revisions newer than
+        the ones indexed are appended at the end of every list; older ones
+        are inserted in place. An entry for a revision already indexed
+        replaces it.
+
+        Args:
+            entries (Iterable[LogEntry]): entries to add.
+
+        Returns:
+            int: number of entries added
+        """
+        added = 0
+        for entry in sorted(entries, key=lambda entry: entry.revision):
+            if entry.revision in self._entries:
+                self._remove(self._entries[entry.revision])
+            self._add(entry)
+            added += 1
+        return added
+
+
+    def _add(self, entry: LogEntry) -> None:
+        revision = entry.revision
+        self._entries[revision] = entry
+        _add_sorted(self._revisions, revision)
+
+        if entry.date is not None:
+            if not self._dates or self._dates[-1] <= entry.date:
+                index = len(self._dates)
+            else:
+                index = bisect_right(self._dates, entry.date)
+            self._dates.insert(index, entry.date)
+            self._date_revisions.insert(index, revision)
+
+        if entry.author is not None:
+            _add_sorted(self._authors.setdefault(entry.author, []), revision)
+
+        if entry.paths is None:
+            self._without_paths += 1
+            return
+        for log_path in entry.paths:
+            node = self._paths
+            _add_sorted(node.revisions, revision)
+            for part in _path_parts(log_path.path):
+                node = node.children.setdefault(part, _PathNode())
+                _add_sorted(node.revisions, revision)
+
+
+    def _remove(self, entry: LogEntry) -> None:
+        revision = entry.revision
+        del self._entries[revision]
+        self._revisions.remove(revision)
+
+        if entry.date is not None:
+            low = bisect_left(self._dates, entry.date)
+            index = self._date_revisions.index(revision, low)
+            del self._dates[index], self._date_revisions[index]
+
+        if entry.author is not None:
+            self._authors[entry.author].remove(revision)
+            if not self._authors[entry.author]:
+                del self._authors[entry.author]
+
+        if entry.paths is None:
+            self._without_paths -= 1
+            return
+        for log_path in entry.paths:
+            node = self._paths
+            for part in [None, *_path_parts(log_path.path)]:
+                if part is not None:
+                    node = node.children[part]
+                if _contains(node.revisions, revision):
+                    node.revisions.remove(revision)
+
+
+    def refresh(self, client: 'pysvn.Client', file: str = None) -> int:
+        """## Index the revisions committed since the newest one indexed.
+
+        Args:
+            client (Client): client of the working copy the log came from.
+            file (str, optional): file the log was restricted to. Defaults to None.
+
+        Returns:
+            int: number of entries added
+        """
+        start = self._revisions[-1] + 1 if self._revisions else 1
+        try:
+            return self.append(client.iter_log(file, revision=f'{start}:HEAD', verbose=True))
+        except NoSuchRevisionError:
+            # nothing was committed since
+            return 0
+
+
+    def query(self, author: str = None, path: str = None, since: datetime = None, until: datetime = None,
+              start: int = None, end: int = None) -> List[LogEntry]:
+        """## Find the entries matching all the given filters.
+
+        Examples:
+            `index.query(author='alice', since=datetime(2022, 3, 1), until=datetime(2022, 4, 1))`\n
+            `index.query(path='trunk/core', start=1000, end=5000)`
+
+        Args:
+            author (str, optional): committed by this author. Defaults to None.
+            path (str, optional): changed this path or anything below it (`trunk/core` or `/trunk/core`).
+                                  Defaults to None.
+            since (datetime, optional): committed at or after this date. Defaults to None.
+            until (datetime, optional): committed before this date. Defaults to None.
+            start (int, optional): lowest revision, inclusive. Defaults to None.
+            end (int, optional): highest revision, inclusive. Defaults to None.
+
+        Raises:
+            ValueError: querying by path an index holding entries without changed paths.
+
+        Returns:
+            List[LogEntry]: matching entries, newest first
+        """
+        spans = []
+        if author is not None:
+            spans.append(_Span(self._authors.get(author, []), start, end))
+        if path is not None:
+            if self._without_paths:
+                raise ValueError('the index holds entries without changed paths, build it from log(verbose=True)')
+            node = self._paths
+            for part in _path_parts(path):
+                node = node.children.get(part)
+                if node is None:
+                    return []
+            spans.append(_Span(node.revisions, start, end))
+        if not spans:
+            spans.append(_Span(self._revisions, start, end))
+        smallest = min(spans, key=len)
+        others = [span for span in spans if span is not smallest]
+
+        dated = since is not None or until is not None
+        if dated:
+            low = bisect_left(self._dates, since) if since is not None else 0
+            high = bisect_left(self._dates, until) if until is not None else len(self._dates)
+            if high - low < len(smallest):
+                # fewer entries in the date range than in any other: walk those
+                revisions = sorted(self._date_revisions[low:high], reverse=True)
+                return [self._entries[revision] for revision in revisions
+                        if (start is None or revision >= start) and (end is None or revision <= end)
+                        and all(revision in span for span in spans)]
+
+        matches = []
+        for revision in reversed(smallest):
+            if all(revision in span for span in others):
+                entry = self._entries[revision]
+                if not dated or _in_dates(entry, since, until):
+                    matches.append(entry)
+        return matches
+
+
+    def get(self, revision: int) -> Optional[LogEntry]:
+        return self._entries.get(revision)
+
+
+    @property
+    def authors(self) -> List[str]:
+        return sorted(self._authors)
+
+
+    @property
+    def revisions(self) -> List[int]:
+        """Indexed revisions, ascending."""
+        return list(self._revisions)
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def __contains__(self, revision: int) -> bool:
+        return revision in self._entries
+
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        for revision in reversed(self._revisions):
+            yield self._entries[revision]
+
+
+    def __repr__(self) -> str:
+        return f'LogIndex(entries={len(self)}, authors={len(self._authors)})'
+
+
+def _in_dates(entry: LogEntry, since: Optional[datetime], until: Optional[datetime]) -> bool:
+    if entry.date is None:
+        return False
+    return (since is None or entry.date >= since) and (until is None or entry.date < until)
@@ -0,0 +1,258 @@
+'''pysvn instrumentation module.
+
+Every svn command pysvn runs is described by a `CommandEvent` (subcommand,
+arguments, seconds per phase, bytes of output, exit code, mapped error)
+and handed to the registered listeners once it has finished:
+
+    collector = HistogramCollector()
+    add_listener(collector)
+    ...
+    collector.snapshot()['log']
+
+Phases:
+    spawn: starting the svn process.
+    wait: waiting for svn's output and exit (svn itself, the server, the transfer).
+    decode: turning the output into text.
+    parse: turning the output into models. For streamed commands (`iter_log`,
+           `iter_diff`...), everything between reads: parsing, and whatever
+           the caller does before asking for more.
+'''
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple
+
+Listener = Callable[['CommandEvent'], None]
+
+_listeners: List[Listener] = []
+_listeners_lock = threading.Lock()
+
+
+@dataclass
+class CommandEvent:
+    command: str
+    args: List[str]
+    cwd: str
+    phases: Dict[str, float] = field(default_factory=dict)
+    elapsed: float = 0.
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+    returncode: Optional[int] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to phase `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.) + time.perf_counter() - start
+
+
+def add_listener(listener: Listener) -> Listener:
+    """Call `listener(event)` after every svn command; usable as a decorator.
+
+    Listeners run in the thread that ran the command. An exception in a
+    listener is turned into a warning and never fails the command.
+    """
+    global _listeners
+    with _listeners_lock:
+        # copy on write, so emitting never needs the lock
+        _listeners = [*_listeners, listener]
+    return listener
+
+
+def remove_listener(listener: Listener) -> None:
+    global _listeners
+    with _listeners_lock:
+        _listeners = [existing for existing in _listeners if existing is not listener]
+
+
+@contextmanager
+def listening(listener: Listener) -> Iterator[Listener]:
+    """Register `listener` for the duration of the block."""
+    add_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+def enabled() -> bool:
+    """True if any listener is registered."""
+    return bool(_listeners)
+
+
+def _emit(event: CommandEvent) -> None:
+    for listener in _listeners:
+        try:
+            listener(event)
+        except Exception as e:
+            import warnings
+            warnings.warn(f'instrumentation listener {listener!r} failed: {e!r}', RuntimeWarning)
+
+
+@contextmanager
+def command(args: List[str], cwd: str = None) -> Iterator[CommandEvent]:
+    """Record one svn command: the block runs it and fills in the event, which
+    is emitted when the block exits, with the exception it raised, if any.
+    """
+    event = CommandEvent(command=args[0] if args else '', args=list(args), cwd=cwd)
+    start = time.perf_counter()
+    try:
+        yield event
+    except Exception as e:
+        # not GeneratorExit: a stream closed early is not a failure
+        event.error = e
+        raise
+    finally:
+        event.elapsed = time.perf_counter() - start
+        if _listeners:
+            _emit(event)
+
+
+class TimedReader:
+    """Wraps a process's stdout pipe, counting bytes into an event and the
+    time spent blocked on reads into its `wait` phase.
+    """
+    def __init__(self, stream: IO[bytes], event: CommandEvent) -> None:
+        self._stream = stream
+        self._event = event
+
+
+    def _timed(self, read: Callable, *args) -> bytes:
+        start = time.perf_counter()
+        data = read(*args)
+        self._event.phases['wait'] = self._event.phases.get('wait', 0.) + time.perf_counter() - start
+        self._event.stdout_bytes += len(data)
+        return data
+
+
+    def read(self, size: int = -1) -> bytes:
+        return self._timed(self._stream.read, size)
+
+
+    def read1(self, size: int = -1) -> bytes:
+        return self._timed(self._stream.read1, size)
+
+
+    def readline(self, size: int = -1) -> bytes:
+        return self._timed(self._stream.readline, size)
+
+
+    def readinto(self, buffer: bytearray) -> int:
+        start = time.perf_counter()
+        count = self._stream.readinto(buffer)
+        self._event.phases['wait'] = self._event.phases.get('wait', 0.) + time.perf_counter() - start
+        self._event.stdout_bytes += count
+        return count
+
+
+    def __iter__(self) -> 'TimedReader':
+        return self
+
+
+    def __next__(self) -> bytes:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+# upper bounds (seconds) of the histogram buckets, the last one catches the rest
+DEFAULT_BUCKETS: Tuple[float, ...] = (.005, .01, .025, .05, .1, .25, .5, 1., 2.5, 5., 10., 30., 60., float('inf'))
+
+
+@dataclass
+class CommandStats:
+    count: int = 0
+    errors: int = 0
+    total: float = 0.
+    max: float = 0.
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+    phases: Dict[str, float] = field(default_factory=dict)
+    buckets: List[int] = None
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.
+
+
+class HistogramCollector:
+    """In-memory listener keeping, per svn subcommand, a histogram of wall
+    times over fixed buckets and totals of phases, bytes and errors.
+    """
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """In-memory listener keeping per-subcommand histograms.
+
+        Args:
+            buckets (Tuple[float, ...], optional): increasing bucket upper bounds in seconds.
+                                                   Defaults to `DEFAULT_BUCKETS`.
+        """
+        self.buckets = tuple(buckets) if buckets[-1] == float('inf') else (*buckets, float('inf'))
+        self._stats: Dict[str, CommandStats] = {}
+        self._lock = threading.Lock()
+
+
+    def __call__(self, event: CommandEvent) -> None:
+        from bisect import bisect_left
+        with self._lock:
+            stats = self._stats.get(event.command)
+            if stats is None:
+                stats = self._stats[event.command] = CommandStats(buckets=[0] * len(self.buckets))
+            stats.count += 1
+            stats.errors += event.error is not None
+            stats.total += event.elapsed
+            stats.max = max(stats.max, event.elapsed)
+            stats.stdout_bytes += event.stdout_bytes
+            stats.stderr_bytes += event.stderr_bytes
+            for name, seconds in event.phases.items():
+                stats.phases[name] = stats.phases.get(name, 0.) + seconds
+            stats.buckets[bisect_left(self.buckets, event.elapsed)] += 1
+
+
+    def snapshot(self) -> Dict[str, CommandStats]:
+        """Copy of the statistics per subcommand."""
+        with self._lock:
+            return {command: CommandStats(count=s.count, errors=s.errors, total=s.total, max=s.max,
+                                          stdout_bytes=s.stdout_bytes, stderr_bytes=s.stderr_bytes,
+                                          phases=dict(s.phases), buckets=list(s.buckets))
+                    for command, s in self._stats.items()}
+
+
+    def quantile(self, command: str, q: float) -> Optional[float]:
+        """Estimate of a wall time quantile (e.g. `0.99`) of a subcommand: the
+        upper bound of the bucket it falls in (the largest time seen, for the
+        last bucket). None if the subcommand never ran.
+        """
+        with self._lock:
+            stats = self._stats.get(command)
+            if stats is None or not stats.count:
+                return None
+            rank = q * stats.count
+            seen = 0
+            for bound, count in zip(self.buckets, stats.buckets):
+                seen += count
+                if seen >= rank and count:
+                    return min(bound, stats.max)
+            return stats.max
+
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+    def __repr__(self) -> str:
+        return f'HistogramCollector(commands={sorted(self._stats)})'
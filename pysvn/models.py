@@ -1,14 +1,46 @@
-from dataclasses import dataclass
+from dataclasses import dataclass as _dataclass, field, fields
 from datetime import datetime
 from enum import Enum, auto
-from typing import List
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from pysvn.constants import Depth, UpdateAction
+
+
+def _slotted_dataclass(cls: type) -> type:
+    """`dataclass(slots=True)` for Pythons before 3.10: the class is made again
+    with `__slots__` for its fields instead of class attributes for their defaults.
+    """
+    cls = _dataclass(cls)
+    namespace = dict(cls.__dict__)
+    names = tuple(f.name for f in fields(cls))
+    for name in names:
+        # the defaults live on in `__init__`
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+# models are created by the thousand for long histories: `__slots__` keeps them small
+dataclass = _dataclass(slots=True) if sys.version_info >= (3, 10) else _slotted_dataclass
+
+@dataclass
+class LogPath:
+    path: str
+    action: str
+    kind: str
+    copyfrom_path: str = None
+    copyfrom_revision: int = None
 
 @dataclass
 class LogEntry:
     message: str
     author: str
-    revision: str
+    revision: int
     date: datetime
+    paths: List[LogPath] = None
 
 @dataclass
 class SVNItemPath:
@@ -20,3 +52,160 @@ class SVNItemPath:
 @dataclass
 class Diff:
     paths: List[SVNItemPath]
+
+@dataclass
+class Hunk:
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+    lines: List[str]
+
+@dataclass
+class FileDiff:
+    path: str
+    hunks: List[Hunk]
+    binary: bool = False
+
+@dataclass
+class NumStat:
+    path: str
+    added: int
+    removed: int
+    binary: bool = False
+
+@dataclass
+class BlameLine:
+    line_number: int
+    revision: int
+    author: str
+    date: datetime
+
+@dataclass
+class Info:
+    path: str
+    kind: str
+    revision: int
+    url: str
+    relative_url: str
+    repository_root: str
+    uuid: str
+    last_changed_revision: int = None
+    last_changed_author: str = None
+    last_changed_date: datetime = None
+
+@dataclass
+class StatusEntry:
+    path: str
+    item: str
+    props: str
+    revision: int = None
+
+@dataclass
+class FleetResult:
+    path: str
+    result: Any = None
+    error: Exception = None
+    elapsed: float = 0.
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+@dataclass
+class CatResult:
+    path: str
+    destination: str
+    size: int = 0
+    error: Exception = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+@dataclass
+class RevisionChurn:
+    revision: int
+    author: str
+    date: datetime
+    paths: List[str]
+    stats: Optional[List[NumStat]]
+
+@dataclass
+class Churn:
+    path: str
+    commits: int = 0
+    added: int = 0
+    removed: int = 0
+    authors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def churn(self) -> int:
+        return self.added + self.removed
+
+@dataclass
+class SparseStep:
+    """`svn update --set-depth {depth} --parents {targets}`"""
+    depth: Depth
+    targets: List[str]
+
+@dataclass
+class UpdateEvent:
+    """One item line of `svn update`: the columns of its status and the path."""
+    path: str
+    action: Optional[UpdateAction]
+    property_action: Optional[UpdateAction]
+    lock_broken: bool
+    tree_conflict: bool
+
+@dataclass
+class UpdateRevision:
+    """Revision an update target (`path`) or an external reached."""
+    revision: int
+    path: Optional[str]
+    external: bool = False
+
+@dataclass
+class CommitResult:
+    revision: Optional[int]
+    output: str
+
+    @property
+    def committed(self) -> bool:
+        """False when there was nothing to commit (or svn's messages are translated)."""
+        return self.revision is not None
+
+@dataclass
+class SVNCapabilities:
+    """Version of the svn cli client and the options it supports. An unknown
+    version (None) is assumed to support everything.
+    """
+    version: Optional[Tuple[int, int, int]]
+
+    def at_least(self, major: int, minor: int, patch: int = 0) -> bool:
+        return self.version is None or self.version >= (major, minor, patch)
+
+    @property
+    def remove_unversioned(self) -> bool:
+        """`cleanup --remove-unversioned` and `--remove-ignored`"""
+        return self.at_least(1, 9)
+
+    @property
+    def vacuum_pristines(self) -> bool:
+        """`cleanup --vacuum-pristines` and `--include-externals`"""
+        return self.at_least(1, 9)
+
+    @property
+    def adds_as_modification(self) -> bool:
+        """`update --adds-as-modification`"""
+        return self.at_least(1, 9)
+
+    @property
+    def show_item(self) -> bool:
+        """`info --show-item`"""
+        return self.at_least(1, 9)
+
+    @property
+    def log_search(self) -> bool:
+        """`log --search`"""
+        return self.at_least(1, 8)
@@ -0,0 +1,70 @@
+'''pysvn log paging module.
+'''
+from typing import TYPE_CHECKING, Iterator, List
+
+from pysvn.models import LogEntry
+
+if TYPE_CHECKING:
+    from pysvn.client import Client
+
+
+class LogCursor:
+    """Walks the log of a repository (or of a single path) one page at a time, newest first.
+
+    Every page is a separate `svn log --limit` call that starts just below the
+    last revision returned by the previous page.
+    """
+    def __init__(self, client: 'Client', file: str = None, page_size: int = 50, after: int = None, end: int = 1) -> None:
+        """Walks the log of a repository (or of a single path) one page at a time, newest first.
+
+        Args:
+            client (Client): client used to run `svn log`.
+            file (str, optional): file to get logs for. Defaults to None.
+            page_size (int, optional): number of log entries per page. Defaults to 50.
+            after (int, optional): only return revisions older than this one. Defaults to None (start at `HEAD`).
+            end (int, optional): oldest revision to return. Defaults to 1.
+
+        Raises:
+            ValueError: page_size is not a positive number.
+        """
+        if page_size < 1:
+            raise ValueError('page_size must be a positive number')
+
+        self.client = client
+        self.file = file
+        self.page_size = page_size
+        self.end = end
+        self.last_revision = after
+        self.exhausted = after is not None and after - 1 < end
+
+
+    def next_page(self) -> List[LogEntry]:
+        """Fetch the next page of log entries.
+
+        Returns:
+            List[LogEntry]: up to `page_size` log entries, empty once the cursor is exhausted.
+        """
+        if self.exhausted:
+            return []
+
+        start = 'HEAD' if self.last_revision is None else self.last_revision - 1
+        page = self.client.log(self.file, revision=f'{start}:{self.end}', limit=self.page_size)
+
+        if len(page) < self.page_size:
+            self.exhausted = True
+        if page:
+            self.last_revision = page[-1].revision
+            if self.last_revision - 1 < self.end:
+                self.exhausted = True
+        return page
+
+
+    def __iter__(self) -> Iterator[List[LogEntry]]:
+        while not self.exhausted:
+            page = self.next_page()
+            if page:
+                yield page
+
+
+    def __repr__(self) -> str:
+        return f'LogCursor(file={self.file}, page_size={self.page_size}, last_revision={self.last_revision})'
@@ -0,0 +1,186 @@
+'''pysvn process output module.
+
+Collects the output of svn processes without deadlocking and without
+holding large outputs in memory: stderr is drained by a thread while
+stdout is read, stdout is spooled to a temporary file once it outgrows
+`SPILL_THRESHOLD`, and parsers read it back through a memory map.
+
+svn writes `--xml` output in UTF-8 (as its XML declaration says), which
+is left to the XML parser to decode; everything else it prints, errors
+included, is in the encoding of the locale (`output_encoding()`).
+'''
+import threading
+from typing import IO, Iterator, Tuple, Union
+
+from pysvn.errors import CommandTimeoutError
+
+# stdout beyond this many bytes is written to a temporary file
+SPILL_THRESHOLD = 8 * 2 ** 20
+
+# at most this much of stderr is kept (the end of it, where svn reports errors)
+STDERR_LIMIT = 2 ** 20
+
+CHUNK_SIZE = 2 ** 16
+
+
+def output_encoding() -> str:
+    """Encoding of svn's non-XML output: the encoding of the locale."""
+    import locale
+    return locale.getpreferredencoding(False)
+
+
+class CommandOutput:
+    """Captured stdout of an svn command, in memory while it is small and in a
+    temporary file, read back through a memory map, once it is not.
+
+    Close it (or use it as a context manager) once parsed.
+    """
+    def __init__(self, spill_threshold: int = SPILL_THRESHOLD) -> None:
+        import tempfile
+        self.spill_threshold = spill_threshold
+        self._file = tempfile.SpooledTemporaryFile(max_size=spill_threshold)
+        self._size = 0
+        self._buffer = None
+
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._size += len(data)
+
+
+    @property
+    def spilled(self) -> bool:
+        """True if the output was written to disk."""
+        return self._size > self.spill_threshold
+
+
+    def buffer(self) -> Union[bytes, 'mmap.mmap']:
+        """The whole output, as bytes when it was kept in memory, otherwise as a
+        read-only memory map of the temporary file.
+        """
+        if self._buffer is None:
+            if self.spilled:
+                import mmap
+                self._file.flush()
+                self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._file.seek(0)
+                self._buffer = self._file.read()
+        return self._buffer
+
+
+    def chunks(self, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """The output in pieces of at most `size` bytes."""
+        buffer = self.buffer()
+        for start in range(0, self._size, size):
+            yield buffer[start:start + size]
+
+
+    def text(self, encoding: str = None) -> str:
+        """The output decoded (with `output_encoding()` by default) and stripped."""
+        return bytes(self.buffer()).decode(encoding or output_encoding(), 'replace').strip()
+
+
+    def close(self) -> None:
+        if self._buffer is not None and not isinstance(self._buffer, bytes):
+            self._buffer.close()
+        self._buffer = None
+        self._file.close()
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __enter__(self) -> 'CommandOutput':
+        return self
+
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+    def __repr__(self) -> str:
+        return f'CommandOutput(size={self._size}, spilled={self.spilled})'
+
+
+class StderrDrain:
+    """Reads a process's stderr on a thread until it closes, keeping the last
+    `STDERR_LIMIT` bytes, so svn never blocks on a full stderr pipe while
+    stdout is being read.
+    """
+    def __init__(self, stream: IO[bytes], limit: int = STDERR_LIMIT) -> None:
+        self._stream = stream
+        self._limit = limit
+        self._data = bytearray()
+        self._thread = threading.Thread(target=self._run, name='pysvn-stderr', daemon=True)
+        self._thread.start()
+
+
+    def _run(self) -> None:
+        try:
+            for chunk in iter(lambda: self._stream.read1(CHUNK_SIZE), b''):
+                self._data += chunk
+                if len(self._data) > 2 * self._limit:
+                    del self._data[:-self._limit]
+        except (OSError, ValueError):
+            # the pipe was closed under us after the process was killed
+            pass
+
+
+    def result(self, timeout: float = None) -> bytes:
+        """Wait for stderr to close and return what was read."""
+        self._thread.join(timeout)
+        return bytes(self._data[-self._limit:])
+
+
+def capture_output(cmd: 'subprocess.Popen', timeout: float = None,
+                   spill_threshold: int = SPILL_THRESHOLD) -> Tuple[CommandOutput, bytes]:
+    """Wait for a process to finish, reading its stdout and stderr at the same time.
+
+    Args:
+        cmd (subprocess.Popen): process started with `stdout=PIPE, stderr=PIPE`.
+        timeout (float, optional): seconds before the process is killed. Defaults to None.
+        spill_threshold (int, optional): bytes of stdout kept in memory before spilling
+                                         to a temporary file. Defaults to `SPILL_THRESHOLD`.
+
+    Raises:
+        CommandTimeoutError: the process did not finish in time.
+
+    Returns:
+        Tuple[CommandOutput, bytes]: stdout, to be closed by the caller, and stderr
+    """
+    stderr = StderrDrain(cmd.stderr)
+    expired = threading.Event()
+    timer = None
+    if timeout is not None:
+        def expire() -> None:
+            expired.set()
+            cmd.kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+
+    stdout = CommandOutput(spill_threshold)
+    try:
+        for chunk in iter(lambda: cmd.stdout.read1(CHUNK_SIZE), b''):
+            stdout.write(chunk)
+        cmd.wait()
+        errors = stderr.result()
+    except BaseException:
+        stdout.close()
+        cmd.kill()
+        cmd.wait()
+        stderr.result()
+        raise
+    finally:
+        if timer is not None:
+            timer.cancel()
+        cmd.stdout.close()
+        cmd.stderr.close()
+
+    if expired.is_set():
+        stdout.close()
+        raise CommandTimeoutError(f'svn {" ".join(cmd.args[1:2])} did not finish within {timeout} seconds')
+    return stdout, errors
@@ -0,0 +1,79 @@
+'''pysvn retry module.
+'''
+from dataclasses import dataclass
+import time
+from typing import Any, Awaitable, Callable, Iterator, Tuple, Type
+
+from pysvn.errors import ERROR_CODES, LOCK_ERROR_CODES
+
+
+async def _sleep(delay: float) -> None:
+    # asyncio is only needed (and already loaded) when running in an event loop
+    import asyncio
+    await asyncio.sleep(delay)
+
+
+LOCK_ERRORS: Tuple[Type[Exception], ...] = tuple(ERROR_CODES[error_cd] for error_cd in LOCK_ERROR_CODES)
+
+
+@dataclass
+class RetryPolicy:
+    """When and how often to retry an svn command that failed on a working copy lock.
+
+    Delays grow exponentially from `base_delay` up to `max_delay`. With
+    `jitter`, each delay is picked at random from its upper half, so
+    clients contending for the same working copy don't retry in lockstep.
+    Only the exceptions in `retry_on` are retried; anything else is raised
+    right away.
+    """
+    attempts: int = 5
+    base_delay: float = .05
+    max_delay: float = 2.
+    jitter: bool = True
+    retry_on: Tuple[Type[Exception], ...] = LOCK_ERRORS
+
+    def delays(self) -> Iterator[float]:
+        """Delays to wait before each retry, one less than `attempts`."""
+        import random
+        for attempt in range(self.attempts - 1):
+            delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+            if self.jitter:
+                delay = random.uniform(delay / 2, delay)
+            yield delay
+
+
+    def call(self, func: Callable[[], Any]) -> Any:
+        """Call `func`, retrying it according to the policy.
+
+        Args:
+            func (Callable[[], Any]): function to call
+
+        Returns:
+            Any: what `func` returned
+        """
+        for delay in self.delays():
+            try:
+                return func()
+            except self.retry_on:
+                time.sleep(delay)
+        return func()
+
+
+    async def call_async(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await `func()`, retrying it according to the policy without blocking the event loop.
+
+        Args:
+            func (Callable[[], Awaitable[Any]]): coroutine function to call
+
+        Returns:
+            Any: what `func` returned
+        """
+        for delay in self.delays():
+            try:
+                return await func()
+            except self.retry_on:
+                await _sleep(delay)
+        return await func()
+
+
+NO_RETRY = RetryPolicy(attempts=1)
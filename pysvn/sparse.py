@@ -0,0 +1,237 @@
+'''pysvn sparse working copy module.
+
+A sparse spec lists the paths of a tree to check out, each with a
+`Depth`; everything else stays out of the working copy:
+
+    [('', Depth.FILES), ('src/core', Depth.INFINITY), ('docs', Depth.IMMEDIATES)]
+
+`plan_checkout` turns a spec into the depth of a first checkout and the
+`svn update --set-depth` steps that bring in the rest, with as few
+steps as the order of parents before children allows. `plan_reconcile`
+turns a working copy (the kind and depth `svn info` reports for each of
+its paths) and a new spec into the steps that exclude or trim what is no
+longer wanted and fetch what was added. Planning never runs svn;
+`Client.sparse_checkout` does.
+'''
+import os
+import posixpath
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from pysvn.constants import Depth
+from pysvn.models import SparseStep
+
+SparseSpec = Iterable[Tuple[str, Depth]]
+# kind (`'dir'` or `'file'`) and depth of each path of a working copy, `Depth.EXCLUDE` for excluded ones
+WorkingCopy = Dict[str, Tuple[str, Depth]]
+
+_ORDER = {Depth.EXCLUDE: -1, Depth.EMPTY: 0, Depth.FILES: 1, Depth.IMMEDIATES: 2, Depth.INFINITY: 3}
+
+
+def normalize_path(path: str) -> str:
+    """Spec path relative to the root of the checkout, `''` for the root itself."""
+    path = posixpath.normpath(path.replace(os.sep, '/')).strip('/')
+    return '' if path == '.' else path
+
+
+def _ancestors(path: str) -> List[str]:
+    """`'a/b/c'` -> `['', 'a', 'a/b']`"""
+    if not path:
+        return []
+    parts = path.split('/')
+    return [''] + ['/'.join(parts[:i]) for i in range(1, len(parts))]
+
+
+def _level(path: str) -> int:
+    return path.count('/') + 1 if path else 0
+
+
+def normalize(spec: Union[SparseSpec, Dict[str, Depth]]) -> Dict[str, Depth]:
+    """## Normalize a sparse spec.
+
+    Paths are made relative and `/`-separated, a path given twice keeps its
+    deepest depth, and entries already brought in by an ancestor (anything
+    below an `INFINITY` entry, directories at `EMPTY` right below an
+    `IMMEDIATES` one) are dropped.
+
+    Args:
+        spec (Iterable[Tuple[str, Depth]] | Dict[str, Depth]): paths and their depths.
+
+    Raises:
+        ValueError: `Depth.EXCLUDE` in a spec.
+
+    Returns:
+        Dict[str, Depth]: depth per path
+    """
+    items = spec.items() if isinstance(spec, dict) else spec
+    entries: Dict[str, Depth] = {}
+    for path, depth in items:
+        if depth == Depth.EXCLUDE:
+            raise ValueError('a sparse spec lists what to include, leave excluded paths out of it')
+        path = normalize_path(path)
+        if path not in entries or _ORDER[depth] > _ORDER[entries[path]]:
+            entries[path] = depth
+
+    normalized = {}
+    for path in sorted(entries, key=_level):
+        depth = entries[path]
+        ancestors = _ancestors(path)
+        if any(entries.get(ancestor) == Depth.INFINITY for ancestor in ancestors):
+            continue
+        if depth == Depth.EMPTY and ancestors and entries.get(ancestors[-1]) == Depth.IMMEDIATES:
+            continue
+        normalized[path] = depth
+    return normalized
+
+
+def required_depth(path: str, spec: Dict[str, Depth], is_dir: bool = True) -> Optional[Depth]:
+    """Depth a path has in a working copy made from a normalized spec, None if it is not in it."""
+    if path in spec:
+        return spec[path]
+    if not path:
+        # the root is always there
+        return Depth.EMPTY
+    ancestors = _ancestors(path)
+    if any(spec.get(ancestor) == Depth.INFINITY for ancestor in ancestors):
+        return Depth.INFINITY
+    parent_depth = spec.get(ancestors[-1])
+    if parent_depth == Depth.IMMEDIATES or (parent_depth == Depth.FILES and not is_dir):
+        return Depth.EMPTY
+    prefix = path + '/'
+    if any(other.startswith(prefix) for other in spec):
+        # made by `--parents` to reach an entry below
+        return Depth.EMPTY
+    return None
+
+
+def _group(entries: Dict[str, Depth]) -> List[SparseStep]:
+    """Few `update --set-depth` steps for entries, every path after its ancestors.
+
+    Setting a directory's depth can trim what lies below it, so an entry
+    must not come before those above it (svn handles the targets of one
+    step in order, so the same step will do). Entries are first placed as
+    early as their ancestors allow, then moved as late as their
+    descendants allow, into the steps of their depth.
+    """
+    order = sorted(entries, key=lambda p: (_level(p), p))
+    steps: List[Depth] = []
+    placed: Dict[str, int] = {}
+    for path in order:
+        depth = entries[path]
+        after = max((placed[ancestor] for ancestor in _ancestors(path) if ancestor in placed), default=0)
+        index = next((i for i in range(len(steps) - 1, after - 1, -1) if steps[i] == depth), None)
+        if index is None:
+            steps.append(depth)
+            index = len(steps) - 1
+        placed[path] = index
+
+    below: Dict[str, int] = {}
+    for path in reversed(order):
+        limit = below.get(path, len(steps) - 1)
+        index = next(i for i in range(limit, placed[path] - 1, -1) if steps[i] == entries[path])
+        placed[path] = index
+        for ancestor in _ancestors(path):
+            below[ancestor] = min(below.get(ancestor, len(steps) - 1), index)
+
+    grouped = [SparseStep(depth=depth, targets=[]) for depth in steps]
+    for path in order:
+        grouped[placed[path]].targets.append(path or '.')
+    return [step for step in grouped if step.targets]
+
+
+def plan_checkout(spec: Union[SparseSpec, Dict[str, Depth]]) -> Tuple[Depth, List[SparseStep]]:
+    """## Plan a sparse checkout.
+
+    Args:
+        spec (Iterable[Tuple[str, Depth]] | Dict[str, Depth]): paths and their depths.
+
+    Returns:
+        Tuple[Depth, List[SparseStep]]: depth of the checkout of the root, then the `update --set-depth
+                                        --parents` steps for the other entries, in order.
+    """
+    entries = normalize(spec)
+    root_depth = entries.pop('', Depth.EMPTY)
+    return root_depth, _group(entries)
+
+
+def _below(path: str, directory: str) -> bool:
+    return path != directory and (not directory or path.startswith(directory + '/'))
+
+
+def _covers(depth: Depth, directory: str, path: str, kind: str) -> bool:
+    """Whether a path below a directory is still there after `update --set-depth depth directory`."""
+    if depth == Depth.INFINITY:
+        return True
+    if depth in (Depth.EMPTY, Depth.EXCLUDE) or _level(path) > _level(directory) + 1:
+        return False
+    return depth == Depth.IMMEDIATES or (depth == Depth.FILES and kind == 'file')
+
+
+def plan_reconcile(working_copy: WorkingCopy, spec: Union[SparseSpec, Dict[str, Depth]]) -> List[SparseStep]:
+    """## Plan the change of a sparse working copy to a new spec.
+
+    Paths the spec no longer wants are excluded and directories that got
+    shallower (the root included) are set to their new depth first, then
+    what the spec adds is fetched; what the working copy already has is
+    left alone. svn removes everything below a directory whose depth is
+    lowered that the new depth doesn't cover, so a directory with entries
+    to keep further down keeps its depth, and what it no longer covers is
+    excluded path by path instead (an update can then still bring in what
+    is later added to it in the repository).
+
+    Args:
+        working_copy (Dict[str, Tuple[str, Depth]]): kind (`'dir'` or `'file'`) and depth of each path of the
+                                                     working copy, relative to its root, excluded paths
+                                                     included, as `svn info --depth infinity` reports them.
+        spec (Iterable[Tuple[str, Depth]] | Dict[str, Depth]): spec to reach.
+
+    Returns:
+        List[SparseStep]: `update --set-depth` steps, in order.
+    """
+    spec = normalize(spec)
+    state = {normalize_path(path): entry for path, entry in working_copy.items()}
+    # what the spec keeps or adds, with the directories leading to it
+    wanted = set(spec).union(*(_ancestors(path) for path in spec))
+    trims: Dict[str, Depth] = {}
+
+    def current(path: str) -> Optional[Depth]:
+        """Depth of a path once the trims planned so far are done, None if it isn't there."""
+        kind, depth = state.get(path, ('', Depth.EXCLUDE))
+        if depth == Depth.EXCLUDE:
+            return None
+        ancestors = _ancestors(path)
+        if any(ancestor in trims and not _covers(trims[ancestor], ancestor, path, kind) for ancestor in ancestors):
+            return None
+        if path in trims:
+            return trims[path]
+        if ancestors and trims.get(ancestors[-1]) == Depth.IMMEDIATES and kind == 'dir':
+            return Depth.EMPTY
+        return depth
+
+    for path in sorted(state, key=lambda p: (_level(p), p)):
+        depth = current(path)
+        if depth is None:
+            continue
+        kind = state[path][0]
+        target = required_depth(path, spec, kind == 'dir')
+        if target is None:
+            trims[path] = Depth.EXCLUDE
+        elif kind == 'dir' and _ORDER[target] < _ORDER[depth]:
+            if any(_below(other, path) and current(other) is not None
+                   and not _covers(target, path, other, state[other][0]) for other in wanted):
+                # lowering it would take out entries to keep; its children are trimmed instead
+                continue
+            trims[path] = target
+
+    additions = {}
+    for path, depth in spec.items():
+        have = current(path)
+        if have is None or (state[path][0] == 'dir' and _ORDER[depth] > _ORDER[have]):
+            additions[path] = depth
+    for path, (kind, depth) in state.items():
+        # excluded by an earlier reconcile, and wanted again without being listed
+        if depth == Depth.EXCLUDE and path not in additions and path \
+                and current(_ancestors(path)[-1]) is not None:
+            target = required_depth(path, spec, kind == 'dir')
+            if target is not None:
+                additions[path] = target
+    return _group(trims) + _group(additions)
@@ -0,0 +1,115 @@
+'''pysvn unified diff module.
+
+Incremental parsers for the output of `svn diff`. Both work on an iterable
+of raw output lines (e.g. the stdout pipe of svn), so a diff of any size
+is processed one line at a time.
+'''
+import re
+from typing import Iterable, Iterator, List, Optional
+
+from pysvn.models import FileDiff, Hunk, NumStat
+
+
+RE_HUNK_HEADER = re.compile(rb'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+INDEX_PREFIX = b'Index: '
+# printed untranslated for files svn won't diff, whatever the locale
+BINARY_MARKER = b'svn:mime-type = '
+
+
+def _hunk_header(line: bytes) -> Optional[List[int]]:
+    match = RE_HUNK_HEADER.match(line)
+    if not match:
+        return None
+    old_start, old_count, new_start, new_count = match.groups()
+    return [int(old_start), int(old_count) if old_count is not None else 1,
+            int(new_start), int(new_count) if new_count is not None else 1]
+
+
+def _iter_sections(lines: Iterable[bytes], encoding: str, keep_lines: bool) -> Iterator[tuple]:
+    """Walk the output once, yielding `(path, binary, hunks, added, removed)` per file.
+
+    Hunk bodies are tracked by their line counts, so content lines that
+    happen to look like headers are never mistaken for them.
+    """
+    path = None
+    binary = False
+    hunks: List[Hunk] = []
+    added = removed = 0
+    old_left = new_left = 0
+    hunk_lines: List[str] = None
+
+    for line in lines:
+        if old_left > 0 or new_left > 0:
+            marker = line[:1]
+            if marker == b'+':
+                new_left -= 1
+                added += 1
+            elif marker == b'-':
+                old_left -= 1
+                removed += 1
+            elif marker == b'\\':
+                pass
+            else:
+                old_left -= 1
+                new_left -= 1
+            if keep_lines:
+                hunk_lines.append(line.rstrip(b'\r\n').decode(encoding, 'surrogateescape'))
+            continue
+
+        if line.startswith(INDEX_PREFIX):
+            if path is not None:
+                yield path, binary, hunks, added, removed
+            path = line[len(INDEX_PREFIX):].rstrip(b'\r\n').decode(encoding, 'surrogateescape')
+            binary = False
+            hunks = []
+            added = removed = 0
+        elif path is None:
+            continue
+        elif line.startswith(b'@@ '):
+            header = _hunk_header(line)
+            if header is None:
+                continue
+            old_left, new_left = header[1], header[3]
+            if keep_lines:
+                hunk_lines = []
+                hunks.append(Hunk(*header, lines=hunk_lines))
+        elif line.startswith(BINARY_MARKER):
+            binary = True
+
+    if path is not None:
+        yield path, binary, hunks, added, removed
+
+
+def iter_file_diffs(lines: Iterable[bytes], encoding: str = 'utf-8') -> Iterator[FileDiff]:
+    """Parse `svn diff` output into one `FileDiff` per file, as each file ends.
+
+    Property changes are skipped; binary files are reported without hunks.
+
+    Args:
+        lines (Iterable[bytes]): raw output lines
+        encoding (str, optional): encoding to decode paths and lines with. Defaults to 'utf-8'.
+
+    Yields:
+        FileDiff: per-file diffs, in output order
+    """
+    for path, binary, hunks, _, _ in _iter_sections(lines, encoding, keep_lines=True):
+        yield FileDiff(path=path, hunks=hunks, binary=binary)
+
+
+def iter_numstat(lines: Iterable[bytes], encoding: str = 'utf-8') -> Iterator[NumStat]:
+    """Count added and removed lines per file in `svn diff` output, without
+    keeping any of the diff content.
+
+    Args:
+        lines (Iterable[bytes]): raw output lines
+        encoding (str, optional): encoding to decode paths with. Defaults to 'utf-8'.
+
+    Yields:
+        NumStat: per-file line counts (None for binary files), in output order
+    """
+    for path, binary, _, added, removed in _iter_sections(lines, encoding, keep_lines=False):
+        if binary:
+            yield NumStat(path=path, added=None, removed=None, binary=True)
+        else:
+            yield NumStat(path=path, added=added, removed=removed)
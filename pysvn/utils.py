@@ -1,9 +1,30 @@
 '''pysvn utilities module.
 '''
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+import os
+import shutil
 import subprocess
-import sys
-from typing import List, Tuple
-from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from pysvn.models import SVNCapabilities
+from pysvn.process import capture_output, output_encoding
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+
+@lru_cache(maxsize=None)
+def find_svn() -> Optional[str]:
+    """Locate the svn cli client on PATH. The result is cached for the life of
+    the process; call `find_svn.cache_clear()` after changing PATH.
+
+    Returns:
+        str | None: path of the svn executable, or None if it's not installed
+    """
+    return shutil.which('svn')
+
 
 def check_svn_installed() -> bool:
     """Check if the current system has the svn cli client installed.
@@ -11,11 +32,28 @@ def check_svn_installed() -> bool:
     Returns:
         bool: True if svn is installed, otherwise False
     """
+    return find_svn() is not None
+
+
+@lru_cache(maxsize=None)
+def svn_capabilities() -> SVNCapabilities:
+    """Version of the svn cli client and the options it supports, probed with
+    `svn --version --quiet` once per process.
+
+    Returns:
+        SVNCapabilities: version and supported options
+    """
+    import re
+    version = None
     try:
-        subprocess.run('svn', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return True
-    except FileNotFoundError:
-        return False
+        output = subprocess.run([find_svn() or 'svn', '--version', '--quiet'],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout
+        match = re.match(r'(\d+)\.(\d+)(?:\.(\d+))?', output.decode(output_encoding(), 'replace').strip())
+        if match:
+            version = tuple(int(part or 0) for part in match.groups())
+    except OSError:
+        pass
+    return SVNCapabilities(version)
 
 
 def get_longest_line_len(lines: List[str]) -> int:
@@ -26,15 +64,115 @@ def get_longest_line_len(lines: List[str]) -> int:
     return longest_len
 
 
-def get_output(cmd: subprocess.Popen) -> Tuple[str, str]:
-    """Get stdout and stderr from a finished process.
+def parse_svn_date(date: Optional[str]) -> Optional[datetime]:
+    """Parse a date as svn prints it in xml output (e.g. `2022-04-26T10:00:00.123456Z`).
+
+    Args:
+        date (str | None): svn date string
+
+    Returns:
+        datetime | None: date, to the second, or None if no date was given
+    """
+    if not date:
+        return None
+    date_str = date.split('.', 1)[0]
+    return datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S')
+
+
+@contextmanager
+def targets_file(targets: Iterable[str]) -> Iterator[str]:
+    """Write paths to a temporary file for svn's `--targets` option, which
+    avoids command line length limits.
+
+    Args:
+        targets (Iterable[str]): paths or URLs, one per line
+
+    Yields:
+        str: path of the temporary file, removed afterwards
+    """
+    import tempfile
+    fd, path = tempfile.mkstemp(prefix='pysvn-', suffix='.targets')
+    try:
+        # svn reads the file in the native encoding, like its command line
+        with os.fdopen(fd, 'w', encoding=output_encoding()) as f:
+            for target in targets:
+                f.write(f'{target}\n')
+        yield path
+    finally:
+        os.remove(path)
+
+
+def iter_ordered(function: Callable[[_T], _R], items: Iterable[_T], max_workers: int,
+                 window: int = None) -> Iterator[Tuple[_T, _R]]:
+    """Run `function` on items on a thread pool and yield `(item, result)` in
+    the order of `items`, as soon as each result and those before it are ready.
+
+    Items are taken from `items` only as the window allows, so at most
+    `window` results (default: twice `max_workers`) are running or waiting
+    to be consumed. An exception raised by `function` is raised when its
+    item's turn comes. Stopping the iteration cancels the work not started.
+
+    Args:
+        function (Callable[[T], R]): work for one item, run in a worker thread.
+        items (Iterable[T]): inputs, consumed lazily.
+        max_workers (int): number of threads.
+        window (int, optional): items in flight. Defaults to `2 * max_workers`.
+
+    Yields:
+        Tuple[T, R]: each item with its result
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    window = window or 2 * max_workers
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pysvn') as executor:
+        try:
+            for item in items:
+                pending.append((item, executor.submit(function, item)))
+                if len(pending) >= window:
+                    item, future = pending.popleft()
+                    yield item, future.result()
+            while pending:
+                item, future = pending.popleft()
+                yield item, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def get_raw_output(cmd: subprocess.Popen, timeout: float = None) -> Tuple[bytes, bytes]:
+    """Wait for a process to finish and get its stdout and stderr, undecoded.
+    Both are read at the same time, so neither pipe can fill up and block svn.
 
     Args:
         cmd (subprocess.Popen): process
+        timeout (float, optional): seconds to wait before killing the process. Defaults to None.
+
+    Raises:
+        CommandTimeoutError: the process did not finish in time.
+
+    Returns:
+        Tuple[bytes, bytes]: stdout, stderr
+    """
+    stdout, stderr = capture_output(cmd, timeout)
+    with stdout:
+        return bytes(stdout.buffer()), stderr
+
+
+def get_output(cmd: subprocess.Popen, timeout: float = None) -> Tuple[str, str]:
+    """Wait for a process to finish and get its stdout and stderr, decoded
+    with the encoding svn writes them in (`output_encoding()`).
+
+    Args:
+        cmd (subprocess.Popen): process
+        timeout (float, optional): seconds to wait before killing the process. Defaults to None.
+
+    Raises:
+        CommandTimeoutError: the process did not finish in time.
 
     Returns:
         Tuple[str, str]: stdout, stderr
     """
-    stdout = cmd.stdout.read().decode(sys.getdefaultencoding()).strip()
-    stderr = cmd.stderr.read().decode(sys.getdefaultencoding()).strip()
-    return stdout, stderr
+    stdout, stderr = get_raw_output(cmd, timeout)
+    encoding = output_encoding()
+    return stdout.decode(encoding, 'replace').strip(), stderr.decode(encoding, 'replace').strip()
@@ -0,0 +1,293 @@
+'''pysvn working copy database module.
+
+Read-only access to the SQLite database (`.svn/wc.db`) in which svn keeps
+the working copy metadata, to answer local `status` and `info` questions
+without running svn. Anything this module can't answer with certainty is
+reported back so the caller can ask svn instead.
+'''
+from datetime import datetime, timedelta
+import os
+import sqlite3
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+from pysvn.models import Info, StatusEntry
+
+
+# wc.db formats written by Subversion 1.7 (29) and 1.8 to 1.14 (31)
+SUPPORTED_FORMATS = (29, 31)
+
+# characters svn leaves unescaped in URLs
+_URL_SAFE = "!$&'()*+,/:;=@~"
+
+_EMPTY_PROPS = (None, b'()', '()')
+
+
+def _relpath_depth(relpath: str) -> int:
+    return relpath.count('/') + 1 if relpath else 0
+
+
+def _apr_time(value: Optional[int]) -> Optional[datetime]:
+    if not value:
+        return None
+    return (datetime(1970, 1, 1) + timedelta(microseconds=value)).replace(microsecond=0)
+
+
+class _Node:
+    __slots__ = ('relpath', 'op_depth', 'presence', 'kind', 'revision', 'repos_path',
+                 'translated_size', 'last_mod_time', 'properties', 'file_external')
+
+    def __init__(self, row: tuple) -> None:
+        (self.relpath, self.op_depth, self.presence, self.kind, self.revision, self.repos_path,
+         self.translated_size, self.last_mod_time, self.properties, self.file_external) = row
+
+
+class WorkingCopyDB:
+    """Read-only view of a working copy's `.svn/wc.db`.
+
+    Use `WorkingCopyDB.find(path)` to locate the database of the working
+    copy containing a path; it returns None when there is none or its
+    format is not one this module knows.
+    """
+    def __init__(self, root: str) -> None:
+        """Read-only view of a working copy's `.svn/wc.db`.
+
+        Args:
+            root (str): working copy root directory (the one containing `.svn`).
+
+        Raises:
+            sqlite3.Error: the database can't be opened.
+        """
+        self.root = root
+        db_path = os.path.join(root, '.svn', 'wc.db')
+        self._conn = sqlite3.connect(f'file:{quote(db_path)}?mode=ro', uri=True)
+        self.format = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        self._wc_id = None
+        if self.format in SUPPORTED_FORMATS:
+            row = self._conn.execute('SELECT id FROM wcroot WHERE local_abspath IS NULL OR local_abspath = ?',
+                                     (root,)).fetchone()
+            self._wc_id = row[0] if row else None
+
+
+    @classmethod
+    def find(cls, path: str) -> Optional['WorkingCopyDB']:
+        """Database of the working copy containing `path`, if it can be read."""
+        current = os.path.abspath(path)
+        while True:
+            if os.path.isfile(os.path.join(current, '.svn', 'wc.db')):
+                try:
+                    db = cls(current)
+                except sqlite3.Error:
+                    return None
+                return db if db.supported else None
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+
+
+    @property
+    def supported(self) -> bool:
+        return self.format in SUPPORTED_FORMATS and self._wc_id is not None
+
+
+    def relpath(self, path: str) -> Optional[str]:
+        """Path relative to the working copy root, as stored in the database, or
+        None if `path` is outside the working copy.
+        """
+        relpath = os.path.relpath(os.path.abspath(path), self.root)
+        if relpath == '.':
+            return ''
+        if relpath.startswith('..'):
+            return None
+        return relpath.replace(os.sep, '/')
+
+
+    def is_busy(self) -> bool:
+        """True if an operation holds a lock or left unfinished work behind."""
+        locks = self._conn.execute('SELECT COUNT(*) FROM wc_lock WHERE wc_id = ?', (self._wc_id,)).fetchone()[0]
+        work = self._conn.execute('SELECT COUNT(*) FROM work_queue').fetchone()[0]
+        return bool(locks or work)
+
+
+    def has_externals(self) -> bool:
+        return bool(self._conn.execute('SELECT COUNT(*) FROM externals WHERE wc_id = ?',
+                                       (self._wc_id,)).fetchone()[0])
+
+
+    def info(self, relpath: str) -> Optional[Info]:
+        """Info of a node as `svn info` reports it, or None if the node is not a
+        plain unmodified-structure node (added, deleted, missing from the database...).
+        """
+        row = self._conn.execute(
+            'SELECT n.op_depth, n.presence, n.kind, n.revision, n.repos_path, n.changed_revision, '
+            'n.changed_date, n.changed_author, r.root, r.uuid '
+            'FROM nodes n JOIN repository r ON r.id = n.repos_id '
+            'WHERE n.wc_id = ? AND n.local_relpath = ? ORDER BY n.op_depth DESC LIMIT 1',
+            (self._wc_id, relpath)).fetchone()
+        if row is None:
+            return None
+        op_depth, presence, kind, revision, repos_path, changed_revision, changed_date, changed_author, root, uuid = row
+        if op_depth != 0 or presence != 'normal':
+            return None
+
+        escaped = quote(repos_path, safe=_URL_SAFE)
+        return Info(
+            path=None,
+            kind='dir' if kind == 'dir' else 'file',
+            revision=revision,
+            url=f'{root}/{escaped}' if repos_path else root,
+            relative_url=f'^/{escaped}',
+            repository_root=root,
+            uuid=uuid,
+            last_changed_revision=changed_revision,
+            last_changed_author=changed_author,
+            last_changed_date=_apr_time(changed_date)
+        )
+
+
+    def status(self, relpath: str) -> Optional[Tuple[List[StatusEntry], Set[str]]]:
+        """Versioned changes at or below a node, like `svn status --quiet`.
+
+        Files whose size matches the recorded one but whose timestamp
+        doesn't, conflicts, switched nodes and files inside copies can't be
+        judged from the database alone; they are returned separately so
+        they can be checked with svn.
+
+        Args:
+            relpath (str): node to start from, relative to the working copy root.
+
+        Returns:
+            Tuple[List[StatusEntry], Set[str]] | None: changed nodes (with paths relative to the
+                                                       working copy root) and undecided relpaths,
+                                                       or None if the node is not versioned.
+        """
+        nodes: Dict[str, List[_Node]] = {}
+        prefix = relpath + '/' if relpath else ''
+        for row in self._conn.execute(
+                'SELECT local_relpath, op_depth, presence, kind, revision, repos_path, translated_size, '
+                'last_mod_time, properties, file_external FROM nodes '
+                'WHERE wc_id = ? AND (local_relpath = ? OR substr(local_relpath, 1, ?) = ?) '
+                'ORDER BY local_relpath, op_depth',
+                (self._wc_id, relpath, len(prefix), prefix)):
+            node = _Node(row)
+            nodes.setdefault(node.relpath, []).append(node)
+        if relpath not in nodes:
+            return None
+
+        actual_props, conflicted = self._actual_nodes(relpath, prefix)
+
+        entries: List[StatusEntry] = []
+        undecided: Set[str] = set()
+        for node_relpath, layers in nodes.items():
+            base = layers[0] if layers[0].op_depth == 0 else None
+            top = layers[-1]
+            if node_relpath in conflicted or top.file_external:
+                undecided.add(node_relpath)
+                continue
+            if base is top and node_relpath and not self._follows_parent(node_relpath, base, nodes):
+                # switched nodes are shown by `svn status --quiet` even when unmodified
+                undecided.add(node_relpath)
+                continue
+
+            item = self._item(node_relpath, base, top)
+            if item == 'undecided':
+                undecided.add(node_relpath)
+                continue
+            if item is None:
+                continue
+
+            props = 'none'
+            if node_relpath in actual_props and actual_props[node_relpath] != top.properties:
+                props = 'modified'
+            elif top.properties not in _EMPTY_PROPS:
+                props = 'normal'
+
+            if item == 'normal' and props != 'modified':
+                continue
+            revision = base.revision if base is not None and (top is base or item == 'deleted') else None
+            entries.append(StatusEntry(path=node_relpath, item=item, props=props, revision=revision))
+
+        return entries, undecided
+
+
+    def _item(self, relpath: str, base: Optional[_Node], top: _Node) -> Optional[str]:
+        """Status of a node's text, None for nodes `svn status` doesn't show,
+        `'undecided'` when the database alone can't tell.
+        """
+        if top.op_depth > 0:
+            if top.presence == 'base-deleted':
+                return 'deleted'
+            if top.presence not in ('normal', 'incomplete'):
+                return None
+            if top.op_depth == _relpath_depth(relpath):
+                item = 'replaced' if base is not None and base.presence == 'normal' else 'added'
+            else:
+                item = None  # inside a copy, compare with the copied text below
+        else:
+            if top.presence == 'incomplete':
+                return 'incomplete'
+            if top.presence != 'normal':
+                return None
+            item = None
+
+        local_path = os.path.join(self.root, relpath)
+        try:
+            st = os.lstat(local_path)
+        except FileNotFoundError:
+            return 'missing'
+
+        is_dir = os.path.isdir(local_path)
+        if (top.kind == 'dir') != is_dir:
+            return 'obstructed'
+        if item is not None:
+            return item
+        if top.kind == 'dir':
+            return 'normal'
+        if top.kind != 'file' or top.translated_size is None:
+            return 'undecided'
+
+        if st.st_size != top.translated_size:
+            return 'modified'
+        if st.st_mtime_ns // 1000 == top.last_mod_time:
+            return 'normal'
+        # same size, different timestamp: only comparing the contents can tell
+        return 'undecided'
+
+
+    @staticmethod
+    def _follows_parent(relpath: str, node: _Node, nodes: Dict[str, List[_Node]]) -> bool:
+        parent_relpath, _, name = relpath.rpartition('/')
+        parent_layers = nodes.get(parent_relpath)
+        if not parent_layers or parent_layers[0].op_depth != 0:
+            return True
+        parent = parent_layers[0]
+        expected = f'{parent.repos_path}/{name}' if parent.repos_path else name
+        return node.repos_path == expected
+
+
+    def _actual_nodes(self, relpath: str, prefix: str) -> Tuple[Dict[str, bytes], Set[str]]:
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(actual_node)')}
+        conflict_columns = [c for c in ('conflict_old', 'conflict_new', 'conflict_working', 'prop_reject',
+                                        'tree_conflict_data', 'conflict_data') if c in columns]
+        conflict_expr = ' OR '.join(f'{c} IS NOT NULL' for c in conflict_columns) or '0'
+
+        actual_props: Dict[str, bytes] = {}
+        conflicted: Set[str] = set()
+        for node_relpath, properties, has_conflict in self._conn.execute(
+                f'SELECT local_relpath, properties, ({conflict_expr}) FROM actual_node '
+                f'WHERE wc_id = ? AND (local_relpath = ? OR substr(local_relpath, 1, ?) = ?)',
+                (self._wc_id, relpath, len(prefix), prefix)):
+            if properties is not None:
+                actual_props[node_relpath] = properties
+            if has_conflict:
+                conflicted.add(node_relpath)
+        return actual_props, conflicted
+
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+    def __repr__(self) -> str:
+        return f'WorkingCopyDB(root={self.root}, format={self.format})'
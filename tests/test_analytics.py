@@ -0,0 +1,56 @@
+from datetime import datetime
+import threading
+import pytest
+from pysvn import Client, LogEntry, LogPath, NumStat
+from pysvn.analytics import ChurnReport, iter_revision_churn
+
+def _entry(revision, author, *paths):
+    return LogEntry(message='', author=author, revision=revision, date=datetime(2022, 1, revision),
+                    paths=[LogPath(path=path, action='M', kind='dir' if path.endswith('/') else 'file')
+                           for path in paths])
+
+ENTRIES = [
+    _entry(1, 'alice', '/trunk/core/a.c', '/trunk/core/b.c'),
+    _entry(2, 'bob', '/trunk/core/a.c', '/branches/x/a.c'),
+    _entry(3, 'bob', '/trunk/docs/'),
+    _entry(4, 'carol', '/trunk/core/sub/c.c'),
+]
+
+def _numstat(revision):
+    return [NumStat(path='core/a.c', added=revision, removed=1), NumStat(path='core/b.c', added=None, removed=None,
+                                                                        binary=True)]
+
+def test_revisions_in_order():
+    seen = []
+    lock = threading.Lock()
+
+    def numstat(revision):
+        with lock:
+            seen.append(revision)
+        return _numstat(revision)
+
+    revisions = list(iter_revision_churn(ENTRIES, '/trunk', numstat, max_workers=3))
+    assert [revision.revision for revision in revisions] == [1, 2, 3, 4]
+    assert revisions[1].paths == ['core/a.c']
+    # nothing to diff in a revision that only changed a directory
+    assert revisions[2].paths == [] and revisions[2].stats == []
+    assert sorted(seen) == [1, 2, 4]
+
+def test_report_totals():
+    report = ChurnReport()
+    for revision in iter_revision_churn(ENTRIES, '/trunk', _numstat, max_workers=2):
+        report.add(revision)
+    a = report.files['core/a.c']
+    assert (a.commits, a.added, a.removed, a.authors) == (2, 3, 2, {'alice': 1, 'bob': 1})
+    core = report.directories['core']
+    assert (core.commits, core.added, core.removed) == (3, 3, 2)
+    assert [churn.path for churn in report.hotspots(2)] == ['core/a.c', 'core/b.c']
+    assert report.hotspots(1, by='authors', directories=True)[0].path == 'core'
+    with pytest.raises(ValueError):
+        report.hotspots(by='lines')
+
+def test_churn():
+    svn = Client(repository_dir='./tests/test_svn')
+    report = svn.churn(1)
+    assert report.revisions == len(svn.log())
+    assert all(churn.commits > 0 for churn in report.hotspots())
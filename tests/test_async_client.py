@@ -0,0 +1,52 @@
+import asyncio
+import pysvn
+import pytest
+
+def _run(coro):
+    # asyncio.run needs Python 3.7
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+def _client(max_concurrency=4):
+    return pysvn.AsyncClient(repository_dir='./tests/test_svn', max_concurrency=max_concurrency)
+
+def test_async_log():
+    logs = _run(_client().log())
+    assert len(logs) > 0
+
+def test_async_log_concurrent():
+    svn = _client()
+    async def run():
+        return await asyncio.gather(*[svn.log(revision='1:3') for _ in range(8)])
+    results = _run(run())
+    assert all(logs == results[0] for logs in results)
+
+def test_async_client_reused_across_loops():
+    svn = _client(max_concurrency=1)
+    async def hold():
+        async with svn._slot():
+            await asyncio.sleep(0.01)
+    async def run():
+        await asyncio.gather(hold(), hold(), hold())
+    _run(run())
+    _run(run())
+
+def test_async_log_error():
+    with pytest.raises(pysvn.NoSuchRevisionError):
+        _run(_client().log(revision='1:999'))
+
+def test_async_diff():
+    diff = _run(_client().diff(1, 3))
+    assert len(diff.paths) > 0
+
+def test_async_update():
+    output = _run(_client().update())
+    assert 'At revision' in output or 'Updated to' in output
+
+def test_async_cleanup():
+    _run(_client().cleanup())
@@ -0,0 +1,67 @@
+import subprocess
+import pysvn
+import pytest
+
+pytest.importorskip('svn.client')
+
+
+@pytest.fixture(scope='module')
+def working_copy(tmp_path_factory):
+    base = tmp_path_factory.mktemp('bindings')
+    repo = base / 'repo'
+    wc = base / 'wc'
+    subprocess.run(['svnadmin', 'create', str(repo)], check=True)
+    subprocess.run(['svn', 'checkout', repo.as_uri(), str(wc)], check=True, stdout=subprocess.PIPE)
+    svn = pysvn.Client(repository_dir=str(wc))
+    for i in range(3):
+        with open(wc / 'hello.txt', 'a') as f:
+            f.write(f'line {i}\n')
+        if i == 0:
+            subprocess.run(['svn', 'add', 'hello.txt'], cwd=str(wc), check=True, stdout=subprocess.PIPE)
+        svn.commit(f'commit {i}')
+    svn.update()
+    return str(wc)
+
+
+def test_bindings_log(working_copy):
+    cli = pysvn.Client(repository_dir=working_copy)
+    svn = pysvn.Client(repository_dir=working_copy, use_bindings=True)
+    assert svn._bindings is not None
+    assert svn.log() == cli.log()
+    assert svn.log('hello.txt', revision='1:2', verbose=True) == cli.log('hello.txt', revision='1:2', verbose=True)
+
+def test_bindings_log_error(working_copy):
+    svn = pysvn.Client(repository_dir=working_copy, use_bindings=True)
+    with pytest.raises(pysvn.NoSuchRevisionError):
+        svn.log(revision='1:999')
+
+def test_bindings_info(working_copy, monkeypatch):
+    # without the working copy database, so that info goes to the bindings and to svn
+    cli = pysvn.Client(repository_dir=working_copy, use_wc_db=False)
+    svn = pysvn.Client(repository_dir=working_copy, use_bindings=True, use_wc_db=False)
+    calls = []
+    info = svn._bindings.info
+    monkeypatch.setattr(svn._bindings, 'info', lambda *args: calls.append(args) or info(*args))
+    assert svn.info('hello.txt') == cli.info('hello.txt')
+    assert calls
+
+def test_bindings_diff(working_copy):
+    cli = pysvn.Client(repository_dir=working_copy)
+    svn = pysvn.Client(repository_dir=working_copy, use_bindings=True)
+    assert svn.diff(1, 3) == cli.diff(1, 3)
+
+def test_bindings_update(working_copy):
+    svn = pysvn.Client(repository_dir=working_copy, use_bindings=True)
+    assert 'At revision 3.' in svn.update()
+
+def test_bindings_update_depth_not_sticky(working_copy):
+    def recorded_depth():
+        return subprocess.run(['svn', 'info', '--show-item', 'depth', working_copy], check=True,
+                              stdout=subprocess.PIPE, universal_newlines=True).stdout.strip()
+
+    svn = pysvn.Client(repository_dir=working_copy, use_bindings=True)
+    svn.update(depth=pysvn.Depth.EMPTY)
+    assert recorded_depth() == 'infinity'
+    svn.update(set_depth=pysvn.Depth.FILES)
+    assert recorded_depth() == 'files'
+    svn.update(set_depth=pysvn.Depth.INFINITY)
@@ -0,0 +1,34 @@
+import pysvn
+import pytest
+
+svn = pysvn.Client(repository_dir='./tests/test_svn')
+cached = pysvn.Client(repository_dir='./tests/test_svn', blame_cache=pysvn.BlameCache())
+
+def test_blame():
+    lines = svn.blame('hello.txt')
+    assert len(lines) > 0
+    assert all(line.revision is None or line.revision > 0 for line in lines)
+
+def test_blame_revision():
+    lines = svn.blame('hello.txt', revision=pysvn.Revision.HEAD)
+    assert len(lines) > 0
+
+def test_blame_cache():
+    assert cached.blame('hello.txt', revision=pysvn.Revision.HEAD) == svn.blame('hello.txt', revision=pysvn.Revision.HEAD)
+    cached.blame('hello.txt', revision=pysvn.Revision.HEAD)
+    assert cached.blame_cache.hits == 1
+
+def test_blame_error():
+    with pytest.raises(pysvn.NoSuchRevisionError):
+        svn.blame('hello.txt', revision=999)
+
+def test_blame_cache_local_changes():
+    path = './tests/test_svn/hello.txt'
+    with open(path, 'a') as f:
+        f.write('uncommitted\n')
+    try:
+        lines = cached.blame('hello.txt')
+        assert lines == svn.blame('hello.txt')
+        assert lines[-1].revision is None
+    finally:
+        svn.revert('hello.txt')
@@ -0,0 +1,34 @@
+import io
+import pysvn
+import pytest
+
+svn = pysvn.Client(repository_dir='./tests/test_svn')
+
+def test_cat():
+    chunks = list(svn.cat('hello.txt', chunk_size=4))
+    assert chunks and all(len(chunk) <= 4 for chunk in chunks)
+    buffer = io.BytesIO()
+    svn.cat_to('hello.txt', buffer)
+    assert b''.join(chunks) == buffer.getvalue()
+
+def test_cat_to(tmp_path):
+    buffer = io.BytesIO()
+    size = svn.cat_to('hello.txt', buffer, revision=pysvn.Revision.HEAD)
+    assert size == len(buffer.getvalue())
+    assert svn.cat_to('hello.txt', tmp_path / 'hello.txt', revision=pysvn.Revision.HEAD) == size
+
+def test_cat_many(tmp_path):
+    results = svn.cat_many(['hello.txt', 'no-such-file.txt'], str(tmp_path), revision=pysvn.Revision.HEAD)
+    assert results[0].ok and (tmp_path / 'hello.txt').stat().st_size == results[0].size
+    assert not results[1].ok and not (tmp_path / 'no-such-file.txt').exists()
+
+def test_cat_error():
+    with pytest.raises(pysvn.NoSuchRevisionError):
+        b''.join(svn.cat('hello.txt', revision=999))
+
+def test_cat_local_path():
+    import os
+    from pysvn.client import _local_path
+    assert _local_path('^/trunk/a.c') == os.path.join('trunk', 'a.c')
+    assert _local_path('https://host/repo/my%20dir/a.c') == os.path.join('repo', 'my dir', 'a.c')
+    assert _local_path('../lib/./b.so') == os.path.join('lib', 'b.so')
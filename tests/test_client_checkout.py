@@ -0,0 +1,36 @@
+import os
+import pysvn
+import pytest
+from pysvn import Depth
+
+svn = pysvn.Client(repository_dir='./tests/test_svn')
+
+def _client(tmp_path):
+    return pysvn.Client(repository_dir=str(tmp_path))
+
+def test_checkout_empty(tmp_path):
+    client = _client(tmp_path)
+    client.checkout(svn.info().url, 'wc', depth=Depth.EMPTY)
+    assert os.listdir(tmp_path / 'wc') == ['.svn']
+
+def test_export(tmp_path):
+    _client(tmp_path).export(svn.info().url, 'out')
+    assert (tmp_path / 'out' / 'hello.txt').exists()
+    assert not (tmp_path / 'out' / '.svn').exists()
+
+def test_sparse_checkout(tmp_path):
+    client = _client(tmp_path)
+    url = svn.info().url
+    client.sparse_checkout(url, 'wc', [('', Depth.FILES), ('noice', Depth.INFINITY)])
+    assert (tmp_path / 'wc' / 'hello.txt').exists() and (tmp_path / 'wc' / 'noice' / 'thing.txt').exists()
+    assert not (tmp_path / 'wc' / 'G1P2Y').exists()
+
+    # noice/Q68R9F6 is kept as it is, so there is nothing to do
+    assert client.sparse_checkout(url, 'wc', [('', Depth.FILES), ('noice', Depth.FILES),
+                                              ('noice/Q68R9F6', Depth.INFINITY)]) == []
+    with pytest.raises(ValueError):
+        client.sparse_checkout(url + '/noice', 'wc', [('', Depth.FILES)])
+
+    client.sparse_checkout(url, 'wc', [('', Depth.EMPTY), ('G1P2Y', Depth.INFINITY)])
+    assert not (tmp_path / 'wc' / 'hello.txt').exists() and not (tmp_path / 'wc' / 'noice').exists()
+    assert (tmp_path / 'wc' / 'G1P2Y' / '6UBNQDT8').exists()
@@ -27,3 +27,21 @@ def test_commit_3():
 def test_commit_4():
     output = svn.commit('Automated commit test 4', include_externals=True, depth=pysvn.Depth.IMMEDIATES)
     print(output)
+
+def test_batch_commit():
+    with open('tests/test_svn/8TN0DX', 'a') as f:
+        f.write(f'\nAutomated batch commit number {random.randint(1, 99999)}\n')
+    svn.changelist('batch', ['8TN0DX'])
+    result = svn.batch_commit('Automated batch commit', changelist='batch')
+    assert result.committed and str(result.revision) in result.output
+    assert not svn.batch_commit('Nothing to commit', ['8TN0DX']).committed
+
+def test_committed_revision():
+    from pysvn.client import _committed_revision
+    assert _committed_revision('Sending        foo.txt\nTransmitting file data .done\nCommitting transaction...\n'
+                               'Committed revision 42.\n') == 42
+    # translated, or followed by hook output
+    assert _committed_revision('Übertrage Daten .\nRevision 7 übertragen.\n') is None
+    assert _committed_revision('Committed revision 42.\n\nWarning: post-commit hook failed (exit code 1):\n'
+                               'mail sent to 3 recipients\n') == 42
+    assert _committed_revision('') is None
@@ -18,3 +18,26 @@ def test_diff_error():
 def test_diff_error_1():
     with pytest.raises(pysvn.NoSuchRevisionError):
         svn.diff(1, 999)
+
+def test_iter_diff():
+    diffs = list(svn.iter_diff(1, 3))
+    assert len(diffs) > 0
+    assert all(d.binary or d.hunks is not None for d in diffs)
+
+def test_iter_diff_error():
+    with pytest.raises(pysvn.NoSuchRevisionError):
+        list(svn.iter_diff(1, 999))
+
+def test_numstat():
+    stats = svn.numstat(1, 3)
+    assert len(stats) > 0
+    assert all(s.binary or s.added + s.removed >= 0 for s in stats)
+
+def test_diff_does_not_update():
+    before = svn.info().revision
+    svn.diff(1, 3)
+    assert svn.info().revision == before
+
+def test_diff_update():
+    diff = svn.diff(1, 3, update=True)
+    assert len(diff.paths) > 0
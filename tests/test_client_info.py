@@ -0,0 +1,16 @@
+import pysvn
+import pytest
+
+svn = pysvn.Client(repository_dir='./tests/test_svn')
+
+def test_info():
+    info = svn.info()
+    assert info.uuid and info.url.startswith(info.repository_root)
+
+def test_info_file():
+    info = svn.info('hello.txt')
+    assert info.kind == 'file'
+
+def test_info_head():
+    info = svn.info(svn.info().repository_root, revision=pysvn.Revision.HEAD)
+    assert info.revision > 0
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+import io
 import pysvn
 import pytest
 
@@ -33,4 +35,79 @@ def test_log_revision_string_error_1():
 
 def test_log_revision_string_error_2():
     with pytest.raises(pysvn.NoSuchRevisionError):
-        svn.log(revision='1:999')
\ No newline at end of file
+        svn.log(revision='1:999')
+
+def test_iter_log():
+    logs = list(svn.iter_log())
+    assert len(logs) > 0
+
+def test_iter_log_stop_early():
+    entries = svn.iter_log()
+    first = next(entries)
+    entries.close()
+    assert first.revision > 0
+
+def test_iter_log_error():
+    with pytest.raises(pysvn.NoSuchRevisionError):
+        list(svn.iter_log(revision='1:999'))
+
+def test_log_limit():
+    logs = svn.log(limit=2)
+    assert len(logs) == 2
+
+def test_log_pages():
+    cursor = svn.log_pages(page_size=2)
+    first = cursor.next_page()
+    second = cursor.next_page()
+    assert len(first) == 2
+    assert second[0].revision < first[-1].revision
+
+def test_log_pages_resume():
+    cursor = svn.log_pages(page_size=2)
+    cursor.next_page()
+    resumed = svn.log_pages(page_size=2, after=cursor.last_revision)
+    assert resumed.next_page() == cursor.next_page()
+
+def test_log_many_files():
+    logs = svn.log(['noice/good_times.txt', 'hello.txt'])
+    assert logs['noice/good_times.txt'] == svn.log('noice/good_times.txt')
+    assert logs['hello.txt'] == svn.log('hello.txt')
+
+def test_log_many_files_limit():
+    logs = svn.log(['noice/good_times.txt', 'hello.txt'], limit=1)
+    assert all(len(entries) == 1 for entries in logs.values())
+
+def test_log_columnar():
+    batch = svn.log(columnar=True)
+    assert [row.revision for row in batch] == [entry.revision for entry in svn.log()]
+    assert batch.entries() == svn.log()
+
+def test_log_index_refresh():
+    index = pysvn.LogIndex()
+    assert index.refresh(svn) == len(svn.log())
+    assert index.refresh(svn) == 0
+
+def test_log_partitions():
+    assert svn.log(partitions=3) == svn.log()
+    assert svn.log(revision='1:HEAD', limit=2, partitions=2) == svn.log(revision='1:HEAD', limit=2)
+
+def _quiet_log(monkeypatch, *revisions):
+    xml = ''.join(f'<logentry revision="{revision}"></logentry>' for revision in revisions)
+    calls = []
+
+    @contextmanager
+    def stream(args, drain=False):
+        calls.append(args)
+        yield io.BytesIO(f'<?xml version="1.0"?><log>{xml}</log>'.encode())
+
+    monkeypatch.setattr(svn, '_stream_svn_cmd', stream)
+    return calls
+
+def test_log_partitions_empty_range(monkeypatch):
+    calls = _quiet_log(monkeypatch)
+    assert list(svn.iter_log('hello.txt', revision='5:10', partitions=4)) == []
+    assert len(calls) == 1
+
+def test_log_partitions_fewer_revisions_than_partitions(monkeypatch):
+    _quiet_log(monkeypatch, 5, 7)
+    assert svn._log_partitions('hello.txt', (5, 10), None, 4) == ['5:5', '7:7']
@@ -0,0 +1,31 @@
+import pysvn
+import pytest
+
+svn = pysvn.Client(repository_dir='./tests/test_svn', log_cache=pysvn.LogCache())
+uncached = pysvn.Client(repository_dir='./tests/test_svn')
+
+def test_log_cache():
+    assert svn.log() == uncached.log()
+
+def test_log_cache_with_file():
+    assert svn.log('noice/good_times.txt') == uncached.log('noice/good_times.txt')
+
+def test_log_cache_revision_string():
+    assert svn.log(revision='1:3') == uncached.log(revision='1:3')
+
+def test_log_cache_limit():
+    assert svn.log(limit=2) == uncached.log(limit=2)
+
+def test_log_cache_revision_int_raises_error():
+    with pytest.raises(pysvn.NoSuchRevisionError):
+        svn.log(revision=999)
+
+def test_log_cache_invalidate():
+    svn.invalidate_log_cache([1, 2])
+    assert svn.log(revision='1:3') == uncached.log(revision='1:3')
+
+def test_query_cache():
+    memoized = pysvn.Client(repository_dir='./tests/test_svn', query_cache=pysvn.QueryCache())
+    assert memoized.log(revision='1:3') == memoized.log(revision='1:3') == uncached.log(revision='1:3')
+    assert memoized.log() == memoized.log() == uncached.log()
+    assert memoized.query_cache.hits == 2 and memoized.query_cache.head_probes == 1
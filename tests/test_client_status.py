@@ -0,0 +1,22 @@
+import pysvn
+import pytest
+
+svn = pysvn.Client(repository_dir='./tests/test_svn')
+svn_cli = pysvn.Client(repository_dir='./tests/test_svn', use_wc_db=False)
+
+def test_status():
+    assert all(entry.item != 'normal' or entry.props == 'modified' for entry in svn.status(quiet=True))
+
+def test_status_modified():
+    with open('./tests/test_svn/hello.txt', 'a') as f:
+        f.write('status\n')
+    try:
+        entries = svn.status(quiet=True)
+        assert [e.item for e in entries if e.path == 'hello.txt'] == ['modified']
+        assert entries == sorted(svn_cli.status(quiet=True), key=lambda e: e.path)
+    finally:
+        svn.revert('hello.txt')
+
+def test_info_wc_db():
+    assert svn.info() == svn_cli.info()
+    assert svn.info('hello.txt') == svn_cli.info('hello.txt')
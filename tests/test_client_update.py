@@ -31,3 +31,19 @@ def test_update_9():
 def test_update_10():
     output = svn.update()
     assert 'At revision' in output
+
+def test_iter_update():
+    events = list(svn.iter_update(path='hello.txt'))
+    assert isinstance(events[-1], pysvn.UpdateRevision) and events[-1].path == 'hello.txt'
+
+def test_update_events():
+    from pysvn.client import _iter_update_events
+    lines = ["Updating 'wc':", 'U    wc/foo.c', ' U   wc/src', 'A B  wc/lock.c', '   C wc/docs', '',
+             "Fetching external item into 'wc/ext':", 'External at revision 3.', '', 'Updated to revision 9.',
+             'Summary of conflicts:', '  Tree conflicts: 1']
+    events = list(_iter_update_events(lines))
+    assert events[0] == pysvn.UpdateEvent('wc/foo.c', pysvn.UpdateAction.UPDATED, None, False, False)
+    assert events[1].action is None and events[1].property_action == pysvn.UpdateAction.UPDATED
+    assert events[2].lock_broken and events[2].action == pysvn.UpdateAction.ADDED
+    assert events[3].tree_conflict and events[3].path == 'wc/docs'
+    assert events[4:] == [pysvn.UpdateRevision(3, 'wc/ext', external=True), pysvn.UpdateRevision(9, 'wc')]
@@ -0,0 +1,42 @@
+from datetime import datetime
+import pysvn
+from pysvn.client import _LogEntryParser
+from pysvn.columnar import NO_DATE, epoch_seconds
+
+LOG_XML = b'''<?xml version="1.0" encoding="UTF-8"?>
+<log>
+<logentry revision="3"><author>bob</author><date>2022-04-27T08:30:05.000000Z</date><msg>caf\xc3\xa9</msg></logentry>
+<logentry revision="2"><author>alice</author><date>2022-04-26T10:00:00.123456Z</date><msg></msg></logentry>
+<logentry revision="1"><author>bob</author><date>2022-04-26T09:00:00.000000Z</date><msg>first</msg></logentry>
+</log>
+'''
+
+def _batch():
+    batch = pysvn.LogBatch()
+    parser = _LogEntryParser(batch.append_element)
+    parser.feed(LOG_XML)
+    parser.close()
+    return batch
+
+def test_epoch_seconds():
+    assert epoch_seconds(['1970-01-02T00:00:01.5Z', None]) == [86401, NO_DATE]
+
+def test_batch_from_xml():
+    batch = _batch()
+    assert len(batch) == 3
+    assert list(batch.revisions) == [3, 2, 1]
+    assert batch.authors == ['bob', 'alice'] and list(batch.author_ids) == [0, 1, 0]
+    assert batch[0].message == 'café' and batch[1].message is None and batch[-1].message == 'first'
+    assert batch[1].date == datetime(2022, 4, 26, 10, 0, 0)
+
+def test_batch_matches_entries():
+    entries = [pysvn.LogEntry(message='first', author=None, revision=1, date=None),
+               pysvn.LogEntry(message='second', author='bob', revision=2, date=datetime(2022, 4, 26, 10))]
+    batch = pysvn.LogBatch.from_entries(entries)
+    assert batch.entries() == entries
+    assert list(batch) == entries
+    assert list(batch.dates)[0] == NO_DATE
+
+def test_models_have_slots():
+    entry = pysvn.LogEntry(message='', author='bob', revision=1, date=None)
+    assert not hasattr(entry, '__dict__')
@@ -0,0 +1,40 @@
+import pysvn
+import pytest
+
+fleet = pysvn.Fleet(['./tests/test_svn', './tests/does_not_exist'], max_workers=2, timeout=60)
+
+def test_fleet_update():
+    results = fleet.update()
+    assert [r.path for r in results] == fleet.paths
+    assert results[0].ok and 'revision' in results[0].result
+
+def test_fleet_error_per_path():
+    results = fleet.cleanup()
+    assert results[0].ok
+    assert isinstance(results[1].error, pysvn.RepositoryDirDoesNotExistError)
+
+def test_fleet_run():
+    results = fleet.run('log', limit=1)
+    assert len(results[0].result) == 1
+
+def test_fleet_bad_operation():
+    with pytest.raises(ValueError):
+        fleet.run('_execute', ['info'])
+
+def test_client_timeout():
+    svn = pysvn.Client(repository_dir='./tests/test_svn', timeout=.001)
+    with pytest.raises(pysvn.CommandTimeoutError):
+        svn.update()
+
+def test_fleet_timeout_per_operation():
+    results = pysvn.Fleet(['./tests/test_svn'], timeout=.001).run('log')
+    assert isinstance(results[0].error, pysvn.CommandTimeoutError)
+
+def test_fleet_duplicate_paths():
+    assert pysvn.Fleet(['./tests/test_svn', './tests/test_svn']).paths == ['./tests/test_svn']
+
+def test_fleet_timeout_leaves_working_copy_unlocked():
+    results = pysvn.Fleet(['./tests/test_svn'], timeout=.001).update()
+    assert isinstance(results[0].error, pysvn.CommandTimeoutError)
+    # the update was not killed while holding the working copy lock
+    assert 'revision' in pysvn.Client(repository_dir='./tests/test_svn').update()
@@ -0,0 +1,53 @@
+from datetime import datetime
+import pysvn
+import pytest
+from pysvn import LogEntry, LogIndex, LogPath
+
+def _entry(revision, author, day, *paths):
+    return LogEntry(message=f'r{revision}', author=author, revision=revision, date=datetime(2022, 3, day),
+                    paths=[LogPath(path=path, action='M', kind='file') for path in paths])
+
+ENTRIES = [
+    _entry(1, 'alice', 1, '/trunk/core/a.c'),
+    _entry(2, 'bob', 2, '/trunk/docs/index.md'),
+    _entry(3, 'alice', 5, '/trunk/core/b.c', '/trunk/docs/core.md'),
+    _entry(4, 'alice', 20, '/branches/x/core/a.c'),
+]
+
+def _revisions(entries):
+    return [entry.revision for entry in entries]
+
+def test_query_filters():
+    index = LogIndex(reversed(ENTRIES))
+    assert _revisions(index.query()) == [4, 3, 2, 1]
+    assert _revisions(index.query(author='alice')) == [4, 3, 1]
+    assert _revisions(index.query(path='trunk/core')) == [3, 1]
+    assert _revisions(index.query(path='/trunk')) == [3, 2, 1]
+    assert _revisions(index.query(path='tags')) == []
+    assert _revisions(index.query(author='alice', since=datetime(2022, 3, 2), until=datetime(2022, 3, 20))) == [3]
+    assert _revisions(index.query(author='alice', path='trunk', start=2, end=4)) == [3]
+
+def test_append_and_replace():
+    index = LogIndex(ENTRIES[2:])
+    index.append(ENTRIES[:2])
+    assert _revisions(index) == [4, 3, 2, 1]
+    index.append([_entry(3, 'bob', 3, '/tags/1.0')])
+    assert _revisions(index.query(author='alice')) == [4, 1]
+    assert _revisions(index.query(path='trunk/docs')) == [2]
+    assert _revisions(index.query(since=datetime(2022, 3, 3), until=datetime(2022, 3, 4))) == [3]
+
+def test_path_query_needs_paths():
+    index = LogIndex([LogEntry(message='', author='alice', revision=1, date=None)])
+    assert _revisions(index.query(author='alice')) == [1]
+    with pytest.raises(ValueError):
+        index.query(path='trunk')
+
+def test_build_newest_first():
+    entries = [_entry(revision, 'alice' if revision % 2 else 'bob', 1 + revision % 28, f'/trunk/f{revision % 7}.c')
+               for revision in range(2000, 0, -1)]
+    index = LogIndex(entries)
+    assert index._revisions == list(range(1, 2001))
+    assert index._authors['bob'] == list(range(2, 2001, 2))
+    assert index._paths.children['trunk'].revisions == list(range(1, 2001))
+    assert index._dates == sorted(index._dates)
+    assert _revisions(index.query(author='bob', path='trunk/f0.c'))[:2] == [1988, 1974]
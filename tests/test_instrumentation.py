@@ -0,0 +1,47 @@
+import pysvn
+import pytest
+from pysvn import instrumentation
+
+def _event(command, elapsed, error=None):
+    return pysvn.CommandEvent(command=command, args=[command], cwd='.', phases={'spawn': .001, 'wait': elapsed - .001},
+                              elapsed=elapsed, stdout_bytes=10, error=error)
+
+def test_histogram_collector():
+    collector = pysvn.HistogramCollector()
+    for elapsed in (.002, .02, .2, 2.):
+        collector(_event('log', elapsed))
+    collector(_event('log', .02, error=pysvn.NoSuchRevisionError()))
+    stats = collector.snapshot()['log']
+    assert stats.count == 5 and stats.errors == 1 and stats.stdout_bytes == 50
+    assert sum(stats.buckets) == 5 and stats.max == 2.
+    assert collector.quantile('log', .5) == .025
+    assert collector.quantile('log', 1.) == 2.
+    assert collector.quantile('info', .5) is None
+
+def test_listener_errors_do_not_fail_commands():
+    def broken(event):
+        raise ValueError('broken')
+
+    with instrumentation.listening(broken):
+        with pytest.warns(RuntimeWarning):
+            with instrumentation.command(['info']) as event:
+                pass
+    assert event.ok and not instrumentation.enabled()
+
+def test_command_records_error():
+    events = []
+    with instrumentation.listening(events.append):
+        with pytest.raises(pysvn.NoSuchRevisionError):
+            with instrumentation.command(['log', '--revision', '99']):
+                raise pysvn.NoSuchRevisionError()
+    assert events[0].command == 'log' and isinstance(events[0].error, pysvn.NoSuchRevisionError)
+
+def test_client_events():
+    svn = pysvn.Client(repository_dir='./tests/test_svn', use_wc_db=False)
+    collector = pysvn.HistogramCollector()
+    with instrumentation.listening(collector):
+        svn.info()
+        svn.log(limit=1)
+    snapshot = collector.snapshot()
+    assert snapshot['info'].count == 1 and snapshot['log'].count == 1
+    assert snapshot['info'].phases['spawn'] > 0 and snapshot['info'].stdout_bytes > 0
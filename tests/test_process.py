@@ -0,0 +1,25 @@
+import subprocess
+import sys
+import pysvn
+import pytest
+from pysvn.process import capture_output
+
+def _run(code):
+    return subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+def test_capture_output_drains_both_streams():
+    # more than a pipe buffer on stderr while stdout is still being written
+    stdout, stderr = capture_output(_run("import sys\nfor _ in range(5000):\n"
+                                         " sys.stderr.write('e' * 99 + '\\n'); sys.stdout.write('o' * 99 + '\\n')"))
+    with stdout:
+        assert len(stdout) == 500000 and len(stderr) == 500000
+
+def test_capture_output_spills_to_disk():
+    stdout, _ = capture_output(_run("import sys; sys.stdout.write('x' * 300000)"), spill_threshold=100000)
+    with stdout:
+        assert stdout.spilled
+        assert stdout.buffer()[:3] == b'xxx' and sum(len(chunk) for chunk in stdout.chunks()) == 300000
+
+def test_capture_output_timeout():
+    with pytest.raises(pysvn.CommandTimeoutError):
+        capture_output(_run('import time; time.sleep(10)'), timeout=.2)
@@ -0,0 +1,57 @@
+import pysvn
+
+def _entries(count):
+    return [pysvn.LogEntry(message='x' * 100, author='bob', revision=r, date=None) for r in range(count)]
+
+def test_query_cache_immutable():
+    cache = pysvn.QueryCache()
+    assert cache.get('q') is None
+    cache.put('q', _entries(3))
+    result = cache.get('q')
+    result.clear()
+    assert len(cache.get('q')) == 3
+    assert (cache.hits, cache.misses) == (2, 1)
+
+def test_query_cache_head():
+    cache = pysvn.QueryCache()
+    cache.put('q', _entries(1), head=5)
+    assert cache.get('q', head=5) is not None
+    assert cache.get('q', head=6) is None and len(cache) == 0
+
+def test_query_cache_bounds():
+    cache = pysvn.QueryCache(max_entries=2)
+    for key in 'abc':
+        cache.put(key, _entries(1))
+    assert cache.get('a') is None and cache.get('c') is not None and cache.evictions == 1
+
+    cache = pysvn.QueryCache(max_bytes=20000)
+    cache.put('a', _entries(50))
+    cache.put('b', _entries(50))
+    assert cache.size <= 20000 and cache.get('a') is None and cache.get('b') is not None
+    cache.put('huge', _entries(1000))
+    assert cache.get('huge') is None
+
+def test_query_cache_head_probe_rate_limited():
+    cache = pysvn.QueryCache(head_interval=60)
+    heads = iter([7, 8])
+    assert cache.head('repo', lambda: next(heads)) == 7
+    assert cache.head('repo', lambda: next(heads)) == 7
+    assert cache.head_probes == 1
+    cache.head_interval = 0
+    assert cache.head('repo', lambda: next(heads)) == 8
+
+def test_query_cache_results_are_copies():
+    cache = pysvn.QueryCache()
+    entries = [pysvn.LogEntry(message='m', author='bob', revision=1, date=None,
+                              paths=[pysvn.LogPath(path='/trunk/a.c', action='M', kind='file')])]
+    cache.put('log', entries)
+    entries[0].message = 'changed by the caller'
+    result = cache.get('log')
+    result[0].paths[0].action = 'D'
+    assert cache.get('log') == [pysvn.LogEntry(message='m', author='bob', revision=1, date=None,
+                                               paths=[pysvn.LogPath(path='/trunk/a.c', action='M', kind='file')])]
+
+    batch = pysvn.LogBatch.from_entries(entries)
+    cache.put('batch', batch)
+    cache.get('batch').revisions[0] = 99
+    assert list(cache.get('batch').revisions) == [1]
@@ -0,0 +1,35 @@
+import pysvn
+from pysvn.retry import RetryPolicy
+import pytest
+
+def test_retry_policy_delays():
+    policy = RetryPolicy(attempts=4, base_delay=.1, max_delay=.3)
+    delays = list(policy.delays())
+    assert len(delays) == 3
+    assert .05 <= delays[0] <= .1
+    assert all(delay <= .3 for delay in delays)
+
+def test_retry_policy_retries_lock_errors():
+    calls = []
+    def locked_twice():
+        calls.append(1)
+        if len(calls) < 3:
+            raise pysvn.PreviousOperationNotFinishedError()
+        return 'done'
+    assert RetryPolicy(base_delay=0).call(locked_twice) == 'done'
+    assert len(calls) == 3
+
+def test_retry_policy_gives_up():
+    def locked():
+        raise pysvn.FileLockedError()
+    with pytest.raises(pysvn.FileLockedError):
+        RetryPolicy(attempts=2, base_delay=0).call(locked)
+
+def test_retry_policy_ignores_other_errors():
+    calls = []
+    def no_such_revision():
+        calls.append(1)
+        raise pysvn.NoSuchRevisionError()
+    with pytest.raises(pysvn.NoSuchRevisionError):
+        RetryPolicy(base_delay=0).call(no_such_revision)
+    assert len(calls) == 1
@@ -0,0 +1,62 @@
+import pytest
+from pysvn import Depth, SparseStep
+from pysvn.sparse import normalize, plan_checkout, plan_reconcile
+
+def test_normalize():
+    spec = normalize([('./src/', Depth.FILES), ('src', Depth.INFINITY), ('src/core', Depth.EMPTY),
+                      ('docs', Depth.IMMEDIATES), ('docs/api', Depth.EMPTY), ('docs/api/v1', Depth.FILES)])
+    assert spec == {'src': Depth.INFINITY, 'docs': Depth.IMMEDIATES, 'docs/api/v1': Depth.FILES}
+    with pytest.raises(ValueError):
+        normalize([('src', Depth.EXCLUDE)])
+
+def test_plan_checkout():
+    depth, steps = plan_checkout([('', Depth.FILES), ('src/core', Depth.INFINITY), ('docs', Depth.INFINITY),
+                                  ('src', Depth.FILES), ('tools/ci', Depth.INFINITY)])
+    assert depth == Depth.FILES
+    # src must be set to files before src/core is fetched, which can join docs and tools/ci
+    assert steps == [SparseStep(Depth.FILES, ['src']),
+                     SparseStep(Depth.INFINITY, ['docs', 'src/core', 'tools/ci'])]
+
+def test_plan_checkout_groups_by_depth():
+    _, steps = plan_checkout([('a', Depth.INFINITY), ('b', Depth.FILES), ('c', Depth.INFINITY), ('b/x', Depth.FILES)])
+    assert steps == [SparseStep(Depth.INFINITY, ['a', 'c']), SparseStep(Depth.FILES, ['b', 'b/x'])]
+
+FILE = ('file', Depth.INFINITY)
+WORKING_COPY = {'': ('dir', Depth.FILES), 'README': FILE,
+                'src': ('dir', Depth.INFINITY), 'src/main.c': FILE,
+                'src/core': ('dir', Depth.INFINITY), 'src/core/a.c': FILE,
+                'src/util': ('dir', Depth.INFINITY), 'src/util/u.c': FILE,
+                'docs': ('dir', Depth.INFINITY), 'docs/index.md': FILE}
+
+def test_plan_reconcile():
+    new = [('', Depth.FILES), ('src', Depth.FILES), ('src/core', Depth.INFINITY), ('tools', Depth.INFINITY)]
+    # src keeps its depth so that src/core stays, what it no longer covers is excluded
+    assert plan_reconcile(WORKING_COPY, new) == [SparseStep(Depth.EXCLUDE, ['docs', 'src/util']),
+                                                 SparseStep(Depth.INFINITY, ['tools'])]
+
+def test_plan_reconcile_unchanged():
+    assert plan_reconcile(WORKING_COPY, [('', Depth.FILES), ('src', Depth.INFINITY), ('docs', Depth.INFINITY)]) == []
+    assert plan_reconcile(WORKING_COPY, [('', Depth.FILES), ('src', Depth.FILES), ('docs', Depth.INFINITY)]) == \
+           [SparseStep(Depth.FILES, ['src'])]
+    assert plan_reconcile(WORKING_COPY, [('', Depth.FILES), ('src', Depth.IMMEDIATES), ('docs', Depth.INFINITY)]) == \
+           [SparseStep(Depth.IMMEDIATES, ['src'])]
+
+def test_plan_reconcile_narrow_root():
+    assert plan_reconcile(WORKING_COPY, [('', Depth.EMPTY), ('tools', Depth.INFINITY)]) == \
+           [SparseStep(Depth.EMPTY, ['.']), SparseStep(Depth.INFINITY, ['tools'])]
+    assert plan_reconcile(WORKING_COPY, [('src', Depth.INFINITY), ('docs', Depth.INFINITY)]) == \
+           [SparseStep(Depth.EXCLUDE, ['README'])]
+
+def test_plan_reconcile_drops_parents():
+    working_copy = {'': ('dir', Depth.EMPTY), 'src': ('dir', Depth.EMPTY), 'src/core': ('dir', Depth.INFINITY),
+                    'src/core/a.c': FILE}
+    assert plan_reconcile(working_copy, [('docs', Depth.FILES)]) == \
+           [SparseStep(Depth.EXCLUDE, ['src']), SparseStep(Depth.FILES, ['docs'])]
+
+def test_plan_reconcile_excluded():
+    working_copy = {'': ('dir', Depth.EMPTY), 'docs': ('dir', Depth.IMMEDIATES), 'docs/api': ('dir', Depth.EXCLUDE),
+                    'docs/guide': ('dir', Depth.EMPTY), 'docs/index.md': ('file', Depth.EXCLUDE)}
+    assert plan_reconcile(working_copy, [('docs', Depth.IMMEDIATES)]) == \
+           [SparseStep(Depth.EMPTY, ['docs/api', 'docs/index.md'])]
+    assert plan_reconcile(working_copy, [('docs', Depth.FILES)]) == \
+           [SparseStep(Depth.FILES, ['docs']), SparseStep(Depth.EMPTY, ['docs/index.md'])]
@@ -0,0 +1,60 @@
+from pysvn.unidiff import iter_file_diffs, iter_numstat
+
+DIFF = b'''Index: foo.txt
+===================================================================
+--- foo.txt\t(revision 1)
++++ foo.txt\t(revision 2)
+@@ -1,3 +1,4 @@
+ one
+-two
++deux
++trois
+ four
+@@ -10 +11 @@
+-Index: not a header
++--- not a header either
+\\ No newline at end of file
+Index: image.png
+===================================================================
+Cannot display: file marked as a binary type.
+svn:mime-type = application/octet-stream
+Index: bar.txt
+===================================================================
+--- bar.txt\t(nonexistent)
++++ bar.txt\t(revision 2)
+@@ -0,0 +1,2 @@
++hello
++world
+
+Property changes on: bar.txt
+___________________________________________________________________
+Added: svn:eol-style
+## -0,0 +1 ##
++native
+'''
+
+def lines():
+    return DIFF.splitlines(keepends=True)
+
+def test_iter_file_diffs():
+    diffs = list(iter_file_diffs(lines()))
+    assert [d.path for d in diffs] == ['foo.txt', 'image.png', 'bar.txt']
+    foo = diffs[0]
+    assert len(foo.hunks) == 2
+    assert (foo.hunks[0].old_start, foo.hunks[0].old_count, foo.hunks[0].new_start, foo.hunks[0].new_count) == (1, 3, 1, 4)
+    assert foo.hunks[0].lines == [' one', '-two', '+deux', '+trois', ' four']
+    assert foo.hunks[1].lines[0] == '-Index: not a header'
+    assert diffs[1].binary and not diffs[1].hunks
+    assert diffs[2].hunks[0].lines == ['+hello', '+world']
+
+def test_iter_numstat():
+    stats = list(iter_numstat(lines()))
+    assert [(s.path, s.added, s.removed, s.binary) for s in stats] == [
+        ('foo.txt', 3, 2, False),
+        ('image.png', None, None, True),
+        ('bar.txt', 2, 0, False),
+    ]
+
+def test_iter_file_diffs_lazy():
+    diffs = iter_file_diffs(iter(lines()))
+    assert next(diffs).path == 'foo.txt'
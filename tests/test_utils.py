@@ -0,0 +1,50 @@
+import pysvn
+import pytest
+
+def test_find_svn_cached():
+    assert pysvn.find_svn() is pysvn.find_svn()
+    assert pysvn.check_svn_installed() == (pysvn.find_svn() is not None)
+
+def test_svn_capabilities():
+    capabilities = pysvn.svn_capabilities()
+    assert capabilities is pysvn.svn_capabilities()
+    assert pysvn.Client(repository_dir='./tests/test_svn').capabilities == capabilities
+
+def test_capabilities_by_version():
+    assert not pysvn.SVNCapabilities((1, 8, 19)).remove_unversioned
+    assert pysvn.SVNCapabilities((1, 8, 19)).log_search
+    assert pysvn.SVNCapabilities((1, 14, 2)).adds_as_modification
+    assert pysvn.SVNCapabilities(None).vacuum_pristines
+
+def test_lazy_exports():
+    assert pysvn.LogCache.__module__ == 'pysvn.cache'
+    from pysvn import LogIndex
+    assert LogIndex is pysvn.index.LogIndex
+    assert 'AsyncClient' in dir(pysvn)
+    with pytest.raises(AttributeError):
+        pysvn.NoSuchThing
+
+def test_iter_ordered():
+    import time
+    from pysvn.utils import iter_ordered
+
+    def work(i):
+        time.sleep(.01 * (5 - i))
+        if i == 3:
+            raise ValueError(i)
+        return i * i
+
+    results = iter_ordered(work, range(5), max_workers=4)
+    assert [next(results), next(results), next(results)] == [(0, 0), (1, 1), (2, 4)]
+    with pytest.raises(ValueError):
+        next(results)
+
+def test_depth_exclude_only_for_set_depth():
+    from pysvn.client import Client
+    assert Client._update_args(set_depth=pysvn.Depth.EXCLUDE) == ['update', '--set-depth', 'exclude']
+    for args in (lambda: Client._update_args(depth=pysvn.Depth.EXCLUDE),
+                 lambda: Client._revert_args('foo.txt', depth=pysvn.Depth.EXCLUDE),
+                 lambda: Client._commit_args('message', depth=pysvn.Depth.EXCLUDE),
+                 lambda: Client._checkout_args('checkout', 'url', depth=pysvn.Depth.EXCLUDE)):
+        with pytest.raises(ValueError):
+            args()